@@ -4,6 +4,7 @@ Laboratorium 1: Zadania
 
 from src.modules.fibonacci_calculator import FibonacciCalculator
 from src.modules.integral_calculator import IntegralCalculator
+from src.modules.convergence_analyzer import ConvergenceAnalyzer
 from src.utils.menu import Menu
 
 
@@ -60,6 +61,30 @@ def main_laboratorium_1():
         lambda: IntegralCalculator().run_task8(),
         display_order=8
     )
+    menu.add_option(
+        '9',
+        'Analiza zbieżności metod (rząd zbieżności, wykres błędu od n)',
+        lambda: ConvergenceAnalyzer().run_convergence_study(),
+        display_order=9
+    )
+    menu.add_option(
+        '10',
+        'Fragment ciągu Fibonacciego liczony równolegle (konsola lub plik)',
+        lambda: FibonacciCalculator().run_task_parallel_range(),
+        display_order=10
+    )
+    menu.add_option(
+        '11',
+        'Fragment ciągu Fibonacciego w wybranym formacie (dec/hex/bin, konsola lub plik)',
+        lambda: FibonacciCalculator().run_task_write_range(),
+        display_order=11
+    )
+    menu.add_option(
+        '12',
+        'F(n) mod m dla bardzo dużego n (okres Pisano)',
+        lambda: FibonacciCalculator().run_task_modular(),
+        display_order=12
+    )
     menu.add_option(
         '0',
         'Wyjście',
@@ -0,0 +1,275 @@
+"""
+Moduł analizy zbieżności metod całkowania numerycznego
+Zawiera klasę ConvergenceAnalyzer, która wyznacza empiryczny rząd zbieżności
+i dobiera najtańszą metodę oraz n spełniające zadaną dokładność.
+"""
+
+import math
+import os
+from dataclasses import dataclass
+from typing import List, Optional
+import numpy as np
+from src.modules.integral_calculator import (
+    IntegralCalculator, CalculationMethod, METHOD_NAMES, evaluation_count
+)
+from src.validators.input_validator import InputValidator
+
+
+@dataclass
+class ConvergenceSeries:
+    """Błędy jednej metody dla jednej funkcji na siatce wartości n."""
+    method: CalculationMethod
+    func_description: str
+    n_values: List[int]
+    errors: List[float]
+    evaluations: List[int]
+    order: Optional[float]
+    constant: Optional[float]
+    roundoff_floor: float
+    
+    def n_for_tolerance(self, tolerance):
+        """
+        Szacowane najmniejsze n spełniające tolerancję: z modelu błędu C * n^(-p),
+        a gdy rzędu nie da się wyznaczyć - najmniejsze n z siatki o wystarczająco małym błędzie.
+        """
+        measured = [n for n, e in zip(self.n_values, self.errors) if e <= tolerance]
+        if self.order is not None and self.order > 0:
+            n_model = max(1, math.ceil((self.constant / tolerance) ** (1 / self.order)))
+            return min([n_model] + measured)
+        if self.exact:
+            return 1
+        return min(measured) if measured else None
+    
+    @property
+    def exact(self):
+        """Czy metoda jest dokładna dla funkcji (wszystkie błędy na poziomie zaokrągleń)."""
+        return self.order is None and all(e <= self.roundoff_floor for e in self.errors)
+
+
+class ConvergenceAnalyzer:
+    """
+    Klasa odpowiedzialna za badanie zbieżności metod całkowania (błąd od n).
+    Obliczenia wykonywane są jądrem wektorowym IntegralCalculator.compute_integral_vectorized.
+    """
+    
+    METHODS = [
+        CalculationMethod.LEFT,
+        CalculationMethod.CENTER,
+        CalculationMethod.RIGHT,
+        CalculationMethod.TRAPEZOID,
+        CalculationMethod.SIMPSON,
+        CalculationMethod.BOOLE
+    ]
+    
+    # Błędy poniżej tego progu (względem |wartości dokładnej|) to szum zaokrągleń
+    ROUNDOFF_FLOOR = 1e-12
+    
+    # Wykres zapisywany jest w katalogu laboratorium, niezależnie od katalogu roboczego
+    OUTPUT_DIR = os.path.join(os.path.dirname(__file__), '..', '..')
+    PLOT_FILE = "convergence.png"
+    
+    def __init__(self, n_min=2, n_max=100000, points=17):
+        """
+        Inicjalizacja analizatora.
+        
+        Args:
+            n_min (int): Najmniejsza liczba elementów
+            n_max (int): Największa liczba elementów
+            points (int): Liczba punktów siatki logarytmicznej
+        """
+        self.calculator = IntegralCalculator()
+        self.n_values = sorted(set(int(round(n)) for n in np.geomspace(n_min, n_max, points)))
+    
+    def get_integrands(self):
+        """
+        Zwraca funkcje z zadań laboratorium w wersji przyjmującej tablice NumPy.
+        sin(x) całkowany jest na [0, π] - na pełnym okresie [0, 2π] błędy metod
+        znoszą się i rząd zbieżności byłby niemierzalny.
+        
+        Returns:
+            list: Krotki (opis, funkcja, a, b, wartość dokładna)
+        """
+        calc = self.calculator
+        return [
+            ("f(x) = 1/2 * x", calc.function_1, 0, 2, calc._get_exact_integral_linear(0, 2)),
+            ("f(x) = sin(x)", np.sin, 0, math.pi, calc._get_exact_integral_sin(0, math.pi)),
+            ("f(x) = x² - 2x + 3", lambda x: calc.function_quadratic(x, 1, -2, 3), 0, 2,
+             calc._get_exact_integral_quadratic(0, 2, 1, -2, 3))
+        ]
+    
+    def _roundoff_floor(self, exact_value):
+        """Próg błędu, poniżej którego różnice są szumem zaokrągleń."""
+        return self.ROUNDOFF_FLOOR * max(1.0, abs(exact_value))
+    
+    def _fit_order(self, n_values, errors, exact_value):
+        """
+        Dopasowuje log(błąd) = log(C) - p * log(n) metodą najmniejszych kwadratów
+        do punktów powyżej progu zaokrągleń.
+        
+        Returns:
+            tuple: (p, C) lub (None, None), gdy punktów jest za mało
+        """
+        floor = self._roundoff_floor(exact_value)
+        points = [(n, e) for n, e in zip(n_values, errors) if e > floor]
+        if len(points) < 2:
+            return None, None
+        
+        log_n = np.log([n for n, _ in points])
+        log_e = np.log([e for _, e in points])
+        slope, intercept = np.polyfit(log_n, log_e, 1)
+        return float(-slope), float(math.exp(intercept))
+    
+    def analyze(self, func_description, func, a, b, exact_value, methods=None):
+        """
+        Wyznacza błędy na siatce n i rząd zbieżności dla każdej metody.
+        
+        Returns:
+            List[ConvergenceSeries]: Wyniki dla kolejnych metod
+        """
+        series = []
+        for method in methods or self.METHODS:
+            errors = []
+            evaluations = []
+            for n in self.n_values:
+                result = self.calculator.compute_integral_vectorized(a, b, n, func, method, exact_value)
+                errors.append(result.absolute_error)
+                evaluations.append(result.evaluations)
+            
+            order, constant = self._fit_order(self.n_values, errors, exact_value)
+            series.append(ConvergenceSeries(
+                method=method,
+                func_description=func_description,
+                n_values=list(self.n_values),
+                errors=errors,
+                evaluations=evaluations,
+                order=order,
+                constant=constant,
+                roundoff_floor=self._roundoff_floor(exact_value)
+            ))
+        return series
+    
+    def n_for_tolerance(self, series, func, a, b, exact_value, tolerance):
+        """
+        Najmniejsze n spełniające tolerancję, sprawdzone obliczeniem.
+        Oszacowanie z ConvergenceSeries jest zwiększane o 10%, dopóki błąd jest za duży.
+        
+        Returns:
+            int: Liczba elementów lub None, gdy tolerancja jest nieosiągalna
+        """
+        n = series.n_for_tolerance(tolerance)
+        limit = 10 * self.n_values[-1]
+        while n is not None and n <= limit:
+            result = self.calculator.compute_integral_vectorized(a, b, n, func, series.method, exact_value)
+            if result.absolute_error <= tolerance:
+                return n
+            n = max(n + 1, math.ceil(n * 1.1))
+        return None
+    
+    def cheapest_for_tolerance(self, series, func, a, b, exact_value, tolerance):
+        """
+        Wybiera metodę i n o najmniejszej liczbie wywołań funkcji spełniające tolerancję.
+        
+        Returns:
+            tuple: (ConvergenceSeries, n, liczba wywołań) lub None
+        """
+        best = None
+        for s in series:
+            n = self.n_for_tolerance(s, func, a, b, exact_value, tolerance)
+            if n is None:
+                continue
+            cost = evaluation_count(s.method, n)
+            if best is None or cost < best[2]:
+                best = (s, n, cost)
+        return best
+    
+    def plot(self, all_series, filename=None):
+        """
+        Rysuje wykresy błędu od n (skala log-log), jeden panel na funkcję.
+        
+        Args:
+            all_series: Serie zbieżności do narysowania
+            filename (str): Ścieżka pliku (domyślnie PLOT_FILE w OUTPUT_DIR)
+        
+        Returns:
+            str: Ścieżka do zapisanego pliku
+        """
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+        
+        descriptions = list(dict.fromkeys(s.func_description for s in all_series))
+        fig, axes = plt.subplots(1, len(descriptions), figsize=(6 * len(descriptions), 5), squeeze=False)
+        
+        for ax, description in zip(axes[0], descriptions):
+            for s in all_series:
+                if s.func_description != description:
+                    continue
+                label = METHOD_NAMES[s.method]
+                if s.order is not None:
+                    label += f" (p ≈ {s.order:.2f})"
+                errors = [max(e, np.finfo(float).tiny) for e in s.errors]
+                ax.loglog(s.n_values, errors, marker="o", markersize=3, label=label)
+            ax.set_title(description)
+            ax.set_xlabel("n")
+            ax.set_ylabel("Błąd bezwzględny")
+            ax.grid(True, which="both", alpha=0.3)
+            ax.legend(fontsize=8)
+        
+        if filename is None:
+            filename = os.path.abspath(os.path.join(self.OUTPUT_DIR, self.PLOT_FILE))
+        
+        fig.tight_layout()
+        fig.savefig(filename)
+        plt.close(fig)
+        return filename
+    
+    def run_convergence_study(self):
+        """
+        Analiza zbieżności: rząd zbieżności każdej metody dla każdej funkcji,
+        najtańsza metoda spełniająca zadaną dokładność i wykres błędu od n.
+        """
+        try:
+            tolerance = InputValidator.get_positive_float(
+                "\nPodaj wymaganą dokładność (błąd bezwzględny, np. 1e-6): ",
+                "Dokładność musi być większa od zera."
+            )
+            
+            print("=" * 80)
+            print("ANALIZA ZBIEŻNOŚCI METOD CAŁKOWANIA")
+            print("=" * 80)
+            print(f"Siatka n: {self.n_values[0]} ... {self.n_values[-1]} ({len(self.n_values)} punktów)")
+            print(f"Wymagana dokładność: {tolerance:.2e}")
+            
+            all_series = []
+            for func_description, func, a, b, exact_value in self.get_integrands():
+                series = self.analyze(func_description, func, a, b, exact_value)
+                all_series.extend(series)
+                
+                print()
+                print("=" * 80)
+                print(f"Funkcja: {func_description}, przedział [{a}, {b:.4f}]")
+                print("=" * 80)
+                print(f"\n{'Metoda':<32} {'Rząd p':<10} {'n dla tolerancji':<18} {'Wywołania f':<12}")
+                print("-" * 80)
+                for s in series:
+                    if s.order is not None:
+                        order = f"{s.order:.2f}"
+                    else:
+                        order = "dokładna" if s.exact else "-"
+                    n = self.n_for_tolerance(s, func, a, b, exact_value, tolerance)
+                    n_str = str(n) if n is not None else "-"
+                    evaluations = str(evaluation_count(s.method, n)) if n is not None else "-"
+                    print(f"{METHOD_NAMES[s.method]:<32} {order:<10} {n_str:<18} {evaluations:<12}")
+                print("-" * 80)
+                
+                best = self.cheapest_for_tolerance(series, func, a, b, exact_value, tolerance)
+                if best is not None:
+                    s, n, cost = best
+                    print(f"Najtańsza metoda: {METHOD_NAMES[s.method]}, n = {n} ({cost} wywołań f)")
+            
+            filename = self.plot(all_series)
+            print(f"\nWykres błędu od n zapisano do pliku: {filename}")
+            print()
+        
+        except Exception as e:
+            print(f"Błąd: {e}")
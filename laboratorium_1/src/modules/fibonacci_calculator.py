@@ -3,9 +3,82 @@ Moduł kalkulatora liczb Fibonacciego
 Zawiera klasę FibonacciCalculator do obliczania ciągu Fibonacciego.
 """
 
+import math
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from src.modules.fibonacci_writer import FibonacciWriter, NUMBER_FORMATS, format_number
 from src.validators.input_validator import InputValidator
 
 
+# Rozmiar bufora pliku wynikowego (zapis dużymi blokami)
+OUTPUT_FILE_BUFFERING = 1 << 20
+# Największy moduł, dla którego opłaca się redukcja okresem Pisano - rozkład na czynniki
+# dzieleniem próbnym kosztuje O(√m), a szybkie podwajanie modulo m tylko O(log n)
+PISANO_MAX_MODULUS = 10 ** 12
+
+
+def _format_fibonacci_chunk(first_index, count, offset, number_format="dec"):
+    """
+    Wygeneruj tekst wierszy "F[i] = ..." dla fragmentu [first_index, first_index + count).
+    Uruchamiana w procesie roboczym - punkt startowy wyznaczany szybkim podwajaniem.
+    
+    Args:
+        first_index (int): Pierwszy indeks fragmentu
+        count (int): Liczba elementów fragmentu
+        offset (int): Przesunięcie wartości względem etykiety (jak w display_fibonacci_range)
+        number_format (str): Format liczb: "dec", "hex" lub "bin"
+        
+    Returns:
+        str: Sformatowane wiersze fragmentu
+    """
+    prev_value, curr_value = FibonacciCalculator.fibonacci_pair(first_index + offset)
+    lines = []
+    for i in range(count):
+        lines.append(f"F[{first_index + i}] = {format_number(prev_value, number_format)}\n")
+        prev_value, curr_value = curr_value, prev_value + curr_value
+    return "".join(lines)
+
+
+def _factorize(n):
+    """
+    Rozłóż liczbę na czynniki pierwsze metodą dzielenia próbnego.
+    
+    Args:
+        n (int): Liczba do rozłożenia (n >= 1)
+        
+    Returns:
+        dict: {czynnik pierwszy: wykładnik}
+    """
+    factors = {}
+    divisor = 2
+    while divisor * divisor <= n:
+        while n % divisor == 0:
+            factors[divisor] = factors.get(divisor, 0) + 1
+            n //= divisor
+        divisor += 1 if divisor == 2 else 2
+    if n > 1:
+        factors[n] = factors.get(n, 0) + 1
+    return factors
+
+
+def _divisors(n):
+    """
+    Wyznacz posortowane rosnąco dzielniki liczby.
+    
+    Args:
+        n (int): Liczba (n >= 1)
+        
+    Returns:
+        list: Dzielniki n
+    """
+    divisors = [1]
+    for prime, exponent in _factorize(n).items():
+        divisors = [d * prime ** e for d in divisors for e in range(exponent + 1)]
+    return sorted(divisors)
+
+
 class FibonacciCalculator:
     """
     Klasa odpowiedzialna za obliczanie ciągu Fibonacciego.
@@ -13,36 +86,215 @@ class FibonacciCalculator:
     
     def __init__(self):
         """Inicjalizacja kalkulatora Fibonacciego."""
-        pass
+        # Zapamiętane okresy Pisano: {m: π(m)}
+        self.pisano_periods = {}
+    
+    @staticmethod
+    def fibonacci_pair(k):
+        """
+        Oblicz parę (F(k), F(k+1)) metodą szybkiego podwajania w O(log k) mnożeniach.
+        
+        Korzysta z tożsamości:
+            F(2m)   = F(m) * (2 * F(m+1) - F(m))
+            F(2m+1) = F(m)² + F(m+1)²
+        
+        Args:
+            k (int): Indeks w ciągu Fibonacciego (k >= 0)
+            
+        Returns:
+            tuple: (F(k), F(k+1))
+        """
+        if k < 0:
+            raise ValueError("Indeks nie może być ujemny.")
+        
+        f_m, f_m1 = 0, 1  # (F(0), F(1))
+        for bit in bin(k)[2:]:
+            f_2m = f_m * (2 * f_m1 - f_m)
+            f_2m1 = f_m * f_m + f_m1 * f_m1
+            if bit == '1':
+                f_m, f_m1 = f_2m1, f_2m + f_2m1
+            else:
+                f_m, f_m1 = f_2m, f_2m1
+        return f_m, f_m1
+    
+    @staticmethod
+    def fibonacci_mod_pair(k, m):
+        """
+        Oblicz parę (F(k) mod m, F(k+1) mod m) szybkim podwajaniem w arytmetyce modulo m.
+        Liczby pośrednie nie przekraczają m², więc koszt nie zależy od liczby cyfr F(k).
+        
+        Args:
+            k (int): Indeks w ciągu Fibonacciego (k >= 0)
+            m (int): Moduł (m >= 1)
+            
+        Returns:
+            tuple: (F(k) mod m, F(k+1) mod m)
+        """
+        if k < 0:
+            raise ValueError("Indeks nie może być ujemny.")
+        if m < 1:
+            raise ValueError("Moduł musi być większy od zera.")
+        
+        f_m, f_m1 = 0, 1 % m  # (F(0), F(1)) mod m
+        for bit in bin(k)[2:]:
+            f_2m = f_m * (2 * f_m1 - f_m) % m
+            f_2m1 = (f_m * f_m + f_m1 * f_m1) % m
+            if bit == '1':
+                f_m, f_m1 = f_2m1, (f_2m + f_2m1) % m
+            else:
+                f_m, f_m1 = f_2m, f_2m1
+        return f_m, f_m1
+    
+    def _prime_pisano_period(self, p):
+        """
+        Wyznacz okres Pisano π(p) dla liczby pierwszej p.
+        
+        π(2) = 3, π(5) = 20; dla p ≡ ±1 (mod 5) okres dzieli p - 1,
+        a dla p ≡ ±2 (mod 5) dzieli 2(p + 1) - szukany jest najmniejszy dzielnik d
+        tej liczby, dla którego (F(d), F(d+1)) ≡ (0, 1) (mod p).
+        
+        Args:
+            p (int): Liczba pierwsza
+            
+        Returns:
+            int: π(p)
+        """
+        if p == 2:
+            return 3
+        if p == 5:
+            return 20
+        bound = p - 1 if p % 5 in (1, 4) else 2 * (p + 1)
+        for d in _divisors(bound):
+            if self.fibonacci_mod_pair(d, p) == (0, 1):
+                return d
+        return bound
+    
+    def pisano_period(self, m):
+        """
+        Wyznacz okres Pisano π(m) - okres ciągu F(n) mod m (wynik jest zapamiętywany).
+        
+        Korzysta z π(m) = NWW(π(p^k)) po rozkładzie m = ∏ p^k oraz π(p^k) = p^(k-1) * π(p).
+        
+        Args:
+            m (int): Moduł (m >= 1)
+            
+        Returns:
+            int: π(m)
+        """
+        if m < 1:
+            raise ValueError("Moduł musi być większy od zera.")
+        if m not in self.pisano_periods:
+            period = 1
+            for prime, exponent in _factorize(m).items():
+                prime_power_period = prime ** (exponent - 1) * self._prime_pisano_period(prime)
+                period = period * prime_power_period // math.gcd(period, prime_power_period)
+            self.pisano_periods[m] = period
+        return self.pisano_periods[m]
+    
+    def fibonacci_mod(self, n, m, use_pisano=False):
+        """
+        Oblicz F(n) mod m bez wyznaczania pełnej wartości F(n).
+        
+        Args:
+            n (int): Indeks w ciągu Fibonacciego (n >= 0, może być dowolnie duży)
+            m (int): Moduł (m >= 1)
+            use_pisano (bool): Czy zredukować n modulo okres Pisano π(m)
+                (pomijane dla m > PISANO_MAX_MODULUS)
+            
+        Returns:
+            int: F(n) mod m
+        """
+        if n < 0:
+            raise ValueError("Indeks nie może być ujemny.")
+        if use_pisano and m <= PISANO_MAX_MODULUS:
+            n %= self.pisano_period(m)
+        return self.fibonacci_mod_pair(n, m)[0]
+    
+    def fibonacci_mod_batch(self, queries, use_pisano=False):
+        """
+        Oblicz F(n) mod m dla wielu par (n, m); okresy Pisano liczone są raz na moduł.
+        
+        Args:
+            queries (iterable): Pary (n, m)
+            use_pisano (bool): Czy redukować indeksy modulo okres Pisano
+            
+        Returns:
+            list: Wartości F(n) mod m w kolejności zapytań
+        """
+        return [self.fibonacci_mod(n, m, use_pisano) for n, m in queries]
     
-    def display_fibonacci_range(self, start_index, count):
+    def display_fibonacci_range(self, start_index, count, out=None, number_format="dec"):
         """
         Wyświetl ciąg Fibonacciego zaczynając od start_index dla count elementów.
+        Wiersze zapisywane są zbiorczo przez FibonacciWriter, a duże liczby konwertowane
+        szybką metodą "dziel i zwyciężaj" (bez limitu cyfr str(int)).
         
         Args:
             start_index (int): Indeks początkowy w ciągu Fibonacciego
             count (int): Liczba elementów do wyświetlenia
+            out (file, optional): Strumień wyjściowy (domyślnie sys.stdout)
+            number_format (str): Format liczb: "dec", "hex" lub "bin"
+        """
+        # Przejdź do start_index (poprzednia i aktualna liczba) w O(log start_index)
+        prev_value, curr_value = self.fibonacci_pair(start_index)
+        
+        with FibonacciWriter(out, number_format) as writer:
+            writer.write("Ciąg Fibonacciego:\n")
+            for i in range(count):
+                index = start_index + i
+                
+                if index == 0:
+                    writer.write_term(0, 0)
+                    prev_value, curr_value = 0, 1
+                elif index == 1:
+                    writer.write_term(1, 1)
+                    prev_value, curr_value = 1, 1
+                else:
+                    writer.write_term(index, curr_value)
+                    prev_value, curr_value = curr_value, prev_value + curr_value
+    
+    def stream_fibonacci_range_parallel(self, start_index, count, out=None, chunk_size=1000,
+                                        workers=None, max_pending=None, number_format="dec"):
         """
-        prev_value = 0  # Poprzednia liczba
-        curr_value = 1  # Aktualna liczba
+        Wygeneruj fragment ciągu w procesach roboczych i zapisz go w kolejności do strumienia.
         
-        # Przejdź do start_index
-        for i in range(start_index):
-            prev_value, curr_value = curr_value, prev_value + curr_value
+        Zakres dzielony jest na fragmenty po chunk_size elementów; każdy fragment startuje
+        od szybkiego podwajania, więc procesy nie zależą od siebie. Gotowe fragmenty czekają
+        w buforze (kolejka zadań w kolejności zlecenia) na zapisanie poprzednich - w pamięci
+        jest najwyżej max_pending fragmentów. Wynik jest taki sam jak z display_fibonacci_range.
         
-        print("Ciąg Fibonacciego:")
-        for i in range(count):
-            index = start_index + i
-            
-            if index == 0:
-                print(f"F[0] = 0")
-                prev_value, curr_value = 0, 1
-            elif index == 1:
-                print(f"F[1] = 1")
-                prev_value, curr_value = 1, 1
-            else:
-                print(f"F[{index}] = {curr_value}")
-                prev_value, curr_value = curr_value, prev_value + curr_value
+        Args:
+            start_index (int): Indeks początkowy w ciągu Fibonacciego
+            count (int): Liczba elementów do wygenerowania
+            out (file, optional): Strumień wyjściowy (domyślnie sys.stdout)
+            chunk_size (int): Liczba elementów w jednym fragmencie
+            workers (int, optional): Liczba procesów (domyślnie liczba rdzeni)
+            max_pending (int, optional): Rozmiar bufora fragmentów (domyślnie 2 * workers)
+            number_format (str): Format liczb: "dec", "hex" lub "bin"
+        """
+        if start_index < 0 or count <= 0 or chunk_size <= 0:
+            raise ValueError("Nieprawidłowy zakres lub rozmiar fragmentu.")
+        if number_format not in NUMBER_FORMATS:
+            raise ValueError(f"Nieznany format liczb: {number_format}")
+        
+        out = out if out is not None else sys.stdout
+        workers = workers or os.cpu_count() or 1
+        max_pending = max_pending or 2 * workers
+        # display_fibonacci_range dla start_index >= 2 wypisuje pod F[i] wartość F(i+1)
+        offset = 1 if start_index >= 2 else 0
+        end_index = start_index + count
+        
+        out.write("Ciąg Fibonacciego:\n")
+        pending = deque()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for first_index in range(start_index, end_index, chunk_size):
+                size = min(chunk_size, end_index - first_index)
+                pending.append(executor.submit(_format_fibonacci_chunk, first_index, size, offset, number_format))
+                if len(pending) >= max_pending:
+                    out.write(pending.popleft().result())
+            while pending:
+                out.write(pending.popleft().result())
+        out.flush()
     
     def run_task1(self):
         """
@@ -78,3 +330,93 @@ class FibonacciCalculator:
             
         except Exception as e:
             print(f"Błąd: {e}")
+    
+    def _ask_output_options(self):
+        """
+        Pobierz format liczb i nazwę pliku wynikowego.
+        
+        Returns:
+            tuple: (number_format, filename) - pusta nazwa pliku oznacza konsolę
+        """
+        print("Format liczb: 1 - dziesiętny, 2 - szesnastkowy, 3 - binarny")
+        choice = InputValidator.get_integer_in_range("Wybierz format (1-3): ", 1, 3)
+        number_format = NUMBER_FORMATS[choice - 1]
+        filename = input("Podaj nazwę pliku wynikowego (Enter - konsola): ").strip()
+        return number_format, filename
+    
+    def run_task_write_range(self):
+        """
+        Wyświetl lub zapisz do pliku fragment ciągu w wybranym formacie (zapis buforowany).
+        """
+        try:
+            start_index = InputValidator.get_non_negative_integer(
+                "\nPodaj indeks początkowy (L1): ",
+                "Indeks początkowy nie może być ujemny."
+            )
+            count = InputValidator.get_positive_integer(
+                "Podaj liczbę elementów do wyświetlenia (L2): ",
+                "Liczba elementów musi być większa od zera."
+            )
+            number_format, filename = self._ask_output_options()
+            
+            if filename:
+                with open(filename, "w", encoding="utf-8", buffering=OUTPUT_FILE_BUFFERING) as f:
+                    self.display_fibonacci_range(start_index, count, out=f, number_format=number_format)
+                print(f"Zapisano {count} elementów do pliku: {filename}")
+            else:
+                self.display_fibonacci_range(start_index, count, number_format=number_format)
+            
+        except Exception as e:
+            print(f"Błąd: {e}")
+    
+    def run_task_parallel_range(self):
+        """
+        Wyświetl lub zapisz do pliku duży fragment ciągu liczony równolegle w procesach.
+        """
+        try:
+            start_index = InputValidator.get_non_negative_integer(
+                "\nPodaj indeks początkowy (L1): ",
+                "Indeks początkowy nie może być ujemny."
+            )
+            count = InputValidator.get_positive_integer(
+                "Podaj liczbę elementów do wyświetlenia (L2): ",
+                "Liczba elementów musi być większa od zera."
+            )
+            number_format, filename = self._ask_output_options()
+            
+            if filename:
+                with open(filename, "w", encoding="utf-8", buffering=OUTPUT_FILE_BUFFERING) as f:
+                    self.stream_fibonacci_range_parallel(start_index, count, out=f,
+                                                         number_format=number_format)
+                print(f"Zapisano {count} elementów do pliku: {filename}")
+            else:
+                self.stream_fibonacci_range_parallel(start_index, count, number_format=number_format)
+            
+        except Exception as e:
+            print(f"Błąd: {e}")
+    
+    def run_task_modular(self):
+        """
+        Oblicz F(n) mod m dla bardzo dużego n (szybkie podwajanie modulo m i okres Pisano).
+        """
+        try:
+            n = InputValidator.get_non_negative_integer(
+                "\nPodaj indeks n: ",
+                "Indeks nie może być ujemny."
+            )
+            m = InputValidator.get_positive_integer(
+                "Podaj moduł m: ",
+                "Moduł musi być większy od zera."
+            )
+            use_pisano = InputValidator.get_yes_no("Użyć redukcji okresem Pisano? (tak/nie): ")
+            
+            result = self.fibonacci_mod(n, m, use_pisano)
+            
+            if use_pisano and m <= PISANO_MAX_MODULUS:
+                print(f"Okres Pisano π({m}) = {self.pisano_period(m)}")
+            elif use_pisano:
+                print(f"Moduł większy niż {PISANO_MAX_MODULUS} - pominięto redukcję okresem Pisano.")
+            print(f"F({n}) mod {m} = {result}")
+            
+        except Exception as e:
+            print(f"Błąd: {e}")
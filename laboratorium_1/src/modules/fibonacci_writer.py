@@ -0,0 +1,130 @@
+"""
+Moduł zapisu wyników ciągu Fibonacciego
+Zawiera szybką konwersję dużych liczb całkowitych na tekst oraz klasę FibonacciWriter
+do zbiorczego (buforowanego) zapisu wierszy na konsolę lub do pliku.
+"""
+
+import decimal
+import sys
+
+
+NUMBER_FORMATS = ("dec", "hex", "bin")
+
+# Liczby do tej liczby bitów (ok. 3000 cyfr) są konwertowane bezpośrednio przez str()
+_SMALL_INT_BITS = 10000
+
+
+def int_to_decimal_string(value):
+    """
+    Zamień liczbę całkowitą na zapis dziesiętny metodą "dziel i zwyciężaj".
+    
+    Liczba dzielona jest na połowy bitowe, a połowy składane arytmetyką modułu decimal
+    (szybkie mnożenie dużych liczb), po czym Decimal -> str działa w czasie liniowym.
+    Nie podlega limitowi sys.set_int_max_str_digits i jest wielokrotnie szybsza od str(int)
+    dla liczb o setkach tysięcy cyfr.
+    
+    Args:
+        value (int): Liczba do konwersji
+    
+    Returns:
+        str: Zapis dziesiętny liczby
+    """
+    if value < 0:
+        return "-" + int_to_decimal_string(-value)
+    if value.bit_length() <= _SMALL_INT_BITS:
+        return str(value)
+    
+    with decimal.localcontext() as ctx:
+        ctx.prec = decimal.MAX_PREC
+        ctx.Emax = decimal.MAX_EMAX
+        ctx.Emin = decimal.MIN_EMIN
+        ctx.traps[decimal.Inexact] = 1
+        powers_of_two = {}
+        
+        def power_of_two(w):
+            if w not in powers_of_two:
+                powers_of_two[w] = decimal.Decimal(2) ** w
+            return powers_of_two[w]
+        
+        def convert(n, w):
+            if w <= _SMALL_INT_BITS:
+                return decimal.Decimal(n)
+            half = w >> 1
+            high = n >> half
+            low = n - (high << half)
+            return convert(low, half) + convert(high, w - half) * power_of_two(half)
+        
+        return str(convert(value, value.bit_length()))
+
+
+def format_number(value, number_format="dec"):
+    """
+    Sformatuj liczbę w wybranym systemie.
+    
+    Args:
+        value (int): Liczba do sformatowania
+        number_format (str): "dec" (dziesiętnie), "hex" (0x...) lub "bin" (0b...)
+    
+    Returns:
+        str: Sformatowana liczba
+    """
+    if number_format == "dec":
+        return int_to_decimal_string(value)
+    if number_format == "hex":
+        return format(value, "#x")
+    if number_format == "bin":
+        return format(value, "#b")
+    raise ValueError(f"Nieznany format liczb: {number_format}")
+
+
+class FibonacciWriter:
+    """
+    Klasa odpowiedzialna za zbiorczy zapis wierszy "F[i] = ..." do strumienia.
+    Wiersze gromadzone są w buforze i zapisywane jednym wywołaniem write,
+    gdy bufor przekroczy buffer_size znaków (oraz przy flush/wyjściu z bloku with).
+    """
+    
+    def __init__(self, out=None, number_format="dec", buffer_size=1 << 20):
+        """
+        Inicjalizacja.
+        
+        Args:
+            out (file, optional): Strumień wyjściowy (domyślnie sys.stdout w chwili zapisu)
+            number_format (str): Format liczb: "dec", "hex" lub "bin"
+            buffer_size (int): Rozmiar bufora w znakach
+        """
+        if number_format not in NUMBER_FORMATS:
+            raise ValueError(f"Nieznany format liczb: {number_format}")
+        
+        self.out = out
+        self.number_format = number_format
+        self.buffer_size = buffer_size
+        self._buffer = []
+        self._buffered_chars = 0
+    
+    def write(self, text):
+        """Dodaj tekst do bufora (zapis fizyczny po przekroczeniu buffer_size)."""
+        self._buffer.append(text)
+        self._buffered_chars += len(text)
+        if self._buffered_chars >= self.buffer_size:
+            self.flush()
+    
+    def write_term(self, index, value):
+        """Dodaj wiersz "F[index] = value" w wybranym formacie."""
+        self.write(f"F[{index}] = {format_number(value, self.number_format)}\n")
+    
+    def flush(self):
+        """Zapisz zawartość bufora do strumienia."""
+        if self._buffer:
+            out = self.out if self.out is not None else sys.stdout
+            out.write("".join(self._buffer))
+            out.flush()
+            self._buffer = []
+            self._buffered_chars = 0
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.flush()
+        return False
@@ -4,7 +4,11 @@ Zawiera klasę IntegralCalculator do obliczania całek metodą prostokątów.
 """
 
 import math
+import time
+from dataclasses import dataclass
 from enum import Enum
+from typing import Optional
+import numpy as np
 from src.validators.input_validator import InputValidator
 
 
@@ -13,6 +17,219 @@ class CalculationMethod(Enum):
     LEFT = "left"
     CENTER = "center"
     RIGHT = "right"
+    TRAPEZOID = "trapezoid"
+    SIMPSON = "simpson"
+    BOOLE = "boole"
+
+
+# Położenie punktu obliczania funkcji w prostokącie (ułamek szerokości dx)
+RECTANGLE_OFFSETS = {
+    CalculationMethod.LEFT: 0.0,
+    CalculationMethod.CENTER: 0.5,
+    CalculationMethod.RIGHT: 1.0
+}
+
+# Wagi złożonych kwadratur Newtona-Cotesa dla jednego elementu: (wagi węzłów, mianownik)
+NEWTON_COTES_WEIGHTS = {
+    CalculationMethod.TRAPEZOID: ((1, 1), 2),
+    CalculationMethod.SIMPSON: ((1, 4, 1), 6),
+    CalculationMethod.BOOLE: ((7, 32, 12, 32, 7), 90)
+}
+
+METHOD_NAMES = {
+    CalculationMethod.LEFT: "prostokąty z lewym brzegiem",
+    CalculationMethod.CENTER: "prostokąty ze środkiem",
+    CalculationMethod.RIGHT: "prostokąty z prawym brzegiem",
+    CalculationMethod.TRAPEZOID: "trapezy",
+    CalculationMethod.SIMPSON: "Simpson (parabole)",
+    CalculationMethod.BOOLE: "Boole (wielomiany 4. stopnia)"
+}
+
+
+@dataclass
+class IntegrationResult:
+    """Wynik obliczenia całki bez formatowania na konsolę."""
+    method: CalculationMethod
+    a: float
+    b: float
+    n: int
+    value: float
+    exact_value: Optional[float]
+    evaluations: int
+    time_ms: float
+    
+    @property
+    def absolute_error(self) -> Optional[float]:
+        """Błąd bezwzględny (None, gdy wartość dokładna nie jest znana)."""
+        if self.exact_value is None:
+            return None
+        return abs(self.value - self.exact_value)
+    
+    @property
+    def relative_error(self) -> Optional[float]:
+        """Błąd względny w procentach (None, gdy wartość dokładna jest nieznana lub równa 0)."""
+        if self.exact_value is None or self.exact_value == 0:
+            return None
+        return self.absolute_error / abs(self.exact_value) * 100
+
+
+def evaluation_count(method, n):
+    """Liczba wywołań funkcji potrzebna metodzie dla n elementów (węzły brzegowe współdzielone)."""
+    if method in RECTANGLE_OFFSETS:
+        return n
+    if method in NEWTON_COTES_WEIGHTS:
+        return (len(NEWTON_COTES_WEIGHTS[method][0]) - 1) * n + 1
+    raise ValueError(f"Unknown calculation method: {method}")
+
+
+def element_area(method, func, x_start, dx):
+    """
+    Pole pojedynczego elementu [x_start, x_start + dx] dla wybranej metody.
+    Używane przez raportowanie - obliczenia zbiorcze idą przez IntegralCalculator.compute_integral.
+    """
+    if method in RECTANGLE_OFFSETS:
+        return func(x_start + RECTANGLE_OFFSETS[method] * dx) * dx
+    if method in NEWTON_COTES_WEIGHTS:
+        weights, denominator = NEWTON_COTES_WEIGHTS[method]
+        h = dx / (len(weights) - 1)
+        return sum(w * func(x_start + k * h) for k, w in enumerate(weights)) * dx / denominator
+    raise ValueError(f"Unknown calculation method: {method}")
+
+
+class IntegrationReporter:
+    """
+    Klasa odpowiedzialna za wyświetlanie wyników IntegrationResult na konsoli.
+    Wiersze tabeli są liczone ponownie tylko dla wyświetlanych elementów,
+    więc koszt raportu nie zależy od n.
+    """
+    
+    def __init__(self, head_rows=10):
+        """
+        Args:
+            head_rows (int): Liczba początkowych wierszy tabeli (oprócz ostatniego)
+        """
+        self.head_rows = head_rows
+    
+    def selected_rows(self, n):
+        """Zwraca indeksy elementów wyświetlanych w tabeli."""
+        rows = list(range(min(n, self.head_rows)))
+        if n > self.head_rows:
+            rows.append(n - 1)
+        return rows
+    
+    def print_header(self, a, b, n, method_description, func_description="f(x) = 1/2 * x"):
+        """
+        Wyświetl nagłówek obliczeń.
+        """
+        print(f"\nObliczanie całki funkcji {func_description} na przedziale [{a}, {b}]")
+        print(f"Metoda: {method_description}")
+        print(f"Liczba elementów: {n}")
+    
+    def print_summary(self, result):
+        """
+        Wyświetl podsumowanie obliczeń (bez błędów, gdy wartość dokładna nie jest znana).
+        """
+        print("-" * 50)
+        print(f"Całkowita suma (aproksymacja): {result.value:.6f}")
+        if result.exact_value is None:
+            print()
+            return
+        print(f"Dokładna wartość całki:        {result.exact_value:.6f}")
+        print(f"Błąd aproksymacji:             {result.absolute_error:.6f}")
+        
+        if result.relative_error is not None:
+            print(f"Błąd względny:                 {result.relative_error:.4f}%\n")
+        else:
+            print(f"Błąd względny:                 N/A (wartość dokładna = 0)\n")
+    
+    def _print_skipped(self, i, n):
+        """Wyświetl informację o pominiętych wierszach po części początkowej tabeli."""
+        if i == n - 1 and n > self.head_rows + 1:
+            print(f"... ({n - self.head_rows - 1} wierszy pominięto) ...")
+    
+    def render(self, result, func, func_description):
+        """
+        Wyświetl nagłówek, wybrane wiersze tabeli i podsumowanie dla wyniku.
+        
+        Args:
+            result (IntegrationResult): Wynik z IntegralCalculator.compute_integral
+            func (callable): Całkowana funkcja (do odtworzenia wyświetlanych wierszy)
+            func_description (str): Opis funkcji
+        """
+        a, b, n, method = result.a, result.b, result.n, result.method
+        dx = (b - a) / n
+        
+        self.print_header(a, b, n, METHOD_NAMES[method], func_description)
+        
+        if method in RECTANGLE_OFFSETS:
+            print(f"Szerokość prostokąta (dx): {dx:.4f}")
+            print("\nObliczenia dla poszczególnych prostokątów:")
+            print(f"{'Lp.':<6} {'Przedział x':<20} {'f(x)':<10} {'Pole':<10}")
+            print("-" * 50)
+        elif method == CalculationMethod.TRAPEZOID:
+            print(f"Szerokość podstawy (dx): {dx:.4f}")
+            print("\nObliczenia dla poszczególnych trapezów:")
+            print(f"{'Lp.':<6} {'Przedział x':<20} {'f(x_l), f(x_r)':<20} {'Pole':<10}")
+            print("-" * 60)
+        else:
+            print(f"Szerokość elementu (dx): {dx:.4f}")
+            print("\nObliczenia dla poszczególnych elementów:")
+            print(f"{'Lp.':<6} {'Przedział x':<20} {'Pole':<10}")
+            print("-" * 50)
+        
+        for i in self.selected_rows(n):
+            self._print_skipped(i, n)
+            x_start = a + i * dx
+            x_end = x_start + dx
+            
+            if method in RECTANGLE_OFFSETS:
+                f_x = func(x_start + RECTANGLE_OFFSETS[method] * dx)
+                print(f"{i+1:<6} [{x_start:.4f}, {x_end:.4f}] {f_x:.4f}     {f_x * dx:.6f}")
+            elif method == CalculationMethod.TRAPEZOID:
+                f_left = func(x_start)
+                f_right = func(x_end)
+                print(f"{i+1:<6} [{x_start:.4f}, {x_end:.4f}] "
+                      f"{f_left:.4f}, {f_right:.4f}   {(f_left + f_right) / 2 * dx:.6f}")
+            else:
+                print(f"{i+1:<6} [{x_start:.4f}, {x_end:.4f}] {element_area(method, func, x_start, dx):.6f}")
+        
+        self.print_summary(result)
+    
+    def render_combined(self, combined, func, func_description):
+        """
+        Wyświetl wynik wspólnego przebiegu prostokątów (środek) i trapezów.
+        
+        Args:
+            combined (dict): Wynik z IntegralCalculator.compute_combined
+            func (callable): Całkowana funkcja
+            func_description (str): Opis funkcji
+        """
+        midpoint = combined['midpoint']
+        trapezoid = combined['trapezoid']
+        simpson = combined['simpson']
+        a, b, n = simpson.a, simpson.b, simpson.n
+        dx = (b - a) / n
+        
+        self.print_header(a, b, n, "prostokąty ze środkiem + trapezy (wspólny przebieg)", func_description)
+        print(f"Szerokość elementu (dx): {dx:.4f}")
+        
+        print("\nObliczenia dla poszczególnych elementów:")
+        print(f"{'Lp.':<6} {'Przedział x':<20} {'Pole (środek)':<15} {'Pole (trapez)':<15}")
+        print("-" * 60)
+        
+        for i in self.selected_rows(n):
+            self._print_skipped(i, n)
+            x_start = a + i * dx
+            x_end = x_start + dx
+            midpoint_area = element_area(CalculationMethod.CENTER, func, x_start, dx)
+            trapezoid_area = element_area(CalculationMethod.TRAPEZOID, func, x_start, dx)
+            print(f"{i+1:<6} [{x_start:.4f}, {x_end:.4f}] {midpoint_area:<15.6f} {trapezoid_area:<15.6f}")
+        
+        print("-" * 60)
+        print(f"Prostokąty (środek):           {midpoint.value:.6f}")
+        print(f"  szacowany błąd |T - M| / 3:  {combined['error_estimate']:.6e}")
+        print(f"Trapezy:                       {trapezoid.value:.6f}")
+        self.print_summary(simpson)
 
 
 class IntegralCalculator:
@@ -20,9 +237,14 @@ class IntegralCalculator:
     Klasa odpowiedzialna za obliczanie całek numerycznych metodą prostokątów.
     """
     
-    def __init__(self):
-        """Inicjalizacja kalkulatora całek."""
-        pass
+    def __init__(self, reporter=None):
+        """
+        Inicjalizacja kalkulatora całek.
+        
+        Args:
+            reporter (IntegrationReporter, optional): Obiekt wyświetlający wyniki na konsoli
+        """
+        self.reporter = reporter if reporter is not None else IntegrationReporter()
     
     def function_1(self, x):
         """
@@ -59,109 +281,186 @@ class IntegralCalculator:
         
         return antiderivative(x_end) - antiderivative(x_start)
     
-    def _print_calculation_header(self, a, b, n, method_description, func_description="f(x) = 1/2 * x"):
+    def _sum_rectangles(self, a, b, n, method, func):
+        """Suma metodą prostokątów - n wywołań funkcji."""
+        dx = (b - a) / n
+        offset = a + RECTANGLE_OFFSETS[method] * dx
+        total = 0.0
+        for i in range(n):
+            total += func(offset + i * dx)
+        return total * dx, n
+    
+    def _sum_newton_cotes(self, a, b, n, method, func):
         """
-        Wyświetl nagłówek obliczeń.
+        Suma złożoną kwadraturą Newtona-Cotesa (trapezy, Simpson, Boole).
+        Wartość w prawym węźle elementu jest używana ponownie jako lewy węzeł następnego,
+        więc funkcja jest wywoływana (len(wagi) - 1) * n + 1 razy.
         """
-        print(f"\nObliczanie całki funkcji {func_description} na przedziale [{a}, {b}]")
-        print(f"Metoda: {method_description}")
-        print(f"Liczba elementów: {n}")
+        weights, denominator = NEWTON_COTES_WEIGHTS[method]
+        steps = len(weights) - 1
+        dx = (b - a) / n
+        h = dx / steps
+        
+        # Brzegi elementów mają łączną wagę (pierwsza + ostatnia), poza końcami przedziału
+        total = weights[0] * func(a) + weights[-1] * func(b)
+        edge_weight = weights[0] + weights[-1]
+        for i in range(n):
+            x_start = a + i * dx
+            if i > 0:
+                total += edge_weight * func(x_start)
+            for k in range(1, steps):
+                total += weights[k] * func(x_start + k * h)
+        return total * dx / denominator, steps * n + 1
     
-    def _print_calculation_summary(self, total_area, exact_value):
+    def compute_integral(self, a, b, n, func, method=CalculationMethod.TRAPEZOID, exact_value=None):
         """
-        Wyświetl podsumowanie obliczeń.
+        Oblicz całkę bez wypisywania czegokolwiek na konsolę.
+        
+        Args:
+            a (float): Początek przedziału
+            b (float): Koniec przedziału
+            n (int): Liczba elementów
+            func (callable): Funkcja do całkowania
+            method (CalculationMethod): Metoda aproksymacji
+            exact_value (float, optional): Wartość dokładna do wyznaczenia błędów
+            
+        Returns:
+            IntegrationResult: Wartość, błędy, liczba wywołań funkcji i czas obliczeń
         """
-        print("-" * 50)
-        print(f"Całkowita suma (aproksymacja): {total_area:.6f}")
-        print(f"Dokładna wartość całki:        {exact_value:.6f}")
-        print(f"Błąd aproksymacji:             {abs(total_area - exact_value):.6f}")
+        if n <= 0:
+            raise ValueError("Liczba elementów musi być większa od zera.")
         
-        if exact_value != 0:
-            error_percent = abs(total_area - exact_value) / abs(exact_value) * 100
-            print(f"Błąd względny:                 {error_percent:.4f}%\n")
+        start_time = time.perf_counter()
+        if method in RECTANGLE_OFFSETS:
+            value, evaluations = self._sum_rectangles(a, b, n, method, func)
+        elif method in NEWTON_COTES_WEIGHTS:
+            value, evaluations = self._sum_newton_cotes(a, b, n, method, func)
         else:
-            print(f"Błąd względny:                 N/A (wartość dokładna = 0)\n")
+            raise ValueError(f"Unknown calculation method: {method}")
+        time_ms = (time.perf_counter() - start_time) * 1000
+        
+        return IntegrationResult(method, a, b, n, value, exact_value, evaluations, time_ms)
     
-    def _calculate_integral_rectangles_generic(self, a, b, n, method, func, func_description, exact_value):
+    def compute_integral_vectorized(self, a, b, n, func, method=CalculationMethod.TRAPEZOID, exact_value=None):
         """
-        Oblicz całkę metodą prostokątów dla dowolnej funkcji.
+        Oblicz całkę jak compute_integral, ale jednym wywołaniem funkcji na tablicy NumPy.
+        Funkcja musi przyjmować tablicę (np. 0.5 * x, np.sin).
+        
+        Returns:
+            IntegrationResult: Wartość, błędy, liczba punktów i czas obliczeń
         """
         if n <= 0:
-            raise ValueError("Liczba prostokątów musi być większa od zera.")
+            raise ValueError("Liczba elementów musi być większa od zera.")
         
+        start_time = time.perf_counter()
         dx = (b - a) / n
-        total_area = 0.0
-        
-        method_names = {
-            CalculationMethod.LEFT: "prostokąty z lewym brzegiem",
-            CalculationMethod.CENTER: "prostokąty ze środkiem",
-            CalculationMethod.RIGHT: "prostokąty z prawym brzegiem"
-        }
+        if method in RECTANGLE_OFFSETS:
+            x = a + (np.arange(n) + RECTANGLE_OFFSETS[method]) * dx
+            value = float(np.sum(func(x))) * dx
+            evaluations = n
+        elif method in NEWTON_COTES_WEIGHTS:
+            weights, denominator = NEWTON_COTES_WEIGHTS[method]
+            steps = len(weights) - 1
+            evaluations = steps * n + 1
+            x = np.linspace(a, b, evaluations)
+            w = np.empty(evaluations)
+            for k in range(steps):
+                w[k::steps] = weights[k]
+            w[steps:-1:steps] = weights[0] + weights[-1]
+            w[-1] = weights[-1]
+            value = float(np.dot(w, func(x))) * dx / denominator
+        else:
+            raise ValueError(f"Unknown calculation method: {method}")
+        time_ms = (time.perf_counter() - start_time) * 1000
         
-        self._print_calculation_header(a, b, n, method_names[method], func_description)
-        print(f"Szerokość prostokąta (dx): {dx:.4f}")
+        return IntegrationResult(method, a, b, n, value, exact_value, evaluations, time_ms)
+    
+    def compute_combined(self, a, b, n, func, exact_value=None):
+        """
+        Oblicz w jednym przebiegu całkę metodą prostokątów (środek) i trapezów.
+        Wartości na brzegach elementów są współdzielone, więc funkcja jest wywoływana 2n + 1 razy.
+        Z obu wyników wyznaczana jest kombinacja Simpsona S = (2M + T) / 3
+        oraz oszacowanie błędu a posteriori |T - M| / 3 (błąd metody środka).
         
-        print("\nObliczenia dla poszczególnych prostokątów:")
-        print(f"{'Lp.':<6} {'Przedział x':<20} {'f(x)':<10} {'Pole':<10}")
-        print("-" * 50)
+        Returns:
+            dict: Klucze 'midpoint', 'trapezoid', 'simpson' (IntegrationResult) i 'error_estimate'
+        """
+        if n <= 0:
+            raise ValueError("Liczba elementów musi być większa od zera.")
         
+        start_time = time.perf_counter()
+        dx = (b - a) / n
+        midpoint_sum = 0.0
+        trapezoid_sum = (func(a) + func(b)) / 2
         for i in range(n):
             x_start = a + i * dx
-            x_end = x_start + dx
-            
-            if method == CalculationMethod.LEFT:
-                x_eval = x_start
-            elif method == CalculationMethod.CENTER:
-                x_eval = (x_start + x_end) / 2
-            elif method == CalculationMethod.RIGHT:
-                x_eval = x_end
-            else:
-                raise ValueError(f"Unknown calculation method: {method}")
-            
-            f_x = func(x_eval)
-            area = f_x * dx
-            total_area += area
-            
-            if i < 10 or i >= n - 1:
-                print(f"{i+1:<6} [{x_start:.4f}, {x_end:.4f}] {f_x:.4f}     {area:.6f}")
-            elif i == 10 and n > 11:
-                print(f"... ({n - 11} wierszy pominięto) ...")
+            if i > 0:
+                trapezoid_sum += func(x_start)
+            midpoint_sum += func(x_start + dx / 2)
+        midpoint_sum *= dx
+        trapezoid_sum *= dx
+        simpson = (2 * midpoint_sum + trapezoid_sum) / 3
+        time_ms = (time.perf_counter() - start_time) * 1000
+        
+        return {
+            'midpoint': IntegrationResult(CalculationMethod.CENTER, a, b, n, midpoint_sum,
+                                          exact_value, n, time_ms),
+            'trapezoid': IntegrationResult(CalculationMethod.TRAPEZOID, a, b, n, trapezoid_sum,
+                                           exact_value, n + 1, time_ms),
+            'simpson': IntegrationResult(CalculationMethod.SIMPSON, a, b, n, simpson,
+                                         exact_value, 2 * n + 1, time_ms),
+            'error_estimate': abs(trapezoid_sum - midpoint_sum) / 3
+        }
+    
+    def _calculate_integral_rectangles_generic(self, a, b, n, method, func, func_description, exact_value):
+        """
+        Oblicz całkę metodą prostokątów dla dowolnej funkcji.
+        """
+        if n <= 0:
+            raise ValueError("Liczba prostokątów musi być większa od zera.")
+        if method not in RECTANGLE_OFFSETS:
+            raise ValueError(f"Unknown calculation method: {method}")
         
-        self._print_calculation_summary(total_area, exact_value)
-        return total_area
+        result = self.compute_integral(a, b, n, func, method, exact_value)
+        self.reporter.render(result, func, func_description)
+        return result.value
     
     def _calculate_integral_trapezoids_generic(self, a, b, n, func, func_description, exact_value):
         if n <= 0:
             raise ValueError("Liczba trapezów musi być większa od zera.")
         
-        dx = (b - a) / n
-        total_area = 0.0
-        
-        self._print_calculation_header(a, b, n, "trapezy", func_description)
-        print(f"Szerokość podstawy (dx): {dx:.4f}")
+        result = self.compute_integral(a, b, n, func, CalculationMethod.TRAPEZOID, exact_value)
+        self.reporter.render(result, func, func_description)
+        return result.value
+    
+    def _calculate_integral_newton_cotes_generic(self, a, b, n, method, func, func_description, exact_value):
+        """
+        Oblicz całkę złożoną kwadraturą Newtona-Cotesa (Simpson, Boole) dla dowolnej funkcji.
+        """
+        if method not in (CalculationMethod.SIMPSON, CalculationMethod.BOOLE):
+            raise ValueError(f"Unknown calculation method: {method}")
         
-        print("\nObliczenia dla poszczególnych trapezów:")
-        print(f"{'Lp.':<6} {'Przedział x':<20} {'f(x_l), f(x_r)':<20} {'Pole':<10}")
-        print("-" * 60)
+        result = self.compute_integral(a, b, n, func, method, exact_value)
+        self.reporter.render(result, func, func_description)
+        return result.value
+    
+    def _calculate_integral_combined_generic(self, a, b, n, func, func_description, exact_value):
+        """
+        Oblicz wspólnym przebiegiem prostokąty (środek), trapezy i kombinację Simpsona.
         
-        for i in range(n):
-            x_start = a + i * dx
-            x_end = x_start + dx
-            
-            f_left = func(x_start)
-            f_right = func(x_end)
-            
-            area = (f_left + f_right) / 2 * dx
-            total_area += area
-            
-            if i < 10 or i >= n - 1:
-                print(f"{i+1:<6} [{x_start:.4f}, {x_end:.4f}] "
-                      f"{f_left:.4f}, {f_right:.4f}   {area:.6f}")
-            elif i == 10 and n > 11:
-                print(f"... ({n - 11} wierszy pominięto) ...")
+        Returns:
+            dict: Klucze 'midpoint', 'trapezoid', 'simpson', 'error_estimate', 'evaluations'
+        """
+        combined = self.compute_combined(a, b, n, func, exact_value)
+        self.reporter.render_combined(combined, func, func_description)
         
-        self._print_calculation_summary(total_area, exact_value)
-        return total_area
+        return {
+            'midpoint': combined['midpoint'].value,
+            'trapezoid': combined['trapezoid'].value,
+            'simpson': combined['simpson'].value,
+            'error_estimate': combined['error_estimate'],
+            'evaluations': combined['simpson'].evaluations
+        }
     
     def calculate_integral_rectangles(self, a, b, n, method=CalculationMethod.LEFT):
         """
@@ -172,6 +471,15 @@ class IntegralCalculator:
             a, b, n, method, self.function_1, "f(x) = 1/2 * x", exact_value
         )
     
+    def calculate_integral_newton_cotes(self, a, b, n, method=CalculationMethod.SIMPSON):
+        """
+        Oblicz całkę kwadraturą Newtona-Cotesa (Simpson, Boole) dla funkcji f(x) = 1/2 * x.
+        """
+        exact_value = self._get_exact_integral_linear(a, b)
+        return self._calculate_integral_newton_cotes_generic(
+            a, b, n, method, self.function_1, "f(x) = 1/2 * x", exact_value
+        )
+    
     def run_task3(self):
         """
         Zadanie 3: Oblicz numeryczną wartość całki metodą prostokątów.
@@ -404,7 +712,7 @@ class IntegralCalculator:
     def run_task7(self):
         """
         Zadanie 7: Oblicz całkę funkcji y=sin(x) na przedziale [0, 2π].
-        Porównuje wyniki dla metody prostokątów i trapezów.
+        Porównuje wyniki dla metody prostokątów, trapezów, Simpsona i Boole'a.
         """
         try:
             # Pobierz liczbę elementów od użytkownika
@@ -436,36 +744,36 @@ class IntegralCalculator:
             # Store results for comparison
             results = []
             
-            # Calculate using rectangles (center method - best for sin)
+            # Rectangles (center) and trapezoids share one sweep over the same points
             print(f"{'='*80}")
-            print(f"METODA: PROSTOKĄTY (ŚRODEK)")
+            print(f"METODA: PROSTOKĄTY (ŚRODEK) + TRAPEZY + SIMPSON")
             print(f"{'='*80}")
-            rect_result = self._calculate_integral_rectangles_generic(
-                a, b, n, CalculationMethod.CENTER, self.function_sin, "f(x) = sin(x)", exact_value
+            combined = self._calculate_integral_combined_generic(
+                a, b, n, self.function_sin, "f(x) = sin(x)", exact_value
             )
-            results.append({
-                'method': 'Prostokąty (środek)',
-                'value': rect_result,
-                'error': abs(rect_result - exact_value),
-                'error_percent': abs(rect_result - exact_value) / abs(exact_value) * 100 if exact_value != 0 else 0
-            })
             print()
             
-            # Calculate using trapezoids
             print(f"{'='*80}")
-            print(f"METODA: TRAPEZY")
+            print(f"METODA: BOOLE")
             print(f"{'='*80}")
-            trap_result = self._calculate_integral_trapezoids_generic(
-                a, b, n, self.function_sin, "f(x) = sin(x)", exact_value
+            boole_result = self._calculate_integral_newton_cotes_generic(
+                a, b, n, CalculationMethod.BOOLE, self.function_sin, "f(x) = sin(x)", exact_value
             )
-            results.append({
-                'method': 'Trapezy',
-                'value': trap_result,
-                'error': abs(trap_result - exact_value),
-                'error_percent': abs(trap_result - exact_value) / abs(exact_value) * 100 if exact_value != 0 else 0
-            })
             print()
             
+            for method_name, value in [
+                ('Prostokąty (środek)', combined['midpoint']),
+                ('Trapezy', combined['trapezoid']),
+                ('Simpson', combined['simpson']),
+                ('Boole', boole_result)
+            ]:
+                results.append({
+                    'method': method_name,
+                    'value': value,
+                    'error': abs(value - exact_value),
+                    'error_percent': abs(value - exact_value) / abs(exact_value) * 100 if exact_value != 0 else 0
+                })
+            
             # Display summary
             print("=" * 80)
             print("PODSUMOWANIE WYNIKÓW - CAŁKA sin(x)")
@@ -477,6 +785,7 @@ class IntegralCalculator:
                       f"{result['error']:<15.6f} {result['error_percent']:<15.4f}%")
             print("-" * 80)
             print(f"Dokładna wartość: {exact_value:.6f}")
+            print(f"Szacowany błąd prostokątów (środek), |T - M| / 3: {combined['error_estimate']:.6e}")
             print()
             
         except Exception as e:
@@ -536,36 +845,36 @@ class IntegralCalculator:
             # Create a lambda function with fixed coefficients
             quad_func = lambda x: self.function_quadratic(x, a_coef, b_coef, c_coef)
             
-            # Calculate using rectangles (center method)
+            # Rectangles (center) and trapezoids share one sweep over the same points
             print(f"{'='*80}")
-            print(f"METODA: PROSTOKĄTY (ŚRODEK)")
+            print(f"METODA: PROSTOKĄTY (ŚRODEK) + TRAPEZY + SIMPSON")
             print(f"{'='*80}")
-            rect_result = self._calculate_integral_rectangles_generic(
-                x_start, x_end, n, CalculationMethod.CENTER, quad_func, func_str, exact_value
+            combined = self._calculate_integral_combined_generic(
+                x_start, x_end, n, quad_func, func_str, exact_value
             )
-            results.append({
-                'method': 'Prostokąty (środek)',
-                'value': rect_result,
-                'error': abs(rect_result - exact_value),
-                'error_percent': abs(rect_result - exact_value) / abs(exact_value) * 100 if exact_value != 0 else 0
-            })
             print()
             
-            # Calculate using trapezoids
             print(f"{'='*80}")
-            print(f"METODA: TRAPEZY")
+            print(f"METODA: BOOLE")
             print(f"{'='*80}")
-            trap_result = self._calculate_integral_trapezoids_generic(
-                x_start, x_end, n, quad_func, func_str, exact_value
+            boole_result = self._calculate_integral_newton_cotes_generic(
+                x_start, x_end, n, CalculationMethod.BOOLE, quad_func, func_str, exact_value
             )
-            results.append({
-                'method': 'Trapezy',
-                'value': trap_result,
-                'error': abs(trap_result - exact_value),
-                'error_percent': abs(trap_result - exact_value) / abs(exact_value) * 100 if exact_value != 0 else 0
-            })
             print()
             
+            for method_name, value in [
+                ('Prostokąty (środek)', combined['midpoint']),
+                ('Trapezy', combined['trapezoid']),
+                ('Simpson', combined['simpson']),
+                ('Boole', boole_result)
+            ]:
+                results.append({
+                    'method': method_name,
+                    'value': value,
+                    'error': abs(value - exact_value),
+                    'error_percent': abs(value - exact_value) / abs(exact_value) * 100 if exact_value != 0 else 0
+                })
+            
             # Display summary
             print("=" * 80)
             print("PODSUMOWANIE WYNIKÓW - FUNKCJA KWADRATOWA")
@@ -577,6 +886,7 @@ class IntegralCalculator:
                       f"{result['error']:<15.6f} {result['error_percent']:<15.4f}%")
             print("-" * 80)
             print(f"Dokładna wartość: {exact_value:.6f}")
+            print(f"Szacowany błąd prostokątów (środek), |T - M| / 3: {combined['error_estimate']:.6e}")
             print()
             
         except Exception as e:
@@ -0,0 +1,56 @@
+"""
+Zestaw testów dla modułu ConvergenceAnalyzer.
+Testy obejmują wyznaczanie rzędu zbieżności i dobór metody dla zadanej dokładności.
+"""
+
+import math
+import numpy as np
+import pytest
+from src.modules.convergence_analyzer import ConvergenceAnalyzer
+from src.modules.integral_calculator import CalculationMethod
+
+
+class TestConvergenceAnalyzer:
+    """Klasa testowa dla ConvergenceAnalyzer."""
+
+    @pytest.fixture
+    def analyzer(self):
+        """Fixture z małą siatką n, żeby testy były szybkie."""
+        return ConvergenceAnalyzer(n_min=4, n_max=256, points=7)
+
+    def test_grid_is_logarithmic_and_unique(self, analyzer):
+        """Test, że siatka n jest rosnąca i obejmuje zadane krańce."""
+        assert analyzer.n_values[0] == 4
+        assert analyzer.n_values[-1] == 256
+        assert analyzer.n_values == sorted(set(analyzer.n_values))
+
+    def test_theoretical_orders(self):
+        """Test, że rzędy zbieżności odpowiadają teorii (1, 2, 2, 4, 6)."""
+        analyzer = ConvergenceAnalyzer(n_min=2, n_max=32, points=5)
+        series = analyzer.analyze("f(x) = e^x", np.exp, 0, 1, math.e - 1)
+        orders = {s.method: s.order for s in series}
+
+        assert orders[CalculationMethod.LEFT] == pytest.approx(1, abs=0.1)
+        assert orders[CalculationMethod.CENTER] == pytest.approx(2, abs=0.1)
+        assert orders[CalculationMethod.TRAPEZOID] == pytest.approx(2, abs=0.1)
+        assert orders[CalculationMethod.SIMPSON] == pytest.approx(4, abs=0.2)
+        assert orders[CalculationMethod.BOOLE] == pytest.approx(6, abs=0.2)
+
+    def test_exact_method_has_no_order(self, analyzer):
+        """Test, że metoda dokładna dla funkcji liniowej nie ma wyznaczonego rzędu."""
+        series = analyzer.analyze("f(x) = 1/2 * x", lambda x: 0.5 * x, 0, 2, 1.0,
+                                  methods=[CalculationMethod.TRAPEZOID])
+        assert series[0].order is None
+        assert series[0].exact
+        assert series[0].n_for_tolerance(1e-9) == 1
+
+    def test_cheapest_method_meets_tolerance(self, analyzer):
+        """Test, że wybrana metoda i n faktycznie spełniają tolerancję."""
+        exact = 1 - math.cos(1)
+        series = analyzer.analyze("f(x) = sin(x)", np.sin, 0, 1, exact)
+        s, n, cost = analyzer.cheapest_for_tolerance(series, np.sin, 0, 1, exact, 1e-8)
+        result = analyzer.calculator.compute_integral_vectorized(0, 1, n, np.sin, s.method, exact)
+
+        assert s.method in (CalculationMethod.SIMPSON, CalculationMethod.BOOLE)
+        assert result.absolute_error <= 1e-8
+        assert result.evaluations == cost
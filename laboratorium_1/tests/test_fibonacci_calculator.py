@@ -3,9 +3,11 @@ Zestaw testów dla modułu FibonacciCalculator.
 Testy obejmują podstawową funkcjonalność obliczania ciągu Fibonacciego.
 """
 
+import io
 import pytest
 from unittest.mock import patch, MagicMock
-from src.modules.fibonacci_calculator import FibonacciCalculator
+from src.modules.fibonacci_calculator import FibonacciCalculator, PISANO_MAX_MODULUS
+from src.modules.fibonacci_writer import FibonacciWriter, int_to_decimal_string
 
 
 class TestFibonacciCalculator:
@@ -58,6 +60,139 @@ class TestFibonacciCalculator:
         assert "F[10] = 89" in captured.out
         assert "F[11] = 144" in captured.out
 
+    def test_fibonacci_pair_small_indices(self, calculator):
+        """Test szybkiego podwajania dla początkowych indeksów."""
+        expected = [0, 1, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89]
+        for k in range(len(expected) - 1):
+            assert calculator.fibonacci_pair(k) == (expected[k], expected[k + 1])
+
+    def test_fibonacci_pair_matches_iteration(self, calculator):
+        """Test zgodności szybkiego podwajania z iteracją dla dużego indeksu."""
+        prev_value, curr_value = 0, 1
+        for _ in range(1000):
+            prev_value, curr_value = curr_value, prev_value + curr_value
+        
+        assert calculator.fibonacci_pair(1000) == (prev_value, curr_value)
+
+    def test_fibonacci_pair_negative_index(self, calculator):
+        """Test, że ujemny indeks zgłasza ValueError."""
+        with pytest.raises(ValueError):
+            calculator.fibonacci_pair(-1)
+
+    def test_display_fibonacci_range_deep_start(self, calculator, capsys):
+        """Test wyświetlania fragmentu ciągu daleko od początku."""
+        calculator.display_fibonacci_range(20000, 2)
+        captured = capsys.readouterr()
+        
+        assert f"F[{20000}] = " in captured.out
+        assert f"F[{20000 + 1}] = " in captured.out
+
+    @pytest.mark.parametrize("start_index, count", [(0, 25), (2, 30), (50, 123)])
+    def test_stream_parallel_matches_display(self, calculator, capsys, start_index, count):
+        """Test, że wersja równoległa daje ten sam wynik co display_fibonacci_range."""
+        calculator.display_fibonacci_range(start_index, count)
+        expected = capsys.readouterr().out
+        
+        out = io.StringIO()
+        calculator.stream_fibonacci_range_parallel(
+            start_index, count, out=out, chunk_size=7, workers=2, max_pending=2
+        )
+        
+        assert out.getvalue() == expected
+
+    def test_int_to_decimal_string_matches_str(self):
+        """Test, że szybka konwersja dziesiętna daje ten sam wynik co str()."""
+        value, _ = FibonacciCalculator.fibonacci_pair(15000)
+        
+        assert int_to_decimal_string(value) == str(value)
+        assert int_to_decimal_string(-value) == "-" + str(value)
+        assert int_to_decimal_string(12345) == "12345"
+
+    def test_display_fibonacci_range_beyond_str_digit_limit(self, calculator):
+        """Test, że wartości powyżej limitu cyfr str(int) są zapisywane bez błędu."""
+        out = io.StringIO()
+        calculator.display_fibonacci_range(100000, 1, out=out)
+        value, _ = FibonacciCalculator.fibonacci_pair(100001)
+        
+        assert out.getvalue().endswith(f"F[100000] = {int_to_decimal_string(value)}\n")
+
+    def test_display_fibonacci_range_hex_and_bin(self, calculator):
+        """Test formatów szesnastkowego i binarnego (wersja sekwencyjna i równoległa)."""
+        out = io.StringIO()
+        calculator.display_fibonacci_range(0, 8, out=out, number_format="hex")
+        assert "F[7] = 0xd\n" in out.getvalue()
+        
+        parallel_out = io.StringIO()
+        calculator.stream_fibonacci_range_parallel(
+            0, 8, out=parallel_out, chunk_size=3, workers=2, number_format="hex"
+        )
+        assert parallel_out.getvalue() == out.getvalue()
+        
+        out = io.StringIO()
+        calculator.display_fibonacci_range(5, 1, out=out, number_format="bin")
+        assert "F[5] = 0b1000\n" in out.getvalue()
+
+    @pytest.mark.parametrize("m, period", [(1, 1), (2, 3), (5, 20), (10, 60), (11, 10), (1000, 1500)])
+    def test_pisano_period_known_values(self, calculator, m, period):
+        """Test okresu Pisano dla znanych modułów."""
+        assert calculator.pisano_period(m) == period
+        assert calculator.pisano_periods[m] == period
+
+    def test_fibonacci_mod_matches_full_value(self, calculator):
+        """Test, że F(n) mod m zgadza się z pełną wartością (z redukcją Pisano i bez)."""
+        for n in (0, 1, 2, 10, 97, 1000, 4321):
+            full_value, _ = FibonacciCalculator.fibonacci_pair(n)
+            for m in (1, 7, 1000, 10 ** 9 + 7):
+                assert calculator.fibonacci_mod(n, m, use_pisano=True) == full_value % m
+                assert calculator.fibonacci_mod(n, m) == full_value % m
+
+    def test_fibonacci_mod_astronomical_index(self, calculator):
+        """Test F(n) mod m dla indeksu, którego pełnej wartości nie da się policzyć."""
+        n = 10 ** 100
+        
+        assert calculator.fibonacci_mod(n, 10, use_pisano=True) == calculator.fibonacci_mod(n % 60, 10)
+        assert calculator.fibonacci_mod(n, 10 ** 9 + 7, use_pisano=True) == calculator.fibonacci_mod(n, 10 ** 9 + 7)
+
+    def test_fibonacci_mod_batch(self, calculator):
+        """Test zapytań wsadowych i zapamiętywania okresów."""
+        queries = [(10, 7), (10 ** 30, 7), (15, 1000), (0, 3)]
+        
+        assert calculator.fibonacci_mod_batch(queries, use_pisano=True) == [calculator.fibonacci_mod(n, m) for n, m in queries]
+        assert set(calculator.pisano_periods) == {7, 1000, 3}
+
+    def test_fibonacci_mod_skips_pisano_for_large_modulus(self, calculator):
+        """Test, że dla modułu powyżej progu nie jest wyznaczany okres Pisano."""
+        m = PISANO_MAX_MODULUS * 10 + 1
+        
+        assert calculator.fibonacci_mod(10 ** 50, m, use_pisano=True) == calculator.fibonacci_mod(10 ** 50, m)
+        assert calculator.pisano_periods == {}
+
+    def test_fibonacci_mod_invalid_arguments(self, calculator):
+        """Test odrzucenia ujemnego indeksu i niedodatniego modułu."""
+        with pytest.raises(ValueError):
+            calculator.fibonacci_mod(-1, 10)
+        with pytest.raises(ValueError):
+            calculator.fibonacci_mod(5, 0)
+
+    def test_writer_flushes_in_batches(self):
+        """Test, że FibonacciWriter zapisuje do strumienia dopiero po zapełnieniu bufora."""
+        out = MagicMock()
+        with FibonacciWriter(out, buffer_size=25) as writer:
+            writer.write_term(1, 1)
+            writer.write_term(2, 1)
+            assert out.write.call_count == 0
+            writer.write_term(3, 2)
+            assert out.write.call_count == 1
+            writer.write_term(4, 3)
+        
+        assert out.write.call_count == 2
+        assert out.write.call_args_list[1].args[0] == "F[4] = 3\n"
+
+    def test_writer_rejects_unknown_format(self):
+        """Test odrzucenia nieznanego formatu liczb."""
+        with pytest.raises(ValueError):
+            FibonacciWriter(io.StringIO(), number_format="oct")
+
     @patch('src.validators.input_validator.InputValidator.get_positive_integer')
     def test_run_task1_valid_input(self, mock_input, calculator, capsys):
         """Test run_task1 ze ważnymi danymi."""
@@ -0,0 +1,106 @@
+"""
+Zestaw testów dla modułu IntegralCalculator.
+Testy obejmują kwadratury Newtona-Cotesa oraz wspólny przebieg prostokątów i trapezów.
+"""
+
+import math
+import pytest
+from src.modules.integral_calculator import (
+    IntegralCalculator, IntegrationReporter, IntegrationResult, CalculationMethod
+)
+
+
+class TestIntegralCalculator:
+    """Klasa testowa dla IntegralCalculator."""
+
+    @pytest.fixture
+    def calculator(self):
+        """Fixture do utworzenia instancji IntegralCalculator."""
+        return IntegralCalculator()
+
+    def test_simpson_exact_for_cubic(self, calculator, capsys):
+        """Test, że metoda Simpsona jest dokładna dla wielomianu 3. stopnia."""
+        result = calculator._calculate_integral_newton_cotes_generic(
+            0, 2, 3, CalculationMethod.SIMPSON, lambda x: x**3, "f(x) = x³", 4.0
+        )
+        assert abs(result - 4.0) < 1e-12
+
+    def test_boole_exact_for_quintic(self, calculator, capsys):
+        """Test, że metoda Boole'a jest dokładna dla wielomianu 5. stopnia."""
+        result = calculator._calculate_integral_newton_cotes_generic(
+            0, 1, 2, CalculationMethod.BOOLE, lambda x: x**5, "f(x) = x⁵", 1 / 6
+        )
+        assert abs(result - 1 / 6) < 1e-12
+
+    def test_newton_cotes_shares_endpoint_evaluations(self, calculator):
+        """Test, że sąsiednie elementy współdzielą wartości funkcji na brzegach."""
+        calls = []
+        result = calculator.compute_integral(
+            0, 1, 10, lambda x: calls.append(x) or x, CalculationMethod.BOOLE
+        )
+        assert len(calls) == 4 * 10 + 1
+        assert result.evaluations == len(calls)
+
+    def test_compute_integral_is_silent(self, calculator, capsys):
+        """Test, że compute_integral nie wypisuje niczego na konsolę."""
+        result = calculator.compute_integral(0, 2, 1000, calculator.function_1,
+                                             CalculationMethod.LEFT, exact_value=1.0)
+        captured = capsys.readouterr()
+
+        assert captured.out == ""
+        assert isinstance(result, IntegrationResult)
+        assert result.evaluations == 1000
+        assert result.absolute_error == pytest.approx(abs(result.value - 1.0))
+        assert result.relative_error == pytest.approx(result.absolute_error * 100)
+        assert result.time_ms >= 0
+
+    def test_integration_result_without_exact_value(self, calculator):
+        """Test, że błędy są None, gdy wartość dokładna nie jest znana."""
+        result = calculator.compute_integral(0, 1, 10, calculator.function_sin)
+
+        assert result.method == CalculationMethod.TRAPEZOID
+        assert result.absolute_error is None
+        assert result.relative_error is None
+
+    def test_reporter_renders_selected_rows(self, calculator, capsys):
+        """Test, że raport pokazuje tylko początkowe i ostatni wiersz tabeli."""
+        result = calculator.compute_integral(0, 2, 100, calculator.function_1,
+                                             CalculationMethod.TRAPEZOID, exact_value=1.0)
+        IntegrationReporter().render(result, calculator.function_1, "f(x) = 1/2 * x")
+        captured = capsys.readouterr()
+
+        assert "Metoda: trapezy" in captured.out
+        assert "... (89 wierszy pominięto) ..." in captured.out
+        assert "100    [1.9800, 2.0000]" in captured.out
+
+    def test_combined_matches_separate_methods(self, calculator, capsys):
+        """Test, że wspólny przebieg daje te same wyniki co osobne metody."""
+        exact = calculator._get_exact_integral_sin(0, 1)
+        combined = calculator._calculate_integral_combined_generic(
+            0, 1, 50, calculator.function_sin, "f(x) = sin(x)", exact
+        )
+        midpoint = calculator._calculate_integral_rectangles_generic(
+            0, 1, 50, CalculationMethod.CENTER, calculator.function_sin, "f(x) = sin(x)", exact
+        )
+        trapezoid = calculator._calculate_integral_trapezoids_generic(
+            0, 1, 50, calculator.function_sin, "f(x) = sin(x)", exact
+        )
+
+        assert combined['midpoint'] == pytest.approx(midpoint, abs=1e-12)
+        assert combined['trapezoid'] == pytest.approx(trapezoid, abs=1e-12)
+        assert combined['evaluations'] == 2 * 50 + 1
+
+    def test_combined_error_estimate(self, calculator, capsys):
+        """Test, że oszacowanie a posteriori ogranicza błąd wyniku Simpsona."""
+        exact = calculator._get_exact_integral_sin(0, math.pi)
+        combined = calculator._calculate_integral_combined_generic(
+            0, math.pi, 20, calculator.function_sin, "f(x) = sin(x)", exact
+        )
+
+        assert abs(combined['simpson'] - exact) < combined['error_estimate']
+        assert abs(combined['midpoint'] - exact) == pytest.approx(combined['error_estimate'], rel=0.05)
+
+    def test_combined_invalid_n(self, calculator):
+        """Test, że niedodatnia liczba elementów zgłasza ValueError."""
+        with pytest.raises(ValueError):
+            calculator._calculate_integral_combined_generic(0, 1, 0, calculator.function_sin, "f(x) = sin(x)", 0)
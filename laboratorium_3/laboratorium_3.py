@@ -47,6 +47,12 @@ def main_laboratorium_3():
         lambda: calculator.run_benchmark(),
         display_order=5
     )
+    menu.add_option(
+        '6',
+        'Oblicz całkę (automatyczny wybór: serial/wątki/procesy/NumPy)',
+        lambda: calculator.run_auto_calculation(),
+        display_order=6
+    )
     menu.add_option(
         '0',
         'Wyjście',
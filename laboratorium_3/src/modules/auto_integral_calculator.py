@@ -0,0 +1,195 @@
+"""
+Moduł automatycznego wyboru metody obliczania całek.
+Wybiera wykonanie sekwencyjne, wątki, procesy lub obliczenia wektorowe
+na podstawie dostępności GIL, kosztu wywołania funkcji, n i liczby rdzeni.
+"""
+
+import os
+import pickle
+import sys
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import List, Callable, Tuple, Optional
+
+from src.modules.parallel_integral_calculator import ParallelIntegralCalculator
+from src.modules.executor_integral_calculator import ExecutorIntegralCalculator
+from src.modules.process_integral_calculator import ProcessIntegralCalculator
+from src.modules.vectorized_integral_calculator import VectorizedIntegralCalculator, is_vectorizable
+
+
+@dataclass
+class ThreadTiming:
+    """Dane czasowe dla pojedynczego wątku."""
+    interval_id: int
+    interval_desc: str
+    start_time: float
+    end_time: float
+    duration_ms: float
+    result: Optional[float] = None
+
+
+@dataclass
+class TimingResult:
+    """Wyniki czasowe obliczeń."""
+    total_time_ms: float
+    thread_times: List[ThreadTiming]
+    results: List[float]
+
+
+class Backend(Enum):
+    """Sposób wykonania obliczeń."""
+    SERIAL = "serial"
+    THREAD = "thread"
+    PROCESS = "process"
+    VECTORIZED = "vectorized"
+
+
+def gil_enabled() -> bool:
+    """Czy interpreter działa z GIL (na wersjach bez sys._is_gil_enabled zawsze tak)."""
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return is_gil_enabled() if is_gil_enabled is not None else True
+
+
+class AutoIntegralCalculator:
+    """Kalkulator wybierający najszybszy backend dla bieżącego interpretera i obciążenia."""
+    
+    # Poniżej tego szacowanego czasu sekwencyjnego uruchamianie wątków/procesów się nie opłaca
+    SERIAL_THRESHOLD_MS = 20.0
+    # Przybliżony koszt uruchomienia puli procesów i przesłania funkcji
+    PROCESS_STARTUP_MS = 150.0
+    
+    def __init__(self, func: Callable[[float], float], n: int,
+                 cpu_count: Optional[int] = None, gil: Optional[bool] = None):
+        """
+        Inicjalizacja kalkulatora.
+        cpu_count i gil domyślnie pochodzą z bieżącego systemu i interpretera.
+        """
+        self.func = func
+        self.n = n
+        self.cpu_count = cpu_count if cpu_count is not None else (os.cpu_count() or 1)
+        self.gil = gil if gil is not None else gil_enabled()
+        self.backend: Optional[Backend] = None
+        self.reason = ""
+    
+    def measure_call_cost_ms(self, samples: int = 200) -> float:
+        """Mierzy średni czas jednego wywołania funkcji [ms]."""
+        start_time = time.perf_counter()
+        for i in range(samples):
+            self.func(i / samples)
+        return (time.perf_counter() - start_time) * 1000 / samples
+    
+    def _is_picklable(self) -> bool:
+        """Czy funkcję można przesłać do procesu roboczego."""
+        try:
+            pickle.dumps(self.func)
+            return True
+        except Exception:
+            return False
+    
+    def select_backend(self, intervals: List[Tuple[float, float, str]]) -> Backend:
+        """Wybiera backend i zapisuje uzasadnienie w self.reason."""
+        estimated_ms = self.measure_call_cost_ms() * (self.n + 1) * len(intervals)
+        vectorizable = is_vectorizable(self.func)
+        
+        if vectorizable and self.gil:
+            self.backend = Backend.VECTORIZED
+            self.reason = "funkcja działa na tablicach NumPy, interpreter z GIL"
+        elif estimated_ms < self.SERIAL_THRESHOLD_MS or self.cpu_count <= 1 or len(intervals) <= 1:
+            self.backend = Backend.SERIAL
+            self.reason = f"szacowany czas {estimated_ms:.1f} ms - narzut równoległości się nie opłaca"
+        elif not self.gil:
+            self.backend = Backend.THREAD
+            self.reason = "interpreter bez GIL (free-threaded) - wątki liczą równolegle"
+        elif estimated_ms > self.PROCESS_STARTUP_MS and self._is_picklable():
+            self.backend = Backend.PROCESS
+            self.reason = f"szacowany czas {estimated_ms:.1f} ms, GIL blokuje wątki - procesy"
+        else:
+            self.backend = Backend.SERIAL
+            self.reason = f"szacowany czas {estimated_ms:.1f} ms nie pokrywa kosztu uruchomienia procesów"
+        
+        return self.backend
+    
+    def _create_calculator(self, backend: Backend, intervals: List[Tuple[float, float, str]]):
+        """Tworzy kalkulator dla wybranego backendu (None dla sekwencyjnego)."""
+        if backend == Backend.VECTORIZED:
+            return VectorizedIntegralCalculator(self.func, self.n)
+        if backend == Backend.PROCESS:
+            return ProcessIntegralCalculator(self.func, self.n, min(len(intervals), self.cpu_count))
+        if backend == Backend.THREAD:
+            if len(intervals) <= self.cpu_count:
+                return ParallelIntegralCalculator(self.func, self.n)
+            return ExecutorIntegralCalculator(self.func, self.n)
+        return None
+    
+    def _compute_serial(self, intervals: List[Tuple[float, float, str]]) -> TimingResult:
+        """Oblicza całki kolejno w bieżącym wątku."""
+        overall_start = time.time()
+        
+        thread_timings = []
+        result_values = []
+        
+        for idx, (a, b, desc) in enumerate(intervals):
+            start_time = time.time()
+            dx = (b - a) / self.n
+            total_area = (self.func(a) + self.func(b)) / 2
+            for i in range(1, self.n):
+                total_area += self.func(a + i * dx)
+            total_area *= dx
+            end_time = time.time()
+            
+            thread_timings.append(ThreadTiming(
+                interval_id=idx,
+                interval_desc=desc,
+                start_time=start_time,
+                end_time=end_time,
+                duration_ms=(end_time - start_time) * 1000,
+                result=total_area
+            ))
+            result_values.append(total_area)
+        
+        overall_end = time.time()
+        
+        return TimingResult(
+            total_time_ms=(overall_end - overall_start) * 1000,
+            thread_times=thread_timings,
+            results=result_values
+        )
+    
+    def compute_all(self, intervals: List[Tuple[float, float, str]], silent: bool = False) -> TimingResult:
+        """Oblicza całki dla wszystkich przedziałów wybranym automatycznie backendem."""
+        backend = self.select_backend(intervals)
+        if not silent:
+            print(f"Wybrany backend: {backend.value} ({self.reason})\n")
+        
+        calculator = self._create_calculator(backend, intervals)
+        if calculator is not None:
+            timing_result = calculator.compute_all(intervals, silent=True)
+        else:
+            timing_result = self._compute_serial(intervals)
+        
+        if not silent:
+            self._display_summary(intervals, timing_result)
+        
+        return timing_result
+    
+    def _display_summary(self, intervals: List[Tuple[float, float, str]], timing: TimingResult):
+        """Wyświetla podsumowanie wyników."""
+        print("=" * 60)
+        print(f"WYNIKI (Auto: {self.backend.value})")
+        print("=" * 60)
+        print(f"Powód wyboru: {self.reason}")
+        print()
+        
+        print(f"{'Przedział':<15} {'Wartość':<18} {'Czas':<12}")
+        print("-" * 50)
+        
+        for tt in timing.thread_times:
+            idx = tt.interval_id
+            a, b, desc = intervals[idx]
+            print(f"[{a:>3},{b:>3}]       {tt.result:>14.6f}   {tt.duration_ms:>8.2f} ms")
+        
+        print("-" * 50)
+        print(f"\nCzas całkowity: {timing.total_time_ms:.2f} ms")
+        print("=" * 60)
+        print()
@@ -7,12 +7,14 @@ import time
 import os
 import sys
 from dataclasses import dataclass
-from typing import List, Callable, Tuple
+from typing import List, Callable, Tuple, Optional
 
 from src.modules.parallel_integral_calculator import ParallelIntegralCalculator
 from src.modules.executor_integral_calculator import ExecutorIntegralCalculator
 from src.modules.threadpool_integral_calculator import ThreadPoolIntegralCalculator
 from src.modules.background_worker_calculator import BackgroundWorkerCalculator
+from src.modules.process_integral_calculator import ProcessIntegralCalculator
+from src.modules.subinterpreter_integral_calculator import SubinterpreterIntegralCalculator
 
 
 @dataclass
@@ -23,6 +25,12 @@ class BenchmarkResult:
     results: List[float]
     thread_times_ms: List[float]
     is_correct: bool
+    note: Optional[str] = None
+    
+    @property
+    def overhead_ms(self) -> float:
+        """Czas poza najdłuższym wątkiem: uruchomienie, przesłanie danych, zebranie wyników."""
+        return max(0.0, self.total_time_ms - max(self.thread_times_ms, default=0.0))
 
 
 class BenchmarkRunner:
@@ -118,6 +126,31 @@ class BenchmarkRunner:
             is_correct=self._verify_results(timing.results)
         )
     
+    def run_benchmark_process(self) -> BenchmarkResult:
+        """Benchmark metody Process (ProcessPoolExecutor)."""
+        calculator = ProcessIntegralCalculator(self.func, self.n)
+        timing = calculator.compute_all(self.intervals, silent=True)
+        return BenchmarkResult(
+            method_name="Process",
+            total_time_ms=timing.total_time_ms,
+            results=timing.results,
+            thread_times_ms=[tt.duration_ms for tt in timing.thread_times],
+            is_correct=self._verify_results(timing.results)
+        )
+    
+    def run_benchmark_subinterpreter(self) -> BenchmarkResult:
+        """Benchmark metody SubInterp (sub-interpretery, awaryjnie procesy)."""
+        calculator = SubinterpreterIntegralCalculator(self.func, self.n)
+        timing = calculator.compute_all(self.intervals, silent=True)
+        return BenchmarkResult(
+            method_name="SubInterp",
+            total_time_ms=timing.total_time_ms,
+            results=timing.results,
+            thread_times_ms=[tt.duration_ms for tt in timing.thread_times],
+            is_correct=self._verify_results(timing.results),
+            note=calculator.fallback_reason
+        )
+    
     def run_all_benchmarks(self) -> List[BenchmarkResult]:
         """Uruchamia wszystkie benchmarki."""
         self._clear_screen()
@@ -137,7 +170,9 @@ class BenchmarkRunner:
             ("Thread", self.run_benchmark_thread),
             ("ThreadPool", self.run_benchmark_threadpool),
             ("TPL", self.run_benchmark_tpl),
-            ("BGWorker", self.run_benchmark_backgroundworker)
+            ("BGWorker", self.run_benchmark_backgroundworker),
+            ("Process", self.run_benchmark_process),
+            ("SubInterp", self.run_benchmark_subinterpreter)
         ]
         
         for method_name, benchmark_func in methods:
@@ -158,12 +193,18 @@ class BenchmarkRunner:
         print()
         
         # Tabela główna
-        print(f"{'Metoda':<15} {'Czas [ms]':<15} {'Poprawne':<10}")
-        print("-" * 40)
+        evaluations = (self.n + 1) * len(self.intervals)
+        print(f"{'Metoda':<15} {'Czas [ms]':<15} {'Narzut [ms]':<15} {'Mwywołań/s':<12} {'Poprawne':<10}")
+        print("-" * 70)
         for r in results:
             ok = "TAK" if r.is_correct else "NIE"
-            print(f"{r.method_name:<15} {r.total_time_ms:>10.2f}     {ok:<10}")
-        print("-" * 40)
+            throughput = evaluations / r.total_time_ms / 1000 if r.total_time_ms > 0 else 0
+            print(f"{r.method_name:<15} {r.total_time_ms:>10.2f}     {r.overhead_ms:>10.2f}     "
+                  f"{throughput:>8.3f}     {ok:<10}")
+        print("-" * 70)
+        for r in results:
+            if r.note:
+                print(f"{r.method_name}: użyto procesów ({r.note})")
         
         fastest = min(results, key=lambda x: x.total_time_ms)
         print(f"\nNajszybsza: {fastest.method_name} ({fastest.total_time_ms:.2f} ms)")
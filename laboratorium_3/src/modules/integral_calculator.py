@@ -12,6 +12,7 @@ from src.modules.executor_integral_calculator import ExecutorIntegralCalculator
 from src.modules.threadpool_integral_calculator import ThreadPoolIntegralCalculator
 from src.modules.background_worker_calculator import BackgroundWorkerCalculator
 from src.modules.benchmark_runner import BenchmarkRunner
+from src.modules.auto_integral_calculator import AutoIntegralCalculator
 
 
 class CalculationMethod(Enum):
@@ -983,6 +984,28 @@ class IntegralCalculator:
         except Exception as e:
             print(f"Błąd: {e}")
     
+    def run_auto_calculation(self):
+        """Lab 3: Obliczanie całki z automatycznym wyborem backendu."""
+        try:
+            print("=" * 60)
+            print("OBLICZANIE CAŁKI - Auto")
+            print("=" * 60)
+            
+            selected_func, func_description = self._get_function_choice()
+            intervals = self._get_default_intervals()
+            n = 10000
+            
+            print()
+            print(f"Funkcja: {func_description}")
+            print(f"Liczba trapezów: {n}")
+            print()
+            
+            calculator = AutoIntegralCalculator(selected_func, n)
+            calculator.compute_all(intervals)
+        
+        except Exception as e:
+            print(f"Błąd: {e}")
+    
     def run_benchmark(self):
         """Lab 3 - Zadanie 3: Porównanie wszystkich metod."""
         try:
@@ -0,0 +1,135 @@
+"""
+Moduł do obliczania całek metodą ProcessPoolExecutor.
+Każdy przedział liczony jest w osobnym procesie (bez ograniczenia GIL).
+"""
+
+import time
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import List, Callable, Tuple, Optional
+
+
+@dataclass
+class ThreadTiming:
+    """Dane czasowe dla pojedynczego wątku."""
+    interval_id: int
+    interval_desc: str
+    start_time: float
+    end_time: float
+    duration_ms: float
+    result: Optional[float] = None
+
+
+@dataclass
+class TimingResult:
+    """Wyniki czasowe obliczeń."""
+    total_time_ms: float
+    thread_times: List[ThreadTiming]
+    results: List[float]
+
+
+def integrate_interval(args: Tuple[int, float, float, str, int, Callable[[float], float]]) -> dict:
+    """Oblicza całkę metodą trapezów dla jednego przedziału (w procesie roboczym)."""
+    interval_id, a, b, desc, n, func = args
+    start_time = time.time()
+    
+    dx = (b - a) / n
+    total_area = (func(a) + func(b)) / 2
+    for i in range(1, n):
+        total_area += func(a + i * dx)
+    total_area *= dx
+    
+    end_time = time.time()
+    
+    return {
+        'interval_id': interval_id,
+        'description': desc,
+        'result': total_area,
+        'start_time': start_time,
+        'end_time': end_time,
+        'duration_ms': (end_time - start_time) * 1000
+    }
+
+
+class ProcessIntegralCalculator:
+    """Kalkulator używający ProcessPoolExecutor do obliczeń równoległych."""
+    
+    def __init__(self, func: Callable[[float], float], n: int, num_workers: Optional[int] = None):
+        """
+        Inicjalizacja kalkulatora.
+        Funkcja musi dać się zserializować (pickle), np. metoda obiektu lub funkcja modułu.
+        """
+        self.func = func
+        self.n = n
+        self.num_workers = num_workers
+    
+    def compute_all(self, intervals: List[Tuple[float, float, str]], silent: bool = False) -> TimingResult:
+        """Oblicza całki dla wszystkich przedziałów."""
+        if not silent:
+            print("Uruchamianie procesów...\n")
+        
+        overall_start = time.time()
+        
+        args_list = [(idx, a, b, desc, self.n, self.func) for idx, (a, b, desc) in enumerate(intervals)]
+        workers = self.num_workers or min(len(intervals), os.cpu_count() or 1)
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(integrate_interval, args_list))
+        
+        overall_end = time.time()
+        total_time_ms = (overall_end - overall_start) * 1000
+        
+        thread_timings = []
+        result_values = []
+        
+        for res in sorted(results, key=lambda x: x['interval_id']):
+            thread_timings.append(ThreadTiming(
+                interval_id=res['interval_id'],
+                interval_desc=res['description'],
+                start_time=res['start_time'],
+                end_time=res['end_time'],
+                duration_ms=res['duration_ms'],
+                result=res['result']
+            ))
+            result_values.append(res['result'])
+        
+        timing_result = TimingResult(
+            total_time_ms=total_time_ms,
+            thread_times=thread_timings,
+            results=result_values
+        )
+        
+        if not silent:
+            self._display_summary(intervals, timing_result)
+        
+        return timing_result
+    
+    def _clear_screen(self):
+        """Czyści ekran."""
+        if sys.platform == 'win32':
+            os.system('cls')
+        else:
+            os.system('clear')
+    
+    def _display_summary(self, intervals: List[Tuple[float, float, str]], timing: TimingResult):
+        """Wyświetla podsumowanie wyników."""
+        self._clear_screen()
+        print("=" * 60)
+        print("WYNIKI (Process)")
+        print("=" * 60)
+        print()
+        
+        print(f"{'Przedział':<15} {'Wartość':<18} {'Czas':<12}")
+        print("-" * 50)
+        
+        for tt in timing.thread_times:
+            idx = tt.interval_id
+            a, b, desc = intervals[idx]
+            print(f"[{a:>3},{b:>3}]       {tt.result:>14.6f}   {tt.duration_ms:>8.2f} ms")
+        
+        print("-" * 50)
+        print(f"\nCzas całkowity: {timing.total_time_ms:.2f} ms")
+        print("=" * 60)
+        print()
@@ -0,0 +1,145 @@
+"""
+Moduł do obliczania całek w sub-interpreterach (eksperymentalny).
+Każdy przedział liczony jest w osobnym sub-interpreterze z własnym GIL
+(concurrent.futures.InterpreterPoolExecutor, Python 3.14+).
+Na starszych wersjach obliczenia wykonywane są w procesach.
+"""
+
+import time
+import os
+import sys
+import concurrent.futures
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import List, Callable, Tuple, Optional
+
+from src.modules.process_integral_calculator import integrate_interval
+
+
+@dataclass
+class ThreadTiming:
+    """Dane czasowe dla pojedynczego wątku."""
+    interval_id: int
+    interval_desc: str
+    start_time: float
+    end_time: float
+    duration_ms: float
+    result: Optional[float] = None
+
+
+@dataclass
+class TimingResult:
+    """Wyniki czasowe obliczeń."""
+    total_time_ms: float
+    thread_times: List[ThreadTiming]
+    results: List[float]
+
+
+def subinterpreters_available() -> bool:
+    """Czy bieżący CPython udostępnia pulę sub-interpreterów."""
+    return hasattr(concurrent.futures, 'InterpreterPoolExecutor')
+
+
+class SubinterpreterIntegralCalculator:
+    """Kalkulator używający sub-interpreterów (lub procesów, gdy są niedostępne)."""
+    
+    def __init__(self, func: Callable[[float], float], n: int, num_workers: Optional[int] = None):
+        """
+        Inicjalizacja kalkulatora.
+        Funkcja musi dać się zserializować (pickle) i zaimportować w sub-interpreterze.
+        """
+        self.func = func
+        self.n = n
+        self.num_workers = num_workers
+        self.backend_used = ""
+        self.fallback_reason: Optional[str] = None
+    
+    def _run(self, executor_class, workers: int, args_list: list) -> list:
+        """Uruchamia obliczenia wszystkich przedziałów w podanej puli."""
+        with executor_class(max_workers=workers) as executor:
+            return list(executor.map(integrate_interval, args_list))
+    
+    def compute_all(self, intervals: List[Tuple[float, float, str]], silent: bool = False) -> TimingResult:
+        """Oblicza całki dla wszystkich przedziałów."""
+        if not silent:
+            print("Uruchamianie sub-interpreterów...\n")
+        
+        overall_start = time.time()
+        
+        args_list = [(idx, a, b, desc, self.n, self.func) for idx, (a, b, desc) in enumerate(intervals)]
+        workers = self.num_workers or min(len(intervals), os.cpu_count() or 1)
+        
+        # Stan z poprzedniego uruchomienia nie może przejść do bieżącego
+        self.backend_used = ""
+        self.fallback_reason = None
+        results = None
+        if subinterpreters_available():
+            try:
+                results = self._run(concurrent.futures.InterpreterPoolExecutor, workers, args_list)
+                self.backend_used = "subinterpreter"
+            except Exception as e:
+                self.fallback_reason = f"sub-interpreter: {e}"
+        else:
+            self.fallback_reason = f"brak InterpreterPoolExecutor w Python {sys.version_info.major}.{sys.version_info.minor}"
+        
+        if results is None:
+            results = self._run(ProcessPoolExecutor, workers, args_list)
+            self.backend_used = "process"
+        
+        overall_end = time.time()
+        total_time_ms = (overall_end - overall_start) * 1000
+        
+        thread_timings = []
+        result_values = []
+        
+        for res in sorted(results, key=lambda x: x['interval_id']):
+            thread_timings.append(ThreadTiming(
+                interval_id=res['interval_id'],
+                interval_desc=res['description'],
+                start_time=res['start_time'],
+                end_time=res['end_time'],
+                duration_ms=res['duration_ms'],
+                result=res['result']
+            ))
+            result_values.append(res['result'])
+        
+        timing_result = TimingResult(
+            total_time_ms=total_time_ms,
+            thread_times=thread_timings,
+            results=result_values
+        )
+        
+        if not silent:
+            self._display_summary(intervals, timing_result)
+        
+        return timing_result
+    
+    def _clear_screen(self):
+        """Czyści ekran."""
+        if sys.platform == 'win32':
+            os.system('cls')
+        else:
+            os.system('clear')
+    
+    def _display_summary(self, intervals: List[Tuple[float, float, str]], timing: TimingResult):
+        """Wyświetla podsumowanie wyników."""
+        self._clear_screen()
+        print("=" * 60)
+        print(f"WYNIKI (SubInterp: {self.backend_used})")
+        print("=" * 60)
+        if self.fallback_reason:
+            print(f"Użyto procesów - {self.fallback_reason}")
+        print()
+        
+        print(f"{'Przedział':<15} {'Wartość':<18} {'Czas':<12}")
+        print("-" * 50)
+        
+        for tt in timing.thread_times:
+            idx = tt.interval_id
+            a, b, desc = intervals[idx]
+            print(f"[{a:>3},{b:>3}]       {tt.result:>14.6f}   {tt.duration_ms:>8.2f} ms")
+        
+        print("-" * 50)
+        print(f"\nCzas całkowity: {timing.total_time_ms:.2f} ms")
+        print("=" * 60)
+        print()
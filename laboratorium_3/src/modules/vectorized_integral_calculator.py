@@ -0,0 +1,136 @@
+"""
+Moduł do obliczania całek metodą wektorową (NumPy).
+Wszystkie węzły przedziału liczone są jednym wywołaniem funkcji na tablicy.
+"""
+
+import time
+import os
+import sys
+from dataclasses import dataclass
+from typing import List, Callable, Tuple, Optional
+
+import numpy as np
+
+
+@dataclass
+class ThreadTiming:
+    """Dane czasowe dla pojedynczego wątku."""
+    interval_id: int
+    interval_desc: str
+    start_time: float
+    end_time: float
+    duration_ms: float
+    result: Optional[float] = None
+
+
+@dataclass
+class TimingResult:
+    """Wyniki czasowe obliczeń."""
+    total_time_ms: float
+    thread_times: List[ThreadTiming]
+    results: List[float]
+
+
+def evaluate_on_array(func: Callable[[float], float], x: np.ndarray) -> np.ndarray:
+    """
+    Oblicza wartości funkcji dla całej tablicy.
+    Funkcje nieobsługujące tablic (np. math.sin) są wywoływane element po elemencie.
+    """
+    try:
+        y = np.asarray(func(x), dtype=float)
+        if y.shape == x.shape:
+            return y
+    except (TypeError, ValueError):
+        pass
+    return np.fromiter((func(v) for v in x), dtype=float, count=len(x))
+
+
+def is_vectorizable(func: Callable[[float], float]) -> bool:
+    """Czy funkcja przyjmuje tablicę NumPy i zwraca tablicę tego samego kształtu."""
+    x = np.linspace(0.0, 1.0, 4)
+    try:
+        return np.asarray(func(x), dtype=float).shape == x.shape
+    except (TypeError, ValueError):
+        return False
+
+
+class VectorizedIntegralCalculator:
+    """Kalkulator liczący metodę trapezów na tablicach NumPy (jeden wątek)."""
+    
+    def __init__(self, func: Callable[[float], float], n: int):
+        """Inicjalizacja kalkulatora."""
+        self.func = func
+        self.n = n
+    
+    def _integrate(self, a: float, b: float) -> float:
+        """Oblicza całkę metodą trapezów dla jednego przedziału."""
+        x = np.linspace(a, b, self.n + 1)
+        y = evaluate_on_array(self.func, x)
+        dx = (b - a) / self.n
+        return float(dx * (y.sum() - (y[0] + y[-1]) / 2))
+    
+    def compute_all(self, intervals: List[Tuple[float, float, str]], silent: bool = False) -> TimingResult:
+        """Oblicza całki dla wszystkich przedziałów."""
+        if not silent:
+            print("Uruchamianie obliczeń wektorowych...\n")
+        
+        overall_start = time.time()
+        
+        thread_timings = []
+        result_values = []
+        
+        for idx, (a, b, desc) in enumerate(intervals):
+            start_time = time.time()
+            result = self._integrate(a, b)
+            end_time = time.time()
+            
+            thread_timings.append(ThreadTiming(
+                interval_id=idx,
+                interval_desc=desc,
+                start_time=start_time,
+                end_time=end_time,
+                duration_ms=(end_time - start_time) * 1000,
+                result=result
+            ))
+            result_values.append(result)
+        
+        overall_end = time.time()
+        
+        timing_result = TimingResult(
+            total_time_ms=(overall_end - overall_start) * 1000,
+            thread_times=thread_timings,
+            results=result_values
+        )
+        
+        if not silent:
+            self._display_summary(intervals, timing_result)
+        
+        return timing_result
+    
+    def _clear_screen(self):
+        """Czyści ekran."""
+        if sys.platform == 'win32':
+            os.system('cls')
+        else:
+            os.system('clear')
+    
+    def _display_summary(self, intervals: List[Tuple[float, float, str]], timing: TimingResult):
+        """Wyświetla podsumowanie wyników."""
+        self._clear_screen()
+        print("=" * 60)
+        print("WYNIKI (Vectorized)")
+        print("=" * 60)
+        print()
+        
+        print(f"{'Przedział':<15} {'Wartość':<18} {'Czas':<12}")
+        print("-" * 50)
+        
+        for tt in timing.thread_times:
+            idx = tt.interval_id
+            a, b, desc = intervals[idx]
+            print(f"[{a:>3},{b:>3}]       {tt.result:>14.6f}   {tt.duration_ms:>8.2f} ms")
+        
+        print("-" * 50)
+        print(f"\nCzas całkowity: {timing.total_time_ms:.2f} ms")
+        print("=" * 60)
+        print()
@@ -0,0 +1,52 @@
+import math
+import pytest
+from src.modules.integral_calculator import IntegralCalculator
+from src.modules.auto_integral_calculator import AutoIntegralCalculator, Backend
+
+
+INTERVALS = [
+    (-10, 10, "[-10,10]"),
+    (-5, 20, "[-5,20]"),
+    (-5, 0, "[-5,0]")
+]
+
+
+class TestAutoIntegralCalculator:
+
+    @pytest.fixture
+    def func(self):
+        return IntegralCalculator().function_task1_2
+
+    def test_vectorized_with_gil(self, func):
+        # y = 2x² działa na tablicach NumPy - przy GIL wybierany jest backend wektorowy
+        calculator = AutoIntegralCalculator(func, 1000, cpu_count=8, gil=True)
+        assert calculator.select_backend(INTERVALS) == Backend.VECTORIZED
+
+    def test_threads_without_gil(self, func, monkeypatch):
+        # Bez GIL obliczenia CPU trafiają do wątków, o ile są wystarczająco duże
+        calculator = AutoIntegralCalculator(func, 1000, cpu_count=8, gil=False)
+        monkeypatch.setattr(calculator, "measure_call_cost_ms", lambda: 1.0)
+        assert calculator.select_backend(INTERVALS) == Backend.THREAD
+
+    def test_process_for_scalar_function_with_gil(self, monkeypatch):
+        # math.sin nie działa na tablicach - duże obciążenie przy GIL trafia do procesów
+        calculator = AutoIntegralCalculator(math.sin, 1000, cpu_count=8, gil=True)
+        monkeypatch.setattr(calculator, "measure_call_cost_ms", lambda: 1.0)
+        assert calculator.select_backend(INTERVALS) == Backend.PROCESS
+
+    def test_serial_for_small_workload(self, func):
+        calculator = AutoIntegralCalculator(func, 10, cpu_count=8, gil=False)
+        assert calculator.select_backend(INTERVALS) == Backend.SERIAL
+
+    def test_serial_for_unpicklable_function(self, monkeypatch):
+        calculator = AutoIntegralCalculator(lambda x: math.sin(x), 1000, cpu_count=8, gil=True)
+        monkeypatch.setattr(calculator, "measure_call_cost_ms", lambda: 1.0)
+        assert calculator.select_backend(INTERVALS) == Backend.SERIAL
+
+    @pytest.mark.parametrize("gil", [True, False])
+    def test_results_match_reference(self, func, gil):
+        # Całka z 2x² od a do b to 2/3 * (b³ - a³)
+        calculator = AutoIntegralCalculator(func, 2000, gil=gil)
+        timing = calculator.compute_all(INTERVALS, silent=True)
+        for (a, b, _), value in zip(INTERVALS, timing.results):
+            assert abs(value - 2 / 3 * (b**3 - a**3)) < 0.1
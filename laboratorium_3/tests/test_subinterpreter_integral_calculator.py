@@ -0,0 +1,36 @@
+import pytest
+from src.modules.integral_calculator import IntegralCalculator
+from src.modules.subinterpreter_integral_calculator import (
+    SubinterpreterIntegralCalculator, subinterpreters_available
+)
+
+
+class TestSubinterpreterIntegralCalculator:
+
+    def test_compute_all_results(self):
+        # Całka z 2x - 3 od -5 do 0 wynosi x² - 3x = -25 - 15 = -40
+        calculator = SubinterpreterIntegralCalculator(IntegralCalculator().function_task1_3, 1000)
+        timing = calculator.compute_all([(-5, 0, "[-5,0]")], silent=True)
+
+        assert abs(timing.results[0] - (-40.0)) < 1e-6
+        assert len(timing.thread_times) == 1
+
+    def test_backend_matches_availability(self):
+        calculator = SubinterpreterIntegralCalculator(IntegralCalculator().function_task1_2, 100)
+        calculator.compute_all([(0, 1, "[0,1]")], silent=True)
+
+        if subinterpreters_available() and calculator.fallback_reason is None:
+            assert calculator.backend_used == "subinterpreter"
+        else:
+            assert calculator.backend_used == "process"
+            assert calculator.fallback_reason
+
+    def test_fallback_reason_reset_between_runs(self):
+        calculator = SubinterpreterIntegralCalculator(IntegralCalculator().function_task1_2, 100)
+        calculator.backend_used = "process"
+        calculator.fallback_reason = "poprzednie uruchomienie"
+        calculator.compute_all([(0, 1, "[0,1]")], silent=True)
+
+        assert calculator.fallback_reason != "poprzednie uruchomienie"
+        if calculator.backend_used == "subinterpreter":
+            assert calculator.fallback_reason is None
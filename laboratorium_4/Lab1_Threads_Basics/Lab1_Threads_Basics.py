@@ -4,11 +4,20 @@ Porównanie metod:
   1) threading.Thread (2 i 8 wątków) — ograniczone przez GIL
   2) multiprocessing.Pool (2 i 8 procesów) — prawdziwa równoległość
   3) Ciężkie obliczenia + multiprocessing.Pool — demonstracja realnego zysku
+  4) Silnik redukcji — wszystkie statystyki w jednym przebiegu na dowolnym backendzie
+  5) Ciężkie obliczenia w wersji wektorowej (NumPy), opcjonalnie w kilku procesach
+  6) Tryb auto dla sumowania — dobór sekwencyjnie/równolegle, procesów i fragmentu
+  7) Tryb auto dla ciężkich obliczeń
+  8) Porównanie metod startu procesów (fork/spawn/forkserver) i wybór najtańszej
+  9) Zbiór danych — generator syntetycznych danych do testów skalowania
 """
 
 from src.modules.thread_sum_calculator import ThreadSumCalculator
 from src.modules.multiprocess_sum_calculator import MultiprocessSumCalculator
 from src.modules.heavy_computation_calculator import HeavyComputationCalculator
+from src.modules.reduction_engine import StatisticsCalculator
+from src.modules.dataset_generator import DatasetSelector
+from src.modules.start_method_benchmark import StartMethodBenchmark
 from src.utils.menu import Menu
 
 
@@ -19,6 +28,9 @@ def main():
     thread_calc = ThreadSumCalculator()
     mp_calc = MultiprocessSumCalculator()
     heavy_calc = HeavyComputationCalculator()
+    stats_calc = StatisticsCalculator()
+    start_benchmark = StartMethodBenchmark(mp_calc, heavy_calc)
+    dataset = DatasetSelector([thread_calc, mp_calc, heavy_calc, stats_calc])
 
     menu.add_option(
         '1',
@@ -38,6 +50,42 @@ def main():
         lambda: heavy_calc.run(),
         display_order=3
     )
+    menu.add_option(
+        '4',
+        'Statystyki (suma, min/max, średnia, wariancja, histogram) — silnik redukcji',
+        lambda: stats_calc.run(),
+        display_order=4
+    )
+    menu.add_option(
+        '5',
+        'Demo: ciężkie obliczenia — silnik wektorowy NumPy (1/2/8 proc.)',
+        lambda: heavy_calc.run_vectorized(),
+        display_order=5
+    )
+    menu.add_option(
+        '6',
+        'Sumowanie: tryb auto (pomiar narzutów, dobór procesów i fragmentu)',
+        lambda: mp_calc.run_auto(),
+        display_order=6
+    )
+    menu.add_option(
+        '7',
+        'Demo: ciężkie obliczenia — tryb auto (pomiar narzutów, dobór procesów i fragmentu)',
+        lambda: heavy_calc.run_auto(),
+        display_order=7
+    )
+    menu.add_option(
+        '8',
+        'Metody startu procesów: fork / spawn / forkserver (pomiar i wybór)',
+        lambda: start_benchmark.run(),
+        display_order=8
+    )
+    menu.add_option(
+        '9',
+        'Zbiór danych: wygeneruj syntetyczne dane (10^6 – 10^9 liczb) lub przywróć domyślne',
+        lambda: dataset.run(),
+        display_order=9
+    )
     menu.add_option(
         '0',
         'Wyjście',
@@ -10,28 +10,73 @@ tworzenia procesów na Windows i pokazać realne przyspieszenie.
 import math
 import os
 import time
-from multiprocessing import Pool
 
-from src.modules.csv_loader import load_numbers_from_csv
+from src.modules.auto_tuner import AutoTuner
+from src.modules.csv_loader import load_dataset
+from src.modules.partition import as_int64_view
+from src.modules.shared_numbers import SharedNumbers, shared_chunk
+from src.modules.start_methods import get_context
+
+try:
+    import numpy as np
+except ImportError:  # NumPy jest opcjonalny - bez niego wersja wektorowa jest niedostępna
+    np = None
 
 ITERATIONS_PER_ELEMENT = 10000
 
+# Dynamiczny przydział: docelowy czas jednego fragmentu, minimalna liczba fragmentów
+# na proces i odstęp między komunikatami o postępie
+TARGET_CHUNK_SECONDS = 0.05
+CHUNKS_PER_PROCESS = 4
+PROGRESS_INTERVAL = 0.25
+
 
-def _heavy_worker(chunk):
+def _heavy_worker(descriptor):
     """
     Funkcja robocza procesu: dla każdej liczby wykonuje N iteracji
     wzoru sin*cos+1, a następnie sumuje wyniki.
     Symuluje zadanie intensywne obliczeniowo.
+    Fragment czytany jest z pamięci współdzielonej (deskryptor: nazwa, przesunięcie, długość).
     """
     total = 0.0
-    for num in chunk:
-        val = float(num)
-        for _ in range(ITERATIONS_PER_ELEMENT):
-            val = math.sin(val) * math.cos(val) + 1.0
-        total += val
+    with shared_chunk(descriptor) as chunk:
+        for num in chunk:
+            val = float(num)
+            for _ in range(ITERATIONS_PER_ELEMENT):
+                val = math.sin(val) * math.cos(val) + 1.0
+            total += val
     return total
 
 
+def _heavy_worker_counted(descriptor):
+    """Jak _heavy_worker, ale zwraca też liczbę elementów fragmentu (do raportu postępu)."""
+    return descriptor[2], _heavy_worker(descriptor)
+
+
+def _vectorized_heavy(values):
+    """
+    Wektorowa wersja ciężkiego obliczenia: stany wszystkich elementów w jednej
+    tablicy float64, a każda z N iteracji to kilka operacji na całej tablicy.
+    Rekurencja jest sekwencyjna dla elementu, ale elementy są od siebie niezależne.
+
+    sin(v)*cos(v) = sin(2v)/2, więc na iterację wystarcza jedna funkcja trygonometryczna;
+    operacje wykonywane są w miejscu (bez alokowania nowych tablic).
+    """
+    val = np.array(values, dtype=np.float64)
+    for _ in range(ITERATIONS_PER_ELEMENT):
+        val += val
+        np.sin(val, out=val)
+        val *= 0.5
+        val += 1.0
+    return float(val.sum())
+
+
+def _heavy_vectorized_worker(descriptor):
+    """Funkcja robocza procesu — wersja wektorowa dla fragmentu z pamięci współdzielonej."""
+    with shared_chunk(descriptor) as chunk:
+        return _vectorized_heavy(chunk)
+
+
 class HeavyComputationCalculator:
     """
     Porównuje metodę sekwencyjną z multiprocessing.Pool (2, 8 procesów)
@@ -42,14 +87,20 @@ class HeavyComputationCalculator:
         os.path.dirname(__file__), '..', '..', '..', 'dane_wejsciowe', 'numbers1.csv'
     )
 
-    def __init__(self):
+    def __init__(self, start_method=None):
+        """
+        Args:
+            start_method (str | None): Metoda startu procesów ('fork', 'spawn', 'forkserver');
+                None oznacza domyślną metodę platformy.
+        """
         self.numbers = None
+        self.start_method = start_method
 
     def _load_data(self):
-        """Wczytuje dane z CSV, jeśli jeszcze nie wczytano."""
+        """Wczytuje dane z CSV (jako widok int64), jeśli jeszcze nie wczytano."""
         if self.numbers is None:
-            self.numbers = load_numbers_from_csv(self.DATA_FILE)
-            print(f"  Wczytano {len(self.numbers)} liczb z pliku CSV.")
+            self.numbers = as_int64_view(load_dataset(self.DATA_FILE))
+            print(f"  Wczytano {len(self.numbers)} liczb z pliku {os.path.basename(self.DATA_FILE)}.")
 
     @staticmethod
     def _sequential_heavy(numbers):
@@ -62,25 +113,128 @@ class HeavyComputationCalculator:
             total += val
         return total
 
-    @staticmethod
-    def _split_into_chunks(numbers, num_chunks):
-        """Dzieli listę na w przybliżeniu równe fragmenty."""
-        n = len(numbers)
-        chunk_size = n // num_chunks
-        chunks = []
-        for i in range(num_chunks):
-            start = i * chunk_size
-            end = start + chunk_size if i < num_chunks - 1 else n
-            chunks.append(numbers[start:end])
-        return chunks
-
-    def _multiprocess_heavy(self, numbers, num_processes):
+    def _multiprocess_heavy(self, shared, num_processes):
         """Ciężkie obliczenie z użyciem multiprocessing.Pool."""
-        chunks = self._split_into_chunks(numbers, num_processes)
-        with Pool(processes=num_processes) as pool:
-            partial_results = pool.map(_heavy_worker, chunks)
+        with get_context(self.start_method).Pool(processes=num_processes) as pool:
+            partial_results = pool.map(_heavy_worker, shared.descriptors(num_processes))
+        return sum(partial_results)
+
+    def _measure_element_cost(self, numbers, samples=20):
+        """Mierzy średni czas ciężkiego obliczenia dla jednego elementu [s]."""
+        sample = numbers[:samples]
+        start = time.perf_counter()
+        self._sequential_heavy(sample)
+        return (time.perf_counter() - start) / max(len(sample), 1)
+
+    @staticmethod
+    def _dynamic_chunk_size(element_cost, n, num_processes):
+        """
+        Dobiera rozmiar fragmentu: ok. TARGET_CHUNK_SECONDS pracy na fragment,
+        ale co najmniej CHUNKS_PER_PROCESS fragmentów na proces (wyrównanie końcówki).
+        """
+        by_time = int(TARGET_CHUNK_SECONDS / element_cost) if element_cost > 0 else n
+        by_balance = -(-n // (num_processes * CHUNKS_PER_PROCESS))
+        return max(1, min(by_time, by_balance))
+
+    @staticmethod
+    def _print_progress(done, total, elapsed):
+        """Wypisuje postęp, przepustowość i szacowany czas do końca (w jednej linii)."""
+        rate = done / elapsed if elapsed > 0 else 0.0
+        eta = (total - done) / rate if rate > 0 else 0.0
+        percent = done / total * 100 if total else 100.0
+        print(f"\r  Postęp: {percent:5.1f}% ({done}/{total}), "
+              f"{rate:,.0f} el./s, ETA: {eta:5.1f} s   ", end="", flush=True)
+
+    def _multiprocess_heavy_dynamic(self, shared, num_processes, chunk_size):
+        """
+        Ciężkie obliczenie z dynamicznym przydziałem wielu małych fragmentów
+        (Pool.imap_unordered): wolny proces od razu bierze kolejny fragment,
+        a wyniki częściowe są sumowane w kolejności ukończenia.
+        """
+        total = 0.0
+        done = 0
+        start = time.perf_counter()
+        last_report = start
+
+        with get_context(self.start_method).Pool(processes=num_processes) as pool:
+            for count, partial in pool.imap_unordered(_heavy_worker_counted,
+                                                      shared.descriptors_of_size(chunk_size)):
+                total += partial
+                done += count
+                now = time.perf_counter()
+                if now - last_report >= PROGRESS_INTERVAL or done == shared.length:
+                    self._print_progress(done, shared.length, now - start)
+                    last_report = now
+        print()
+        return total
+
+    def _multiprocess_vectorized(self, shared, num_processes):
+        """Wersja wektorowa podzielona na fragmenty liczone w multiprocessing.Pool."""
+        with get_context(self.start_method).Pool(processes=num_processes) as pool:
+            partial_results = pool.map(_heavy_vectorized_worker, shared.descriptors(num_processes))
         return sum(partial_results)
 
+    def run_vectorized(self):
+        """Uruchamia wersję wektorową (NumPy): jeden proces oraz Pool (2, 8 procesów)."""
+        if np is None:
+            print("\n  [INFO] Wersja wektorowa wymaga biblioteki NumPy (pip install numpy).")
+            return
+
+        self._load_data()
+        numbers = self.numbers
+
+        print("\n" + "-" * 60)
+        print("  Wersja 3b: Ciężkie obliczenia — silnik wektorowy NumPy")
+        print("-" * 60)
+        print(f"  Stany {len(numbers)} elementów w jednej tablicy float64,")
+        print(f"  {ITERATIONS_PER_ELEMENT} iteracji jako operacje na całej tablicy.")
+        print()
+
+        start = time.perf_counter()
+        vec_result = _vectorized_heavy(numbers)
+        vec_time = (time.perf_counter() - start) * 1000
+
+        with SharedNumbers(numbers) as shared:
+            start = time.perf_counter()
+            p2_result = self._multiprocess_vectorized(shared, 2)
+            p2_time = (time.perf_counter() - start) * 1000
+
+            start = time.perf_counter()
+            p8_result = self._multiprocess_vectorized(shared, 8)
+            p8_time = (time.perf_counter() - start) * 1000
+
+        print(f"  Wektorowo (1 proces)            – wynik: {vec_result:.2f}, czas wykonania: {vec_time:.2f} ms")
+        print(f"  Wektorowo + Pool (2 proc.)      – wynik: {p2_result:.2f}, czas wykonania: {p2_time:.2f} ms")
+        print(f"  Wektorowo + Pool (8 proc.)      – wynik: {p8_result:.2f}, czas wykonania: {p8_time:.2f} ms")
+
+        print("\n  [INFO] Pętla po elementach przeniesiona do NumPy (kod C) — w Pythonie zostaje")
+        print(f"         tylko {ITERATIONS_PER_ELEMENT} iteracji po całej tablicy zamiast"
+              f" {ITERATIONS_PER_ELEMENT * len(numbers)} kroków.")
+
+    def run_auto(self):
+        """Tryb auto: pomiar narzutów i wybór sekwencyjnie/Pool, liczby procesów i fragmentu."""
+        self._load_data()
+        numbers = self.numbers
+
+        print("\n" + "-" * 60)
+        print("  Wersja 3 (auto): dobór sposobu wykonania na podstawie pomiarów")
+        print("-" * 60)
+
+        tuner = AutoTuner(self._sequential_heavy, _heavy_worker, backend='pool', sample_size=20,
+                          mp_context=get_context(self.start_method))
+        start = time.perf_counter()
+        tuner.tune(numbers)
+        tune_time = (time.perf_counter() - start) * 1000
+        tuner.print_plan()
+
+        print("\n  Obliczam według planu...")
+        start = time.perf_counter()
+        auto_result = tuner.execute(numbers)
+        auto_time = (time.perf_counter() - start) * 1000
+
+        print(f"\n  Tryb auto                       – wynik: {auto_result:.2f}, czas wykonania: {auto_time:.2f} ms")
+        print(f"  Strojenie (pomiary, raz):       {tune_time:.2f} ms")
+
     def run(self):
         """Uruchamia porównanie: sekwencyjne vs multiprocessing z ciężkim obliczeniem."""
         self._load_data()
@@ -101,22 +255,39 @@ class HeavyComputationCalculator:
         seq_result = self._sequential_heavy(numbers)
         seq_time = (time.perf_counter() - start) * 1000
 
-        # 2 procesy
-        print("  Obliczam równolegle (2 procesy)...")
-        start = time.perf_counter()
-        p2_result = self._multiprocess_heavy(numbers, 2)
-        p2_time = (time.perf_counter() - start) * 1000
+        with SharedNumbers(numbers) as shared:
+            # 2 procesy
+            print("  Obliczam równolegle (2 procesy)...")
+            start = time.perf_counter()
+            p2_result = self._multiprocess_heavy(shared, 2)
+            p2_time = (time.perf_counter() - start) * 1000
 
-        # 8 procesów
-        print("  Obliczam równolegle (8 procesów)...")
-        start = time.perf_counter()
-        p8_result = self._multiprocess_heavy(numbers, 8)
-        p8_time = (time.perf_counter() - start) * 1000
+            # 8 procesów
+            print("  Obliczam równolegle (8 procesów)...")
+            start = time.perf_counter()
+            p8_result = self._multiprocess_heavy(shared, 8)
+            p8_time = (time.perf_counter() - start) * 1000
+
+            # 8 procesów, dynamiczny przydział fragmentów (z pomiarem kosztu elementu)
+            print("  Obliczam równolegle (8 procesów, dynamiczne fragmenty)...")
+            start = time.perf_counter()
+            element_cost = self._measure_element_cost(numbers)
+            chunk_size = self._dynamic_chunk_size(element_cost, len(numbers), 8)
+            pd_result = self._multiprocess_heavy_dynamic(shared, 8, chunk_size)
+            pd_time = (time.perf_counter() - start) * 1000
 
         print()
         print(f"  Metoda sekwencyjna              – wynik: {seq_result:.2f}, czas wykonania: {seq_time:.2f} ms")
         print(f"  Metoda wieloprocesowa (2 proc.) – wynik: {p2_result:.2f}, czas wykonania: {p2_time:.2f} ms")
         print(f"  Metoda wieloprocesowa (8 proc.) – wynik: {p8_result:.2f}, czas wykonania: {p8_time:.2f} ms")
+        print(f"  Dynamiczne fragmenty (8 proc.)  – wynik: {pd_result:.2f}, czas wykonania: {pd_time:.2f} ms"
+              f" (fragment: {chunk_size} el., koszt: {element_cost * 1000:.3f} ms/el.)")
+
+        if np is not None:
+            start = time.perf_counter()
+            vec_result = _vectorized_heavy(numbers)
+            vec_time = (time.perf_counter() - start) * 1000
+            print(f"  Metoda wektorowa (NumPy)        – wynik: {vec_result:.2f}, czas wykonania: {vec_time:.2f} ms")
 
         print()
         if seq_time > 0:
@@ -124,6 +295,9 @@ class HeavyComputationCalculator:
             speedup_8 = seq_time / p8_time
             print(f"  Przyspieszenie (2 proc.): {speedup_2:.2f}x")
             print(f"  Przyspieszenie (8 proc.): {speedup_8:.2f}x")
+            print(f"  Przyspieszenie (8 proc., dynamicznie): {seq_time / pd_time:.2f}x")
+            if np is not None:
+                print(f"  Przyspieszenie (NumPy):   {seq_time / vec_time:.2f}x")
 
         print(f"\n  [INFO] Przy wystarczająco ciężkim obliczeniu na element, multiprocessing.Pool")
         print(f"         pokazuje realny zysk — narzut tworzenia procesów jest pomijalny")
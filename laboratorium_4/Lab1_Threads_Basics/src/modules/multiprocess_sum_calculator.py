@@ -6,18 +6,43 @@ ale narzut tworzenia procesów dominuje przy małym zadaniu.
 """
 
 import os
+import pickle
 import time
-from multiprocessing import Pool
 
-from src.modules.csv_loader import load_numbers_from_csv
+from src.modules.auto_tuner import AutoTuner
+from src.modules.csv_loader import load_dataset
+from src.modules.partition import as_int64_view
+from src.modules.phase_timer import PhaseTimer
+from src.modules.shared_numbers import SharedNumbers, shared_chunk
+from src.modules.start_methods import get_context
 
 
-def _worker_sum(chunk):
-    """Funkcja robocza procesu — sumuje fragment tablicy liczb."""
+def _ready(_):
+    """Puste zadanie — proces roboczy importuje ten moduł i potwierdza gotowość."""
+    return None
+
+
+def _worker_sum_timed(descriptor):
+    """
+    Funkcja robocza procesu — sumuje fragment tablicy liczb.
+    Fragment czytany jest z pamięci współdzielonej na podstawie deskryptora
+    (nazwa, przesunięcie, długość) — do procesu nie są przesyłane same liczby.
+
+    Returns:
+        tuple: (suma fragmentu, czas samego sumowania w procesie roboczym [ms]).
+    """
     total = 0
-    for num in chunk:
-        total += num
-    return total
+    with shared_chunk(descriptor) as chunk:
+        start = time.perf_counter()
+        for num in chunk:
+            total += num
+        compute_ms = (time.perf_counter() - start) * 1000
+    return total, compute_ms
+
+
+def _worker_sum(descriptor):
+    """Funkcja robocza procesu — zwraca samą sumę fragmentu."""
+    return _worker_sum_timed(descriptor)[0]
 
 
 class MultiprocessSumCalculator:
@@ -25,20 +50,27 @@ class MultiprocessSumCalculator:
     Oblicza sumę liczb metodami:
     - sekwencyjną
     - multiprocessing.Pool z 2 i 8 procesami
+    - auto (dobór sekwencyjnie/równolegle, liczby procesów i fragmentu)
     """
 
     DATA_FILE = os.path.join(
         os.path.dirname(__file__), '..', '..', '..', 'dane_wejsciowe', 'numbers1.csv'
     )
 
-    def __init__(self):
+    def __init__(self, start_method=None):
+        """
+        Args:
+            start_method (str | None): Metoda startu procesów ('fork', 'spawn', 'forkserver');
+                None oznacza domyślną metodę platformy.
+        """
         self.numbers = None
+        self.start_method = start_method
 
     def _load_data(self):
-        """Wczytuje dane z CSV, jeśli jeszcze nie wczytano."""
+        """Wczytuje dane z CSV (jako widok int64), jeśli jeszcze nie wczytano."""
         if self.numbers is None:
-            self.numbers = load_numbers_from_csv(self.DATA_FILE)
-            print(f"  Wczytano {len(self.numbers)} liczb z pliku CSV.")
+            self.numbers = as_int64_view(load_dataset(self.DATA_FILE))
+            print(f"  Wczytano {len(self.numbers)} liczb z pliku {os.path.basename(self.DATA_FILE)}.")
 
     @staticmethod
     def _sequential_sum(numbers):
@@ -48,24 +80,49 @@ class MultiprocessSumCalculator:
             total += num
         return total
 
-    @staticmethod
-    def _split_into_chunks(numbers, num_chunks):
-        """Dzieli listę na w przybliżeniu równe fragmenty."""
-        n = len(numbers)
-        chunk_size = n // num_chunks
-        chunks = []
-        for i in range(num_chunks):
-            start = i * chunk_size
-            end = start + chunk_size if i < num_chunks - 1 else n
-            chunks.append(numbers[start:end])
-        return chunks
-
-    def _multiprocess_sum(self, numbers, num_processes):
-        """Oblicza sumę z użyciem multiprocessing.Pool dla podanej liczby procesów."""
-        chunks = self._split_into_chunks(numbers, num_processes)
-        with Pool(processes=num_processes) as pool:
-            partial_sums = pool.map(_worker_sum, chunks)
-        return sum(partial_sums)
+    def _multiprocess_sum(self, shared, num_processes):
+        """
+        Oblicza sumę z użyciem multiprocessing.Pool dla podanej liczby procesów,
+        mierząc osobno każdą fazę wykonania.
+
+        Returns:
+            tuple: (suma, PhaseTimer z czasami faz, rozmiar zadań po serializacji [B]).
+        """
+        timer = PhaseTimer()
+        descriptors = shared.descriptors(num_processes)
+
+        # Pool tworzy procesy od razu, ale przy spawn/forkserver gotowe są dopiero po imporcie
+        # modułów - puste zadanie dla każdego procesu czeka, aż odpowie cała pula
+        with timer.phase('start puli (wszystkie procesy)'):
+            pool = get_context(self.start_method).Pool(processes=num_processes)
+            pool.map(_ready, range(num_processes), chunksize=1)
+        try:
+            # Pool.map serializuje zadania sam, poza zasięgiem pomiaru - osobne pickle.dumps
+            # w procesie głównym to tylko szacunek tego kosztu
+            with timer.phase('serializacja zadań (pickle, szacunek)'):
+                payload_bytes = len(pickle.dumps(descriptors))
+            pickle_ms = timer.phases['serializacja zadań (pickle, szacunek)']
+
+            start = time.perf_counter()
+            results = pool.map(_worker_sum_timed, descriptors)
+            map_ms = (time.perf_counter() - start) * 1000
+
+            # Workery liczą równolegle - o czasie decyduje najdłuższy fragment
+            compute_ms = max(elapsed for _, elapsed in results)
+            timer.add('obliczenia w workerach (najdłuższy)', compute_ms)
+            # Przesłanie nie jest mierzone bezpośrednio - to reszta czasu map
+            # po odjęciu szacunku serializacji i najdłuższych obliczeń
+            timer.add('przesłanie zadań i wyników (reszta)', max(map_ms - pickle_ms - compute_ms, 0.0))
+
+            with timer.phase('redukcja wyników'):
+                total = sum(partial for partial, _ in results)
+
+            with timer.phase('zamknięcie puli'):
+                pool.close()
+                pool.join()
+        finally:
+            pool.terminate()
+        return total, timer, payload_bytes
 
     def run(self):
         """Uruchamia porównanie: sekwencyjne vs multiprocessing.Pool (2, 8 procesów)."""
@@ -81,19 +138,57 @@ class MultiprocessSumCalculator:
         seq_sum = self._sequential_sum(numbers)
         seq_time = (time.perf_counter() - start) * 1000
 
-        # 2 procesy
+        # Jednorazowe umieszczenie danych w pamięci współdzielonej
         start = time.perf_counter()
-        p2_sum = self._multiprocess_sum(numbers, 2)
-        p2_time = (time.perf_counter() - start) * 1000
+        with SharedNumbers(numbers) as shared:
+            shm_time = (time.perf_counter() - start) * 1000
 
-        # 8 procesów
-        start = time.perf_counter()
-        p8_sum = self._multiprocess_sum(numbers, 8)
-        p8_time = (time.perf_counter() - start) * 1000
+            # 2 procesy
+            start = time.perf_counter()
+            p2_sum, p2_phases, p2_bytes = self._multiprocess_sum(shared, 2)
+            p2_time = (time.perf_counter() - start) * 1000
+
+            # 8 procesów
+            start = time.perf_counter()
+            p8_sum, p8_phases, p8_bytes = self._multiprocess_sum(shared, 8)
+            p8_time = (time.perf_counter() - start) * 1000
 
         print(f"  Metoda sekwencyjna              – suma: {seq_sum}, czas wykonania: {seq_time:.4f} ms")
         print(f"  Metoda wieloprocesowa (2 proc.) – suma: {p2_sum}, czas wykonania: {p2_time:.4f} ms")
         print(f"  Metoda wieloprocesowa (8 proc.) – suma: {p8_sum}, czas wykonania: {p8_time:.4f} ms")
+        print(f"  Kopiowanie do pamięci współdzielonej (raz): {shm_time:.4f} ms")
+
+        print()
+        p2_phases.print_report(f"Fazy (2 proc., zadania: {p2_bytes} B)")
+        p8_phases.print_report(f"Fazy (8 proc., zadania: {p8_bytes} B)")
 
         print("\n  [INFO] multiprocessing.Pool omija GIL — realna równoległość, ale narzut")
         print("         tworzenia procesów dominuje przy tak małym zadaniu (~0.3 ms pracy).")
+        print("         Dane leżą w pamięci współdzielonej — procesy dostają tylko deskryptory")
+        print("         (nazwa, przesunięcie, długość), więc narzut to głównie start procesów.")
+        print("         Czas obliczeń mierzony jest wewnątrz procesów roboczych; serializacja")
+        print("         i przesłanie to szacunki: osobny pomiar pickle.dumps zadań oraz reszta")
+        print("         czasu Pool.map (kolejki, pickle wyników, budzenie procesów).")
+
+    def run_auto(self):
+        """Tryb auto: pomiar narzutów i wybór sekwencyjnie/Pool, liczby procesów i fragmentu."""
+        self._load_data()
+        numbers = self.numbers
+
+        print("\n" + "-"*60)
+        print("  Wersja 2 (auto): dobór sposobu wykonania na podstawie pomiarów")
+        print("-"*60)
+
+        tuner = AutoTuner(self._sequential_sum, _worker_sum, backend='pool',
+                          mp_context=get_context(self.start_method))
+        start = time.perf_counter()
+        tuner.tune(numbers)
+        tune_time = (time.perf_counter() - start) * 1000
+        tuner.print_plan()
+
+        start = time.perf_counter()
+        auto_sum = tuner.execute(numbers)
+        auto_time = (time.perf_counter() - start) * 1000
+
+        print(f"\n  Tryb auto                       – suma: {auto_sum}, czas wykonania: {auto_time:.4f} ms")
+        print(f"  Strojenie (pomiary, raz):       {tune_time:.4f} ms")
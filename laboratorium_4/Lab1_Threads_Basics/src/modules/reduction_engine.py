@@ -0,0 +1,395 @@
+"""
+Silnik równoległych redukcji.
+Redukcja łączna ma stan częściowy, który można policzyć osobno dla każdego fragmentu
+i scalić (suma, min/max, średnia i wariancja metodą Welforda, histogram).
+Ten sam opis redukcji wykonywany jest na dowolnym backendzie: sekwencyjnie,
+w wątkach, w multiprocessing.Pool, w ProcessPoolExecutor lub wektorowo (NumPy).
+"""
+
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import Pool
+
+from src.modules.csv_loader import INT64_MAX, load_dataset
+from src.modules.partition import as_int64_view, chunk_views
+from src.modules.shared_numbers import SharedNumbers, shared_chunk
+
+try:
+    import numpy as np
+except ImportError:  # NumPy jest opcjonalny - bez niego backend wektorowy jest niedostępny
+    np = None
+
+BACKENDS = ('serial', 'thread', 'pool', 'executor', 'vectorized')
+
+
+# ---- Redukcje ----
+
+class Reduction(ABC):
+    """
+    Redukcja łączna: identity() -> accumulate()/accumulate_array() -> merge() -> finalize().
+    Obiekty redukcji są przesyłane do procesów, więc muszą dać się zserializować (pickle).
+    """
+
+    name = ''
+
+    @abstractmethod
+    def identity(self):
+        """Stan początkowy (element neutralny scalania)."""
+
+    @abstractmethod
+    def accumulate(self, state, chunk):
+        """Dolicza fragment (iterowalny ciąg liczb) do stanu."""
+
+    @abstractmethod
+    def accumulate_array(self, state, values):
+        """Dolicza fragment w postaci tablicy NumPy int64 do stanu."""
+
+    @abstractmethod
+    def merge(self, left, right):
+        """Scala dwa stany częściowe (kolejność fragmentów: left przed right)."""
+
+    def finalize(self, state):
+        """Zamienia stan na wynik."""
+        return state
+
+
+class SumReduction(Reduction):
+    """Suma elementów."""
+
+    name = 'suma'
+
+    def identity(self):
+        return 0
+
+    def accumulate(self, state, chunk):
+        total = state
+        for num in chunk:
+            total += num
+        return total
+
+    def accumulate_array(self, state, values):
+        if len(values) == 0:
+            return state
+        # Suma int64 w NumPy przepełnia się po cichu - jest dokładna tylko, gdy n * max|x| < 2^63;
+        # w przeciwnym razie liczby sumowane są jako int Pythona
+        bound = max(-int(values.min()), int(values.max()))
+        if bound * len(values) <= INT64_MAX:
+            return state + int(values.sum())
+        return self.accumulate(state, values.tolist())
+
+    def merge(self, left, right):
+        return left + right
+
+
+class MinMaxReduction(Reduction):
+    """Najmniejszy i największy element (None dla pustych danych)."""
+
+    name = 'min_max'
+
+    def identity(self):
+        return (None, None)
+
+    def accumulate(self, state, chunk):
+        low, high = state
+        for num in chunk:
+            if low is None:
+                low = high = num
+            elif num < low:
+                low = num
+            elif num > high:
+                high = num
+        return (low, high)
+
+    def accumulate_array(self, state, values):
+        if len(values) == 0:
+            return state
+        return self.merge(state, (int(values.min()), int(values.max())))
+
+    def merge(self, left, right):
+        if left[0] is None:
+            return right
+        if right[0] is None:
+            return left
+        return (min(left[0], right[0]), max(left[1], right[1]))
+
+
+class WelfordReduction(Reduction):
+    """
+    Liczność, średnia i wariancja metodą Welforda.
+    Stan (n, średnia, M2) fragmentów scalany jest wzorem Chana:
+        M2 = M2_a + M2_b + delta² * n_a * n_b / n
+    """
+
+    name = 'momenty'
+
+    def identity(self):
+        return (0, 0.0, 0.0)
+
+    def accumulate(self, state, chunk):
+        count, mean, m2 = state
+        for num in chunk:
+            count += 1
+            delta = num - mean
+            mean += delta / count
+            m2 += delta * (num - mean)
+        return (count, mean, m2)
+
+    def accumulate_array(self, state, values):
+        if len(values) == 0:
+            return state
+        chunk_mean = float(values.mean())
+        chunk_m2 = float(((values - chunk_mean) ** 2).sum())
+        return self.merge(state, (len(values), chunk_mean, chunk_m2))
+
+    def merge(self, left, right):
+        count_a, mean_a, m2_a = left
+        count_b, mean_b, m2_b = right
+        count = count_a + count_b
+        if count == 0:
+            return left
+        delta = mean_b - mean_a
+        mean = mean_a + delta * count_b / count
+        m2 = m2_a + m2_b + delta * delta * count_a * count_b / count
+        return (count, mean, m2)
+
+    def finalize(self, state):
+        count, mean, m2 = state
+        return {
+            'liczność': count,
+            'średnia': mean if count else None,
+            'wariancja': m2 / count if count else None,
+            'wariancja_próbkowa': m2 / (count - 1) if count > 1 else None,
+        }
+
+
+class HistogramReduction(Reduction):
+    """Histogram o przedziałach szerokości bin_width: {początek przedziału: liczność}."""
+
+    name = 'histogram'
+
+    def __init__(self, bin_width=100):
+        self.bin_width = bin_width
+
+    def identity(self):
+        return {}
+
+    def accumulate(self, state, chunk):
+        counts = dict(state)
+        width = self.bin_width
+        for num in chunk:
+            key = num // width
+            counts[key] = counts.get(key, 0) + 1
+        return counts
+
+    def accumulate_array(self, state, values):
+        keys, key_counts = np.unique(values // self.bin_width, return_counts=True)
+        return self.merge(state, dict(zip(keys.tolist(), key_counts.tolist())))
+
+    def merge(self, left, right):
+        counts = dict(left)
+        for key, value in right.items():
+            counts[key] = counts.get(key, 0) + value
+        return counts
+
+    def finalize(self, state):
+        return {key * self.bin_width: state[key] for key in sorted(state)}
+
+
+class CompositeReduction(Reduction):
+    """Kilka redukcji liczonych w jednym przebiegu (wspólny podział danych i jedno scalanie)."""
+
+    name = 'statystyki'
+
+    def __init__(self, reductions):
+        self.reductions = list(reductions)
+
+    def identity(self):
+        return tuple(r.identity() for r in self.reductions)
+
+    def accumulate(self, state, chunk):
+        return tuple(r.accumulate(s, chunk) for r, s in zip(self.reductions, state))
+
+    def accumulate_array(self, state, values):
+        return tuple(r.accumulate_array(s, values) for r, s in zip(self.reductions, state))
+
+    def merge(self, left, right):
+        return tuple(r.merge(a, b) for r, a, b in zip(self.reductions, left, right))
+
+    def finalize(self, state):
+        return {r.name: r.finalize(s) for r, s in zip(self.reductions, state)}
+
+
+def _format_stat(value):
+    """Formatuje statystykę, która dla pustych danych jest None."""
+    return "brak" if value is None else f"{value:.4f}"
+
+
+def _close(a, b):
+    """Porównuje wariancje z tolerancją (None - puste dane)."""
+    if a is None or b is None:
+        return a is b
+    return abs(a - b) <= 1e-6 * max(b, 1.0)
+
+
+# ---- Funkcje robocze (poziom modułu, wymagane przez multiprocessing) ----
+
+def _reduce_shared_chunk(args):
+    """Liczy stan częściowy redukcji dla fragmentu z pamięci współdzielonej."""
+    reduction, descriptor = args
+    with shared_chunk(descriptor) as chunk:
+        return reduction.accumulate(reduction.identity(), chunk)
+
+
+# ---- Silnik ----
+
+class ReductionEngine:
+    """
+    Wykonuje redukcję na wybranym backendzie.
+    Dane dzielone są na fragmenty (widoki lub deskryptory pamięci współdzielonej),
+    każdy fragment daje stan częściowy, a stany scalane są w kolejności fragmentów.
+    """
+
+    def __init__(self, reduction, backend='serial', workers=4):
+        if backend not in BACKENDS:
+            raise ValueError(f"Nieznany backend: {backend} (dostępne: {', '.join(BACKENDS)})")
+        if backend == 'vectorized' and np is None:
+            raise ValueError("Backend 'vectorized' wymaga biblioteki NumPy.")
+        self.reduction = reduction
+        self.backend = backend
+        self.workers = workers
+
+    def _merge_all(self, states):
+        """Scala stany częściowe od lewej do prawej."""
+        state = self.reduction.identity()
+        for partial in states:
+            state = self.reduction.merge(state, partial)
+        return state
+
+    def _reduce_serial(self, numbers):
+        return self.reduction.accumulate(self.reduction.identity(), numbers)
+
+    def _reduce_threads(self, numbers):
+        results = [None] * self.workers
+        threads = []
+
+        def worker(index, chunk):
+            results[index] = self.reduction.accumulate(self.reduction.identity(), chunk)
+
+        for i, (_, _, chunk) in enumerate(chunk_views(numbers, self.workers)):
+            threads.append(threading.Thread(target=worker, args=(i, chunk)))
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return self._merge_all(results)
+
+    def _reduce_processes(self, numbers):
+        with SharedNumbers(numbers) as shared:
+            tasks = [(self.reduction, d) for d in shared.descriptors(self.workers)]
+            if self.backend == 'pool':
+                with Pool(processes=self.workers) as pool:
+                    states = pool.map(_reduce_shared_chunk, tasks)
+            else:
+                with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                    states = list(executor.map(_reduce_shared_chunk, tasks))
+        return self._merge_all(states)
+
+    def _reduce_vectorized(self, numbers):
+        values = np.frombuffer(as_int64_view(numbers), dtype=np.int64)
+        return self.reduction.accumulate_array(self.reduction.identity(), values)
+
+    def run(self, numbers):
+        """
+        Wykonuje redukcję na danych.
+
+        Args:
+            numbers: Lista liczb, array('q'), tablica NumPy int64 lub memoryview.
+
+        Returns:
+            Wynik redukcji (finalize).
+        """
+        numbers = as_int64_view(numbers)
+        if self.backend == 'serial':
+            state = self._reduce_serial(numbers)
+        elif self.backend == 'thread':
+            state = self._reduce_threads(numbers)
+        elif self.backend == 'vectorized':
+            state = self._reduce_vectorized(numbers)
+        else:
+            state = self._reduce_processes(numbers)
+        return self.reduction.finalize(state)
+
+
+class StatisticsCalculator:
+    """
+    Liczy sumę, min/max, średnią, wariancję i histogram w jednym przebiegu
+    przez dane - na każdym dostępnym backendzie silnika redukcji.
+    """
+
+    DATA_FILE = os.path.join(
+        os.path.dirname(__file__), '..', '..', '..', 'dane_wejsciowe', 'numbers1.csv'
+    )
+    NUM_WORKERS = 4
+    HISTOGRAM_BIN_WIDTH = 100
+
+    def __init__(self):
+        self.numbers = None
+
+    def _load_data(self):
+        """Wczytuje dane z CSV (jako widok int64), jeśli jeszcze nie wczytano."""
+        if self.numbers is None:
+            self.numbers = as_int64_view(load_dataset(self.DATA_FILE))
+            print(f"  Wczytano {len(self.numbers)} liczb z pliku {os.path.basename(self.DATA_FILE)}.")
+
+    @classmethod
+    def create_reduction(cls):
+        """Zestaw statystyk liczonych w jednym przebiegu."""
+        return CompositeReduction([
+            SumReduction(),
+            MinMaxReduction(),
+            WelfordReduction(),
+            HistogramReduction(bin_width=cls.HISTOGRAM_BIN_WIDTH),
+        ])
+
+    def run(self):
+        """Uruchamia statystyki na wszystkich backendach i porównuje wyniki oraz czasy."""
+        self._load_data()
+        numbers = self.numbers
+        reduction = self.create_reduction()
+
+        print("\n" + "-" * 60)
+        print(f"  Silnik redukcji — statystyki w jednym przebiegu ({self.NUM_WORKERS} workery)")
+        print("-" * 60)
+
+        results = {}
+        for backend in BACKENDS:
+            if backend == 'vectorized' and np is None:
+                print(f"  {backend:<12} – pominięto (brak NumPy)")
+                continue
+            engine = ReductionEngine(reduction, backend, self.NUM_WORKERS)
+            start = time.perf_counter()
+            results[backend] = engine.run(numbers)
+            elapsed = (time.perf_counter() - start) * 1000
+            r = results[backend]
+            print(f"  {backend:<12} – suma: {r['suma']}, średnia: {_format_stat(r['momenty']['średnia'])}, "
+                  f"czas wykonania: {elapsed:.4f} ms")
+
+        stats = results['serial']
+        low, high = stats['min_max']
+        moments = stats['momenty']
+        print(f"\n  Liczność: {moments['liczność']}, min: {low}, max: {high}")
+        print(f"  Średnia: {_format_stat(moments['średnia'])}, wariancja: {_format_stat(moments['wariancja'])}")
+        print("  Histogram:")
+        for bin_start, count in stats['histogram'].items():
+            print(f"    [{bin_start:>5}, {bin_start + self.HISTOGRAM_BIN_WIDTH:>5}): {count}")
+
+        consistent = all(
+            r['suma'] == stats['suma'] and r['min_max'] == stats['min_max']
+            and r['histogram'] == stats['histogram']
+            and _close(r['momenty']['wariancja'], moments['wariancja'])
+            for r in results.values()
+        )
+        print(f"\n  Zgodność backendów: {'TAK' if consistent else 'NIE'}")
@@ -0,0 +1,103 @@
+"""
+Porównanie metod startu procesów (fork, spawn, forkserver).
+Dla każdej metody mierzy narzut samej puli oraz czasy sumowania (Pool, 8 procesów)
+i ciężkich obliczeń (Pool, 8 procesów), a następnie wybiera najtańszą bezpieczną metodę.
+"""
+
+import time
+
+from src.modules.shared_numbers import SharedNumbers
+from src.modules.start_methods import available_start_methods, is_fork_safe, measure_startup
+
+NUM_PROCESSES = 8
+
+
+class StartMethodBenchmark:
+    """
+    Uruchamia kalkulatory wieloprocesowe pod każdą dostępną metodą startu.
+    Po pomiarze ustawia kalkulatorom najtańszą bezpieczną metodę (najmniejszy narzut:
+    start i zamknięcie puli oraz sumowanie, w którym obliczenia są pomijalne).
+    """
+
+    def __init__(self, mp_calc, heavy_calc):
+        """
+        Args:
+            mp_calc (MultiprocessSumCalculator): Kalkulator sumy (Pool).
+            heavy_calc (HeavyComputationCalculator): Kalkulator ciężkich obliczeń (Pool).
+        """
+        self.mp_calc = mp_calc
+        self.heavy_calc = heavy_calc
+
+    def _measure(self, method, shared):
+        """Wykonuje pomiary dla jednej metody startu."""
+        self.mp_calc.start_method = method
+        self.heavy_calc.start_method = method
+
+        startup_ms, close_ms = measure_startup(method, NUM_PROCESSES)
+
+        start = time.perf_counter()
+        total, _, _ = self.mp_calc._multiprocess_sum(shared, NUM_PROCESSES)
+        sum_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        heavy = self.heavy_calc._multiprocess_heavy(shared, NUM_PROCESSES)
+        heavy_ms = (time.perf_counter() - start) * 1000
+
+        return {
+            'start_puli_ms': startup_ms,
+            'zamknięcie_ms': close_ms,
+            'suma': total,
+            'suma_ms': sum_ms,
+            'wynik_ciężki': heavy,
+            'ciężkie_ms': heavy_ms,
+        }
+
+    def run(self):
+        """Porównuje metody startu i zwraca wybraną (najtańszą bezpieczną) metodę."""
+        self.mp_calc._load_data()
+        numbers = self.mp_calc.numbers
+        previous = self.mp_calc.start_method
+
+        print("\n" + "-" * 60)
+        print(f"  Metody startu procesów — fork / spawn / forkserver ({NUM_PROCESSES} proc.)")
+        print("-" * 60)
+        print("  Forkserver ładuje wstępnie moduły src.modules.* (i NumPy); dane leżą")
+        print("  w pamięci współdzielonej, więc procesy nie parsują ponownie CSV.")
+        print("  Obliczam... (ciężkie obliczenia dla każdej metody potrwają kilka sekund)")
+
+        # Fork przy działających innych wątkach grozi zakleszczeniem - nie jest nawet mierzony
+        fork_safe = is_fork_safe()
+        methods = [m for m in available_start_methods() if m != 'fork' or fork_safe]
+        if not fork_safe:
+            print("  [UWAGA] fork pominięty — w procesie działają inne wątki (ryzyko zakleszczenia).")
+
+        results = {}
+        with SharedNumbers(numbers) as shared:
+            for method in methods:
+                results[method] = self._measure(method, shared)
+        if not results:
+            self.mp_calc.start_method = self.heavy_calc.start_method = previous
+            return previous
+
+        print()
+        print(f"  {'Metoda':<11} {'start puli':>12} {'zamknięcie':>12} {'suma Pool':>12} {'ciężkie':>12}")
+        for method, r in results.items():
+            print(f"  {method:<11} {r['start_puli_ms']:>9.2f} ms {r['zamknięcie_ms']:>9.2f} ms"
+                  f" {r['suma_ms']:>9.2f} ms {r['ciężkie_ms']:>9.2f} ms")
+
+        fastest_start = min(results, key=lambda m: results[m]['start_puli_ms'])
+        for method, r in results.items():
+            if method != fastest_start:
+                print(f"  Start puli {method} vs {fastest_start}: "
+                      f"+{r['start_puli_ms'] - results[fastest_start]['start_puli_ms']:.2f} ms")
+
+        # Obliczenia są takie same dla każdej metody - o wyborze decyduje narzut puli
+        best = min(results, key=lambda m: results[m]['start_puli_ms'] + results[m]['zamknięcie_ms']
+                   + results[m]['suma_ms'])
+        self.mp_calc.start_method = best
+        self.heavy_calc.start_method = best
+
+        print(f"\n  Wybrana metoda startu: {best} (najmniejszy narzut puli"
+              f"{'' if fork_safe else ', fork pominięty — w procesie działają inne wątki'})")
+        print(f"  [INFO] Kolejne uruchomienia opcji wieloprocesowych w tym menu używają metody '{best}'.")
+        return best
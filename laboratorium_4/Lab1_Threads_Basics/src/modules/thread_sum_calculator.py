@@ -1,21 +1,33 @@
 """
 Kalkulator sumy z użyciem threading.Thread.
 Porównanie sumowania sekwencyjnego z wielowątkowym.
-Uwaga: z powodu GIL w CPythonie, threading.Thread nie daje przyspieszenia dla zadań CPU-bound.
+Uwaga: z powodu GIL w CPythonie, threading.Thread nie daje przyspieszenia dla zadań CPU-bound
+w czystym Pythonie. Wersja z jądrem NumPy zwalnia GIL na czas sumowania fragmentu,
+więc wątki liczą naprawdę równolegle.
 """
 
 import os
 import threading
 import time
 
-from src.modules.csv_loader import load_numbers_from_csv
+from src.modules.csv_loader import load_dataset
+from src.modules.partition import as_int64_view, chunk_views
+
+try:
+    import numpy as np
+except ImportError:  # NumPy jest opcjonalny - bez niego wersja zwalniająca GIL jest niedostępna
+    np = None
+
+# Docelowa liczba elementów w teście skalowania - mniejsze dane są powielane do tej liczby
+SCALING_TARGET = 10_000_000
 
 
 class ThreadSumCalculator:
     """
     Oblicza sumę liczb metodami:
     - sekwencyjną
-    - threading.Thread z 2 i 8 wątkami
+    - threading.Thread z 2 i 8 wątkami (pętla w Pythonie - trzyma GIL)
+    - threading.Thread z 2 i 8 wątkami (jądro NumPy - zwalnia GIL)
     """
 
     DATA_FILE = os.path.join(
@@ -26,10 +38,10 @@ class ThreadSumCalculator:
         self.numbers = None
 
     def _load_data(self):
-        """Wczytuje dane z CSV, jeśli jeszcze nie wczytano."""
+        """Wczytuje dane z CSV (jako widok int64), jeśli jeszcze nie wczytano."""
         if self.numbers is None:
-            self.numbers = load_numbers_from_csv(self.DATA_FILE)
-            print(f"  Wczytano {len(self.numbers)} liczb z pliku CSV.")
+            self.numbers = as_int64_view(load_dataset(self.DATA_FILE))
+            print(f"  Wczytano {len(self.numbers)} liczb z pliku {os.path.basename(self.DATA_FILE)}.")
 
     @staticmethod
     def _sequential_sum(numbers):
@@ -40,26 +52,39 @@ class ThreadSumCalculator:
         return total
 
     @staticmethod
-    def _partial_sum(numbers, start, end, results, index):
+    def _partial_sum(chunk, results, index):
         """Oblicza sumę częściową dla fragmentu tablicy (używane przez wątki)."""
         partial = 0
-        for i in range(start, end):
-            partial += numbers[i]
+        for num in chunk:
+            partial += num
         results[index] = partial
 
-    def _threaded_sum(self, numbers, num_threads):
-        """Oblicza sumę z użyciem threading.Thread dla podanej liczby wątków."""
-        n = len(numbers)
-        chunk_size = n // num_threads
+    @staticmethod
+    def _numpy_partial_sum(chunk, results, index):
+        """
+        Suma częściowa jądrem NumPy: redukcja na widoku fragmentu wykonywana jest w C
+        ze zwolnionym GIL, więc inne wątki w tym czasie też liczą.
+        """
+        results[index] = int(np.frombuffer(chunk, dtype=np.int64).sum())
+
+    def _threaded_sum(self, numbers, num_threads, kernel=None):
+        """
+        Oblicza sumę z użyciem threading.Thread dla podanej liczby wątków.
+        Każdy wątek dostaje widok swojego fragmentu (bez kopiowania danych).
+
+        Args:
+            numbers: Tablica liczb.
+            num_threads (int): Liczba wątków.
+            kernel: Funkcja (fragment, wyniki, indeks) liczona w wątku; domyślnie _partial_sum.
+        """
         threads = []
         results = [0] * num_threads
+        kernel = kernel or self._partial_sum
 
-        for i in range(num_threads):
-            start = i * chunk_size
-            end = start + chunk_size if i < num_threads - 1 else n
+        for i, (_, _, chunk) in enumerate(chunk_views(numbers, num_threads)):
             t = threading.Thread(
-                target=self._partial_sum,
-                args=(numbers, start, end, results, i)
+                target=kernel,
+                args=(chunk, results, i)
             )
             threads.append(t)
 
@@ -100,3 +125,44 @@ class ThreadSumCalculator:
         print(f"  Metoda wielowątkowa (8 wątków) – suma: {t8_sum}, czas wykonania: {t8_time:.4f} ms")
 
         print("\n  [INFO] threading.Thread podlega GIL — brak realnej równoległości dla zadań CPU-bound.")
+
+        if np is None:
+            print("\n  [INFO] Wersja zwalniająca GIL wymaga biblioteki NumPy (pip install numpy).")
+            return
+        self._run_nogil(numbers)
+
+    def _run_nogil(self, numbers):
+        """
+        Porównanie z jądrem NumPy zwalniającym GIL - na danych i na danych powielonych
+        do SCALING_TARGET elementów (pomijane, gdy dane są już co najmniej tak duże).
+        """
+        print("\n" + "-"*60)
+        print("  Wersja 1b: threading.Thread + jądro NumPy (GIL zwolniony)")
+        print("-"*60)
+
+        datasets = [("dane", numbers)]
+        repeats = SCALING_TARGET // len(numbers) if len(numbers) else 0
+        if repeats > 1:
+            scaled = np.tile(np.frombuffer(numbers, dtype=np.int64), repeats)
+            datasets.append((f"dane x{repeats}", scaled))
+        for label, data in datasets:
+            start = time.perf_counter()
+            seq_sum = int(np.frombuffer(data, dtype=np.int64).sum())
+            seq_time = (time.perf_counter() - start) * 1000
+
+            start = time.perf_counter()
+            t2_sum = self._threaded_sum(data, 2, self._numpy_partial_sum)
+            t2_time = (time.perf_counter() - start) * 1000
+
+            start = time.perf_counter()
+            t8_sum = self._threaded_sum(data, 8, self._numpy_partial_sum)
+            t8_time = (time.perf_counter() - start) * 1000
+
+            print(f"  {label} ({len(data)} liczb):")
+            print(f"    NumPy (1 wątek)              – suma: {seq_sum}, czas wykonania: {seq_time:.4f} ms")
+            print(f"    NumPy (2 wątki)              – suma: {t2_sum}, czas wykonania: {t2_time:.4f} ms")
+            print(f"    NumPy (8 wątków)             – suma: {t8_sum}, czas wykonania: {t8_time:.4f} ms")
+
+        print(f"\n  [INFO] Jądro NumPy zwalnia GIL na czas redukcji fragmentu — wątki liczą równolegle")
+        print(f"         (liczba rdzeni: {os.cpu_count()}). Przy małych danych dominuje start wątków;")
+        print(f"         zysk widać dopiero przy większych danych.")
@@ -0,0 +1,70 @@
+import pytest
+from src.modules.auto_tuner import AutoTuner
+from src.modules.multiprocess_sum_calculator import MultiprocessSumCalculator, _worker_sum
+
+
+class TestAutoTuner:
+
+    @pytest.fixture
+    def tuner(self, monkeypatch):
+        # Pomiary zastąpione stałymi kosztami - decyzja zależy tylko od modelu
+        tuner = AutoTuner(MultiprocessSumCalculator._sequential_sum, _worker_sum, max_workers=4)
+        monkeypatch.setattr(tuner, 'measure_overheads', lambda: (tuner.spawn_ms, tuner.task_ms))
+        monkeypatch.setattr(tuner, 'measure_element_cost', lambda numbers: tuner.element_ms)
+        return tuner
+
+    def test_cheap_elements_run_sequentially(self, tuner):
+        # 10 000 el. po 0,1 µs = 1 ms pracy - start jednego procesu (50 ms) się nie opłaca
+        tuner.element_ms, tuner.spawn_ms, tuner.task_ms = 0.0001, 50.0, 0.1
+        plan = tuner.tune(list(range(10000)))
+
+        assert (plan['workery'], plan['fragment']) == (1, 10000)
+        assert plan['szacunek_ms'] == plan['szacunek_sekw_ms'] == pytest.approx(1.0)
+
+    def test_expensive_elements_use_all_workers(self, tuner):
+        # 10 000 el. po 1 ms: dla k procesów 50k + 4k zadań * 1 ms + 10 000 / k;
+        # k = 4: 200 + 16 + 2500 = 2716 ms (k = 3: 3495 ms, sekwencyjnie 10 000 ms)
+        tuner.element_ms, tuner.spawn_ms, tuner.task_ms = 1.0, 50.0, 1.0
+        plan = tuner.tune(list(range(10000)))
+
+        assert (plan['workery'], plan['fragment']) == (4, 625)
+        assert plan['szacunek_ms'] == pytest.approx(2716.0)
+
+    def test_spawn_cost_limits_workers(self, tuner):
+        # 1000 ms pracy: k = 2 daje 400 + 8 + 500 = 908 ms, k = 3 - 600 + 12 + 333 = 945 ms
+        tuner.element_ms, tuner.spawn_ms, tuner.task_ms = 0.1, 200.0, 1.0
+        plan = tuner.tune(list(range(10000)))
+
+        assert plan['workery'] == 2
+        assert plan['szacunek_ms'] == pytest.approx(908.0)
+
+    @pytest.mark.parametrize('n, workers, element_ms, task_ms, expected', [
+        # Narzut IPC 0,1 ms ma być 5% pracy fragmentu: 0,1 / (0,05 * 0,001) = 2000 el.
+        (10000, 2, 0.001, 0.1, 2000),
+        # Drogie elementy - wyrównanie obciążenia: ceil(10000 / (2 * 4))
+        (10000, 2, 1.0, 0.1, 1250),
+        # Darmowe elementy - nie więcej niż równy podział między procesy
+        (10000, 3, 0.0, 0.1, 3334),
+        # Mało elementów - fragment ograniczony równym podziałem: ceil(5 / 4)
+        (5, 4, 1.0, 0.1, 2),
+    ])
+    def test_chunk_size(self, n, workers, element_ms, task_ms, expected):
+        assert AutoTuner._chunk_size(n, workers, element_ms, task_ms) == expected
+
+    def test_execute_follows_plan(self):
+        tuner = AutoTuner(MultiprocessSumCalculator._sequential_sum, _worker_sum, max_workers=2)
+        numbers = list(range(1, 101))
+
+        tuner.plan = {'workery': 1, 'fragment': 100}
+        assert tuner.execute(numbers) == 5050
+        tuner.plan = {'workery': 2, 'fragment': 7}
+        assert tuner.execute(numbers) == 5050
+
+    @pytest.mark.parametrize('backend', ['pool', 'executor'])
+    def test_measured_overheads(self, backend):
+        spawn_ms, task_ms = AutoTuner(sum, _worker_sum, backend=backend).measure_overheads()
+        assert spawn_ms >= 0 and task_ms > 0
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            AutoTuner(sum, _worker_sum, backend='threads')
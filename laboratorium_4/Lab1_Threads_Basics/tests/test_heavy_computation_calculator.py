@@ -0,0 +1,63 @@
+import os
+from array import array
+
+import pytest
+from src.modules.csv_loader import load_numbers_array
+from src.modules.heavy_computation_calculator import HeavyComputationCalculator, _vectorized_heavy, np
+from src.modules.shared_numbers import SharedNumbers
+
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'dane_wejsciowe')
+
+
+@pytest.mark.skipif(np is None, reason="wymaga NumPy")
+class TestVectorizedHeavy:
+
+    @pytest.mark.parametrize('name', ['numbers1.csv', 'numbers4.csv'])
+    def test_matches_sequential_loop(self, name):
+        numbers = load_numbers_array(os.path.join(DATA_DIR, name))[:200]
+        expected = HeavyComputationCalculator._sequential_heavy(numbers)
+
+        # sin(2v)/2 zamiast sin(v)*cos(v) - różnica tylko w zaokrągleniach
+        assert _vectorized_heavy(numbers) == pytest.approx(expected, rel=1e-9)
+
+    @pytest.mark.parametrize('numbers', [[], [0], [-7, 3], array('q', [2 ** 40, -2 ** 40])])
+    def test_edge_inputs(self, numbers):
+        expected = HeavyComputationCalculator._sequential_heavy(numbers)
+        assert _vectorized_heavy(numbers) == pytest.approx(expected, rel=1e-9)
+
+    def test_input_is_not_modified(self):
+        numbers = np.array([1, 2, 3], dtype=np.int64)
+        _vectorized_heavy(numbers)
+        assert list(numbers) == [1, 2, 3]
+
+
+class TestDynamicScheduling:
+
+    @pytest.mark.parametrize('element_cost, n, num_processes, expected', [
+        # 0,05 s na fragment przy 1 ms na element - 50 elementów
+        (0.001, 10000, 4, 50),
+        # Szybkie elementy - co najmniej 4 fragmenty na proces: ceil(10000 / 16)
+        (1e-9, 10000, 4, 625),
+        # Nieznany koszt - tylko wyrównanie obciążenia: ceil(100 / 16)
+        (0, 100, 4, 7),
+        # Element dłuższy niż docelowy czas fragmentu - fragment nie jest pusty
+        (1.0, 10, 8, 1),
+    ])
+    def test_dynamic_chunk_size(self, element_cost, n, num_processes, expected):
+        assert HeavyComputationCalculator._dynamic_chunk_size(element_cost, n, num_processes) == expected
+
+    def test_dynamic_matches_sequential(self, capsys):
+        numbers = load_numbers_array(os.path.join(DATA_DIR, 'numbers1.csv'))[:50]
+        calculator = HeavyComputationCalculator()
+        with SharedNumbers(numbers) as shared:
+            result = calculator._multiprocess_heavy_dynamic(shared, 2, chunk_size=7)
+
+        # Kolejność ukończenia fragmentów zmienia tylko kolejność dodawania
+        assert result == pytest.approx(HeavyComputationCalculator._sequential_heavy(numbers), rel=1e-12)
+        assert '100.0% (50/50)' in capsys.readouterr().out
+
+    def test_progress_line(self, capsys):
+        HeavyComputationCalculator._print_progress(25, 100, 0.5)
+        # 50 el./s, pozostało 75 elementów - 1,5 s
+        assert capsys.readouterr().out == "\r  Postęp:  25.0% (25/100), 50 el./s, ETA:   1.5 s   "
@@ -0,0 +1,92 @@
+from array import array
+
+import pytest
+from src.modules.partition import as_int64_view, chunk_ranges, chunk_ranges_of_size, chunk_views
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TestChunkRanges:
+
+    @pytest.mark.parametrize('n, num_chunks', [(10, 3), (10, 1), (7, 7), (3, 5), (0, 4), (10 ** 6 + 3, 8)])
+    def test_ranges_cover_all_elements(self, n, num_chunks):
+        ranges = chunk_ranges(n, num_chunks)
+
+        # Dokładnie num_chunks ciągłych zakresów od 0 do n
+        assert len(ranges) == num_chunks
+        assert ranges[0][0] == 0 and ranges[-1][1] == n
+        assert all(end == start for (_, end), (start, _) in zip(ranges, ranges[1:]))
+
+    def test_last_range_takes_remainder(self):
+        assert chunk_ranges(10, 3) == [(0, 3), (3, 6), (6, 10)]
+
+    def test_more_chunks_than_elements(self):
+        # Rozmiar fragmentu 3 // 5 = 0 - wszystkie elementy trafiają do ostatniego
+        assert chunk_ranges(3, 5) == [(0, 0), (0, 0), (0, 0), (0, 0), (0, 3)]
+
+    def test_empty_input(self):
+        assert chunk_ranges(0, 3) == [(0, 0), (0, 0), (0, 0)]
+        assert chunk_ranges_of_size(0, 4) == []
+
+    @pytest.mark.parametrize('n, chunk_size, expected', [
+        (10, 4, [(0, 4), (4, 8), (8, 10)]),
+        (8, 4, [(0, 4), (4, 8)]),
+        (3, 10, [(0, 3)]),
+        (3, 1, [(0, 1), (1, 2), (2, 3)]),
+    ])
+    def test_ranges_of_size(self, n, chunk_size, expected):
+        assert chunk_ranges_of_size(n, chunk_size) == expected
+
+
+class TestViews:
+
+    def test_list_is_copied_to_int64(self):
+        numbers = [1, -2, 2 ** 40]
+        view = as_int64_view(numbers)
+
+        assert view.format == 'q'
+        assert list(view) == numbers
+        numbers[0] = 99
+        assert view[0] == 1
+
+    def test_array_and_memoryview_are_not_copied(self):
+        numbers = array('q', [1, 2, 3])
+        view = as_int64_view(numbers)
+        assert as_int64_view(view).obj is numbers
+
+        # Widok na bufor tablicy - zmiana tablicy jest widoczna w widoku
+        numbers[1] = 20
+        assert list(view) == [1, 20, 3]
+
+    def test_other_item_types_are_converted(self):
+        view = as_int64_view(array('i', [4, -5, 6]))
+        assert view.format == 'q'
+        assert list(view) == [4, -5, 6]
+
+    @pytest.mark.skipif(np is None, reason="wymaga NumPy")
+    def test_ndarray(self):
+        numbers = np.arange(10, dtype=np.int64)
+        view = as_int64_view(numbers)
+        numbers[0] = 100
+        assert view.format == 'q' and view[0] == 100
+
+        # Tablica nieciągła (co drugi element) i int32 są kopiowane
+        assert list(as_int64_view(numbers[::2])) == [100, 2, 4, 6, 8]
+        assert list(as_int64_view(np.array([7, 8], dtype=np.int32))) == [7, 8]
+
+    @pytest.mark.parametrize('num_chunks', [1, 3, 12])
+    def test_chunk_views(self, num_chunks):
+        numbers = array('q', range(10))
+        views = chunk_views(numbers, num_chunks)
+
+        assert [(start, end) for start, end, _ in views] == chunk_ranges(10, num_chunks)
+        assert [x for _, _, chunk in views for x in chunk] == list(range(10))
+        # Fragmenty są widokami wspólnego bufora
+        numbers[9] = -1
+        assert views[-1][2][-1] == -1
+
+    def test_chunk_views_of_empty_input(self):
+        assert [len(chunk) for _, _, chunk in chunk_views([], 2)] == [0, 0]
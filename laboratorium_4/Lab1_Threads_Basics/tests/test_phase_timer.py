@@ -0,0 +1,49 @@
+import time
+
+import pytest
+from src.modules.phase_timer import PhaseTimer
+
+
+class TestPhaseTimer:
+
+    def test_phase_measures_block(self):
+        timer = PhaseTimer()
+        with timer.phase('uśpienie'):
+            time.sleep(0.02)
+
+        assert 20.0 <= timer.phases['uśpienie'] < 1000.0
+
+    def test_add_accumulates_in_order(self):
+        timer = PhaseTimer()
+        timer.add('start', 2.0)
+        timer.add('obliczenia', 5.0)
+        timer.add('start', 1.0)
+
+        # Ponowna faza o tej samej nazwie dolicza się do pierwszej, kolejność zostaje
+        assert list(timer.phases.items()) == [('start', 3.0), ('obliczenia', 5.0)]
+        assert timer.total() == 8.0
+
+    def test_phase_recorded_on_exception(self):
+        timer = PhaseTimer()
+        with pytest.raises(RuntimeError):
+            with timer.phase('błąd'):
+                raise RuntimeError
+        assert 'błąd' in timer.phases
+
+    def test_report(self, capsys):
+        timer = PhaseTimer()
+        timer.add('start puli', 30.0)
+        timer.add('obliczenia', 10.0)
+        timer.print_report('Fazy')
+
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[0] == '  Fazy:'
+        assert lines[1].split() == ['start', 'puli', '30.0000', 'ms', '(', '75.0%)']
+        assert lines[2].split() == ['obliczenia', '10.0000', 'ms', '(', '25.0%)']
+
+    def test_report_of_zero_total(self, capsys):
+        timer = PhaseTimer()
+        timer.add('pusta', 0.0)
+        timer.print_report('Fazy')
+
+        assert '(  0.0%)' in capsys.readouterr().out
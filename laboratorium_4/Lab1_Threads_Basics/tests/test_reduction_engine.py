@@ -0,0 +1,96 @@
+import os
+import statistics
+
+import pytest
+from src.modules.csv_loader import load_numbers_array
+from src.modules.reduction_engine import (
+    BACKENDS, HistogramReduction, MinMaxReduction, Reduction, ReductionEngine,
+    StatisticsCalculator, SumReduction, WelfordReduction, np
+)
+
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'dane_wejsciowe')
+CSV_FILES = ['numbers1.csv', 'numbers2.csv', 'numbers3.csv', 'numbers4.csv']
+AVAILABLE_BACKENDS = [b for b in BACKENDS if b != 'vectorized' or np is not None]
+
+
+class TestReductionEngine:
+
+    @pytest.mark.parametrize('name', CSV_FILES)
+    def test_serial_matches_plain(self, name):
+        # load_numbers_array nie tworzy pliku podręcznego obok danych
+        numbers = list(load_numbers_array(os.path.join(DATA_DIR, name)))
+        result = ReductionEngine(StatisticsCalculator.create_reduction()).run(numbers)
+
+        assert result['suma'] == sum(numbers)
+        assert result['min_max'] == (min(numbers), max(numbers))
+        assert result['momenty']['liczność'] == len(numbers)
+        # Wariancja z modułu statistics (dwuprzebiegowa, w liczbach zmiennoprzecinkowych)
+        values = [float(x) for x in numbers]
+        assert result['momenty']['średnia'] == pytest.approx(statistics.fmean(values))
+        assert result['momenty']['wariancja'] == pytest.approx(statistics.pvariance(values))
+        assert result['momenty']['wariancja_próbkowa'] == pytest.approx(statistics.variance(values))
+        assert sum(result['histogram'].values()) == len(numbers)
+
+    @pytest.mark.parametrize('backend', AVAILABLE_BACKENDS)
+    def test_backends_agree(self, backend):
+        numbers = list(load_numbers_array(os.path.join(DATA_DIR, 'numbers1.csv')))
+        reduction = StatisticsCalculator.create_reduction()
+        expected = ReductionEngine(reduction, 'serial').run(numbers)
+        result = ReductionEngine(reduction, backend, workers=3).run(numbers)
+
+        assert result['suma'] == expected['suma']
+        assert result['min_max'] == expected['min_max']
+        assert result['histogram'] == expected['histogram']
+        assert result['momenty']['średnia'] == pytest.approx(expected['momenty']['średnia'])
+        assert result['momenty']['wariancja'] == pytest.approx(expected['momenty']['wariancja'])
+
+    @pytest.mark.parametrize('reduction', [
+        SumReduction(), MinMaxReduction(), WelfordReduction(), HistogramReduction(bin_width=50)
+    ])
+    def test_merge_associative_with_identity(self, reduction):
+        numbers = list(load_numbers_array(os.path.join(DATA_DIR, 'numbers2.csv')))
+        a, b, c = (reduction.accumulate(reduction.identity(), part)
+                   for part in (numbers[:1000], numbers[1000:1001], numbers[1001:]))
+        state = reduction.accumulate(reduction.identity(), numbers)
+
+        left = reduction.finalize(reduction.merge(reduction.merge(a, b), c))
+        right = reduction.finalize(reduction.merge(a, reduction.merge(b, c)))
+        whole = reduction.finalize(state)
+        with_identity = reduction.finalize(reduction.merge(reduction.identity(),
+                                                           reduction.merge(state, reduction.identity())))
+        assert left == pytest.approx(right)
+        assert left == pytest.approx(whole)
+        assert with_identity == pytest.approx(whole)
+
+    @pytest.mark.parametrize('backend', AVAILABLE_BACKENDS)
+    def test_empty_input(self, backend):
+        result = ReductionEngine(StatisticsCalculator.create_reduction(), backend, workers=2).run([])
+
+        assert result['suma'] == 0
+        assert result['min_max'] == (None, None)
+        assert result['momenty']['średnia'] is None
+        assert result['momenty']['wariancja'] is None
+        assert result['histogram'] == {}
+
+    def test_single_element(self):
+        result = ReductionEngine(WelfordReduction()).run([42])
+        assert result == {'liczność': 1, 'średnia': 42.0, 'wariancja': 0.0, 'wariancja_próbkowa': None}
+
+    @pytest.mark.skipif(np is None, reason="wymaga NumPy")
+    def test_sum_array_does_not_wrap(self):
+        # 3 * 2^62 nie mieści się w int64 - values.sum() dałoby wynik ujemny
+        values = np.array([2 ** 62, 2 ** 62, 2 ** 62, -5], dtype=np.int64)
+        reduction = SumReduction()
+
+        assert reduction.accumulate_array(reduction.identity(), values) == 3 * 2 ** 62 - 5
+        assert reduction.accumulate_array(reduction.identity(), values[3:]) == -5
+        assert ReductionEngine(reduction, 'vectorized').run(values) == 3 * 2 ** 62 - 5
+
+    def test_reduction_is_abstract(self):
+        with pytest.raises(TypeError):
+            Reduction()
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            ReductionEngine(SumReduction(), 'gpu')
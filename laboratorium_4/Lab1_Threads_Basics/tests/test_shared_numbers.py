@@ -0,0 +1,62 @@
+from array import array
+from multiprocessing import Pool, shared_memory
+
+import pytest
+from src.modules.multiprocess_sum_calculator import _worker_sum
+from src.modules.shared_numbers import SharedNumbers, shared_chunk
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+INPUTS = [list, lambda values: array('q', values)]
+if np is not None:
+    INPUTS.append(lambda values: np.array(values, dtype=np.int64))
+
+
+class TestSharedNumbers:
+
+    @pytest.mark.parametrize('make_input', INPUTS)
+    def test_chunks_cover_data(self, make_input):
+        numbers = [5, -3, 2 ** 40, 0, 77, -2 ** 35, 11, 9, 1, 4]
+        with SharedNumbers(make_input(numbers)) as shared:
+            chunks = []
+            for descriptor in shared.descriptors(3):
+                with shared_chunk(descriptor) as chunk:
+                    chunks.append(list(chunk))
+
+        # Podział 10 elementów na 3 fragmenty: 3 + 3 + 4
+        assert chunks == [numbers[0:3], numbers[3:6], numbers[6:10]]
+
+    def test_descriptors(self):
+        with SharedNumbers(list(range(10))) as shared:
+            assert shared.descriptors(3) == [(shared.name, 0, 3), (shared.name, 3, 3), (shared.name, 6, 4)]
+            assert shared.descriptors_of_size(4) == [(shared.name, 0, 4), (shared.name, 4, 4), (shared.name, 8, 2)]
+
+    def test_empty_input(self):
+        with SharedNumbers([]) as shared:
+            assert shared.length == 0
+            assert shared.descriptors_of_size(4) == []
+            for descriptor in shared.descriptors(2):
+                with shared_chunk(descriptor) as chunk:
+                    assert len(chunk) == 0
+
+    def test_block_removed_on_exit(self):
+        with SharedNumbers([1, 2, 3]) as shared:
+            name = shared.name
+        assert shared.shm is None
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+        # Ponowne zamknięcie nic nie robi
+        shared.close()
+
+    def test_read_by_pool_workers(self):
+        numbers = list(range(1, 1001))
+        with SharedNumbers(numbers) as shared:
+            with Pool(processes=2) as pool:
+                partial_sums = pool.map(_worker_sum, shared.descriptors_of_size(128))
+
+        # Suma 1..1000 = 1000 * 1001 / 2
+        assert sum(partial_sums) == 500500
+        assert len(partial_sums) == 8
@@ -0,0 +1,101 @@
+import multiprocessing
+import sys
+import threading
+
+import pytest
+from src.modules import start_method_benchmark
+from src.modules.heavy_computation_calculator import HeavyComputationCalculator
+from src.modules.multiprocess_sum_calculator import MultiprocessSumCalculator
+from src.modules.start_method_benchmark import StartMethodBenchmark
+from src.modules.start_methods import (
+    START_METHODS, available_start_methods, forkserver_preload, get_context, is_fork_safe, measure_startup
+)
+
+
+class TestStartMethods:
+
+    def test_available_methods(self):
+        methods = available_start_methods()
+        # Podzbiór obsługiwanych metod w kolejności START_METHODS
+        assert methods == [m for m in START_METHODS if m in multiprocessing.get_all_start_methods()]
+        assert 'spawn' in methods
+
+    @pytest.mark.parametrize('method', available_start_methods())
+    def test_get_context(self, method):
+        assert get_context(method).get_start_method() == method
+
+    def test_is_fork_safe(self):
+        assert is_fork_safe()
+
+        stop = threading.Event()
+        thread = threading.Thread(target=stop.wait)
+        thread.start()
+        try:
+            # Drugi wątek mógłby trzymać muteks w chwili fork
+            assert not is_fork_safe()
+        finally:
+            stop.set()
+            thread.join()
+        assert is_fork_safe()
+
+    def test_forkserver_preload(self):
+        preload = forkserver_preload()
+        modules = [name for name in preload if name != 'numpy']
+
+        assert 'src.modules.start_methods' in modules
+        assert modules == sorted(name for name in sys.modules if name.startswith('src.modules.'))
+        # NumPy na końcu listy - tylko gdy jest już wczytany
+        assert ('numpy' in preload) == ('numpy' in sys.modules)
+        if 'numpy' in preload:
+            assert preload[-1] == 'numpy'
+
+    def test_measure_startup(self):
+        startup_ms, close_ms = measure_startup('spawn', 2)
+        assert startup_ms > 0 and close_ms >= 0
+
+
+class TestCheapestMethod:
+
+    @pytest.fixture
+    def benchmark(self, monkeypatch):
+        # Wyniki pomiarów podstawione - zostaje sam wybór metody
+        costs = {
+            'fork': {'start_puli_ms': 5.0, 'zamknięcie_ms': 2.0, 'suma_ms': 10.0},
+            'spawn': {'start_puli_ms': 300.0, 'zamknięcie_ms': 50.0, 'suma_ms': 320.0},
+            'forkserver': {'start_puli_ms': 40.0, 'zamknięcie_ms': 5.0, 'suma_ms': 45.0},
+        }
+        measured = []
+
+        def fake_measure(self, method, shared):
+            measured.append(method)
+            return dict(costs[method], suma=0, wynik_ciężki=0.0, ciężkie_ms=1000.0)
+
+        monkeypatch.setattr(StartMethodBenchmark, '_measure', fake_measure)
+        monkeypatch.setattr(start_method_benchmark, 'available_start_methods', lambda: list(START_METHODS))
+        monkeypatch.setattr(start_method_benchmark, 'is_fork_safe', lambda: True)
+        calculator = MultiprocessSumCalculator()
+        calculator.numbers = [1, 2, 3]
+        benchmark = StartMethodBenchmark(calculator, HeavyComputationCalculator())
+        benchmark.measured = measured
+        return benchmark
+
+    def test_picks_cheapest_method(self, benchmark, capsys):
+        assert benchmark.run() == 'fork'
+        assert benchmark.mp_calc.start_method == benchmark.heavy_calc.start_method == 'fork'
+        assert benchmark.measured == ['fork', 'spawn', 'forkserver']
+
+    def test_skips_fork_with_threads(self, benchmark, monkeypatch, capsys):
+        monkeypatch.setattr(start_method_benchmark, 'is_fork_safe', lambda: False)
+
+        # Bez fork najtańszy jest forkserver: 40 + 5 + 45 ms
+        assert benchmark.run() == 'forkserver'
+        assert benchmark.measured == ['spawn', 'forkserver']
+        assert 'fork pominięty' in capsys.readouterr().out
+
+    def test_no_methods_keeps_previous(self, benchmark, monkeypatch, capsys):
+        monkeypatch.setattr(start_method_benchmark, 'available_start_methods', lambda: ['fork'])
+        monkeypatch.setattr(start_method_benchmark, 'is_fork_safe', lambda: False)
+        benchmark.mp_calc.start_method = 'spawn'
+
+        assert benchmark.run() == 'spawn'
+        assert benchmark.measured == []
@@ -0,0 +1,54 @@
+import os
+from array import array
+
+import pytest
+from src.modules import thread_sum_calculator
+from src.modules.csv_loader import load_numbers_array
+from src.modules.thread_sum_calculator import ThreadSumCalculator, np
+
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'dane_wejsciowe')
+
+
+class TestThreadSum:
+
+    @pytest.fixture
+    def calculator(self):
+        return ThreadSumCalculator()
+
+    @pytest.mark.parametrize('num_threads', [1, 2, 3, 8])
+    def test_python_kernel(self, calculator, num_threads):
+        numbers = load_numbers_array(os.path.join(DATA_DIR, 'numbers1.csv'))
+        # Suma liczb z numbers1.csv
+        assert calculator._threaded_sum(numbers, num_threads) == 4989990
+
+    @pytest.mark.skipif(np is None, reason="wymaga NumPy")
+    @pytest.mark.parametrize('name', ['numbers1.csv', 'numbers2.csv', 'numbers3.csv', 'numbers4.csv'])
+    @pytest.mark.parametrize('num_threads', [1, 2, 8])
+    def test_numpy_kernel_matches_python(self, calculator, name, num_threads):
+        numbers = load_numbers_array(os.path.join(DATA_DIR, name))
+        expected = ThreadSumCalculator._sequential_sum(numbers)
+
+        assert calculator._threaded_sum(numbers, num_threads, ThreadSumCalculator._numpy_partial_sum) == expected
+
+    @pytest.mark.skipif(np is None, reason="wymaga NumPy")
+    @pytest.mark.parametrize('numbers', [[], [7], [5, -3, 2 ** 40], array('q', range(-50, 51))])
+    def test_numpy_kernel_edge_inputs(self, calculator, numbers):
+        # Więcej wątków niż elementów - puste fragmenty dają sumę 0
+        assert calculator._threaded_sum(numbers, 8, ThreadSumCalculator._numpy_partial_sum) == sum(numbers)
+
+    @pytest.mark.skipif(np is None, reason="wymaga NumPy")
+    def test_numpy_kernel_returns_int(self):
+        results = [None]
+        ThreadSumCalculator._numpy_partial_sum(memoryview(array('q', [1, 2, 3])), results, 0)
+        assert results == [6] and type(results[0]) is int
+
+    @pytest.mark.skipif(np is None, reason="wymaga NumPy")
+    def test_run_nogil_scaled(self, calculator, capsys, monkeypatch):
+        # Dane powielone do SCALING_TARGET = 30 elementów: 3 * (0 + 1 + ... + 9) = 135
+        monkeypatch.setattr(thread_sum_calculator, 'SCALING_TARGET', 30)
+        calculator._run_nogil(array('q', range(10)))
+
+        out = capsys.readouterr().out
+        assert 'dane x3 (30 liczb)' in out
+        assert out.count('suma: 135') == 3
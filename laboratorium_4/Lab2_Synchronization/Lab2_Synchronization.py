@@ -5,10 +5,14 @@ Rozszerzenie zadania 1 o:
   - synchronizację dostępu (Lock) i wersję bez synchronizacji (race condition)
   - Logger zapisujący postępy do pliku
 Przetwarzanie dla 4 wątków/procesów.
+Opcja 5: zbiór danych — generator syntetycznych danych do testów skalowania.
+Opcja 6: wątki z lokalnymi akumulatorami — scalanie ze wspólnym stanem paczkami.
+Opcja 7: procesy na pamięci współdzielonej (bez Managera) — porównanie z opcją 3.
 """
 
 from src.modules.thread_sync_calculator import ThreadSyncCalculator
 from src.modules.process_sync_calculator import ProcessSyncCalculator
+from src.modules.dataset_generator import DatasetSelector
 from src.utils.menu import Menu
 
 
@@ -18,6 +22,7 @@ def main():
 
     thread_calc = ThreadSyncCalculator()
     process_calc = ProcessSyncCalculator()
+    dataset = DatasetSelector([thread_calc, process_calc])
 
     menu.add_option(
         '1',
@@ -43,6 +48,24 @@ def main():
         lambda: process_calc.run_unsynchronized(),
         display_order=4
     )
+    menu.add_option(
+        '5',
+        'Zbiór danych: wygeneruj syntetyczne dane (10^6 – 10^9 liczb) lub przywróć domyślne',
+        lambda: dataset.run(),
+        display_order=5
+    )
+    menu.add_option(
+        '6',
+        'threading.Thread (4 wątki) — Z synchronizacją, lokalne akumulatory (scalanie paczkami)',
+        lambda: thread_calc.run_batched(),
+        display_order=6
+    )
+    menu.add_option(
+        '7',
+        'multiprocessing.Process (4 procesy) — pamięć współdzielona, Lock tylko przy scalaniu',
+        lambda: process_calc.run_shared_memory(),
+        display_order=7
+    )
     menu.add_option(
         '0',
         'Wyjście',
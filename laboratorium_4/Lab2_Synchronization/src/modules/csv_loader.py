@@ -4,24 +4,216 @@ Wczytuje tablicę liczb całkowitych z plików CSV (separator: średnik).
 """
 
 import os
+import struct
+from array import array
 
+try:
+    import numpy as np
+except ImportError:  # NumPy jest opcjonalny - bez niego dane trafiają do array('q')
+    np = None
 
-def load_numbers_from_csv(filepath):
+# Plik podręczny obok CSV: nagłówek (znacznik, rozmiar i mtime CSV, liczba elementów) + int64
+CACHE_SUFFIX = '.i64'
+CACHE_MAGIC = b'CSVI64\x00\x01'
+CACHE_HEADER = struct.Struct('<8sqqq')
+# Zbiory binarne (generator danych): surowe liczby int64 bez nagłówka
+BINARY_SUFFIX = '.bin'
+# Zakres int64 - numpy.fromstring zamienia liczby spoza niego na wartości graniczne
+INT64_MIN, INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+
+def _read_csv_bytes(filepath):
     """
-    Wczytuje liczby całkowite z pliku CSV rozdzielone średnikiem.
+    Wczytuje zawartość pliku CSV jako bajty (bez białych znaków i średników na brzegach).
 
     Args:
         filepath (str): Ścieżka do pliku CSV.
 
     Returns:
-        list[int]: Lista liczb całkowitych wczytanych z pliku.
+        bytes: Zawartość pliku.
     """
     abs_path = os.path.abspath(filepath)
     if not os.path.exists(abs_path):
         raise FileNotFoundError(f"Nie znaleziono pliku: {abs_path}")
 
-    with open(abs_path, 'r') as f:
-        content = f.read().strip()
+    with open(abs_path, 'rb') as f:
+        return f.read().strip().strip(b';')
+
+
+def fromstring_int64(content):
+    """
+    Parsuje bajty 'a;b;c' przez numpy.fromstring (w C, bez obiektów int).
+
+    Returns:
+        numpy.ndarray | None: Tablica int64 albo None, gdy potrzebna jest wolniejsza
+        ścieżka: brak NumPy, puste pola między średnikami lub wartość graniczna int64
+        (fromstring po cichu nasyca liczby spoza zakresu zamiast zgłosić błąd).
+    """
+    if np is None:
+        return None
+    try:
+        values = np.fromstring(content, dtype=np.int64, sep=';')
+    except ValueError:
+        return None
+    if len(values) and (values.max() == INT64_MAX or values.min() == INT64_MIN):
+        return None
+    return values
+
+
+def load_numbers_array(filepath):
+    """
+    Wczytuje liczby całkowite z pliku CSV bezpośrednio do zwartego bufora int64.
+
+    Z NumPy tekst parsowany jest w C (numpy.fromstring), bez tworzenia obiektów int
+    dla każdej liczby - 8 bajtów na element zamiast ~36 w liście. Bez NumPy (lub gdy
+    plik zawiera puste pola albo wartość graniczną int64) liczby trafiają do array('q'),
+    który dla liczby spoza zakresu int64 zgłasza OverflowError.
+
+    Args:
+        filepath (str): Ścieżka do pliku CSV.
+
+    Returns:
+        numpy.ndarray | array.array: Tablica liczb int64.
+    """
+    content = _read_csv_bytes(filepath)
+
+    values = fromstring_int64(content)
+    if values is not None:
+        return values
+    return array('q', (int(x) for x in content.split(b';') if x.strip()))
+
+
+def _cache_path(filepath):
+    """Zwraca ścieżkę pliku podręcznego dla podanego pliku CSV."""
+    return os.path.abspath(filepath) + CACHE_SUFFIX
+
+
+def _read_cache(cache_path, source_stat, mmap_mode):
+    """
+    Wczytuje plik podręczny, jeśli odpowiada rozmiarowi i mtime pliku CSV.
+
+    Returns:
+        numpy.ndarray | array.array | None: Dane lub None, gdy plik jest nieaktualny.
+    """
+    try:
+        with open(cache_path, 'rb') as f:
+            magic, size, mtime_ns, count = CACHE_HEADER.unpack(f.read(CACHE_HEADER.size))
+            if (magic != CACHE_MAGIC or size != source_stat.st_size
+                    or mtime_ns != source_stat.st_mtime_ns
+                    or os.fstat(f.fileno()).st_size != CACHE_HEADER.size + 8 * count):
+                return None
+            if np is None:
+                numbers = array('q')
+                numbers.frombytes(f.read(count * numbers.itemsize))
+                return numbers
+    except (OSError, struct.error):
+        return None
+
+    if count == 0:
+        return np.empty(0, dtype=np.int64)
+    if mmap_mode:
+        return np.memmap(cache_path, dtype=np.int64, mode='r',
+                         offset=CACHE_HEADER.size, shape=(count,))
+    return np.fromfile(cache_path, dtype=np.int64, count=count, offset=CACHE_HEADER.size)
+
+
+def _write_cache(cache_path, source_stat, numbers):
+    """Zapisuje plik podręczny (atomowo - przez plik tymczasowy i os.replace)."""
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(CACHE_HEADER.pack(CACHE_MAGIC, source_stat.st_size,
+                                      source_stat.st_mtime_ns, len(numbers)))
+            f.write(numbers.tobytes())
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # Brak prawa zapisu (lub plik zajęty) - dane i tak są już wczytane
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def load_numbers_cached(filepath, mmap_mode=True):
+    """
+    Wczytuje liczby z pliku CSV, korzystając z binarnego pliku podręcznego obok CSV.
+
+    Przy pierwszym wywołaniu CSV jest parsowany (load_numbers_array), a wynik zapisywany
+    jako <plik>.csv.i64 z rozmiarem i mtime źródła. Kolejne wywołania (także w innych
+    procesach i kolejnych uruchomieniach) pomijają parsowanie - z NumPy plik jest
+    mapowany do pamięci (numpy.memmap, tylko do odczytu). Zmiana CSV unieważnia plik.
+
+    Args:
+        filepath (str): Ścieżka do pliku CSV.
+        mmap_mode (bool): Czy mapować plik podręczny zamiast wczytywać go do pamięci.
 
-    numbers = [int(x) for x in content.split(';') if x.strip()]
+    Returns:
+        numpy.ndarray | array.array: Tablica liczb int64.
+    """
+    abs_path = os.path.abspath(filepath)
+    if not os.path.exists(abs_path):
+        raise FileNotFoundError(f"Nie znaleziono pliku: {abs_path}")
+
+    source_stat = os.stat(abs_path)
+    cache_path = _cache_path(abs_path)
+
+    numbers = _read_cache(cache_path, source_stat, mmap_mode)
+    if numbers is None:
+        numbers = load_numbers_array(abs_path)
+        _write_cache(cache_path, source_stat, numbers)
     return numbers
+
+
+def load_numbers_binary(filepath, mmap_mode=True):
+    """
+    Wczytuje liczby z pliku binarnego (surowe int64, bez nagłówka).
+
+    Args:
+        filepath (str): Ścieżka do pliku .bin.
+        mmap_mode (bool): Czy mapować plik do pamięci (NumPy) zamiast go wczytywać.
+
+    Returns:
+        numpy.ndarray | array.array: Tablica liczb int64.
+    """
+    abs_path = os.path.abspath(filepath)
+    if not os.path.exists(abs_path):
+        raise FileNotFoundError(f"Nie znaleziono pliku: {abs_path}")
+
+    count = os.path.getsize(abs_path) // 8
+    if np is None:
+        numbers = array('q')
+        with open(abs_path, 'rb') as f:
+            numbers.frombytes(f.read(count * numbers.itemsize))
+        return numbers
+    if count == 0:
+        return np.empty(0, dtype=np.int64)
+    if mmap_mode:
+        return np.memmap(abs_path, dtype=np.int64, mode='r', shape=(count,))
+    return np.fromfile(abs_path, dtype=np.int64, count=count)
+
+
+def load_dataset(filepath, mmap_mode=True):
+    """
+    Wczytuje zbiór danych: plik binarny (.bin) lub CSV (przez plik podręczny).
+
+    Args:
+        filepath (str): Ścieżka do pliku .bin lub .csv.
+        mmap_mode (bool): Czy mapować dane do pamięci (NumPy).
+
+    Returns:
+        numpy.ndarray | array.array: Tablica liczb int64.
+    """
+    if filepath.endswith(BINARY_SUFFIX):
+        return load_numbers_binary(filepath, mmap_mode)
+    return load_numbers_cached(filepath, mmap_mode)
+
+
+def load_numbers_from_csv(filepath):
+    """
+    Wczytuje liczby całkowite z pliku CSV rozdzielone średnikiem.
+
+    Args:
+        filepath (str): Ścieżka do pliku CSV.
+
+    Returns:
+        list[int]: Lista liczb całkowitych wczytanych z pliku.
+    """
+    return load_numbers_cached(filepath).tolist()
@@ -0,0 +1,263 @@
+"""
+Generator syntetycznych zbiorów danych do testów skalowania (10^6 – 10^9 liczb).
+Konfigurowalne: liczba elementów, rozkład wartości, liczba plików, rozrzut rozmiarów
+plików oraz format (CSV z separatorem ';' lub binarny .bin — surowe int64).
+
+Dane generowane są blokami po BLOCK_ELEMENTS liczb w wielu procesach. Każdy blok ma
+własne ziarno wyprowadzone z (seed, numer pliku, numer bloku), więc wynik nie zależy
+od liczby procesów — ten sam seed daje te same pliki.
+"""
+
+import os
+import random
+import shutil
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from src.modules.csv_loader import BINARY_SUFFIX
+from src.validators.input_validator import InputValidator
+
+try:
+    import numpy as np
+except ImportError:  # NumPy jest opcjonalny - bez niego liczby losuje moduł random
+    np = None
+
+DISTRIBUTIONS = ('uniform', 'normal', 'exponential')
+FORMATS = ('csv', 'bin')
+# Liczba elementów w jednym bloku (jednym zadaniu procesu roboczego)
+BLOCK_ELEMENTS = 1 << 20
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'dane_wejsciowe')
+OUTPUT_DIR = os.path.join(DATA_DIR, 'wygenerowane')
+
+
+def file_counts(count, num_files, skew):
+    """
+    Dzieli count elementów (count >= num_files) między pliki; każdy plik dostaje
+    co najmniej jeden element, a reszta dzielona jest tak, że rozmiary maleją
+    geometrycznie i pierwszy plik jest skew razy większy od ostatniego (skew=1 - równe pliki).
+
+    Returns:
+        list[int]: Liczba elementów w każdym pliku.
+    """
+    if num_files == 1:
+        return [count]
+    weights = [skew ** (-i / (num_files - 1)) for i in range(num_files)]
+    total_weight = sum(weights)
+    counts = [1 + int((count - num_files) * w / total_weight) for w in weights]
+    counts[0] += count - sum(counts)
+    return counts
+
+
+def _block_values(seed, file_index, block_index, size, distribution, low, high):
+    """Losuje liczby jednego bloku (powtarzalnie dla danego seed, pliku i bloku)."""
+    if np is not None:
+        rng = np.random.default_rng([seed, file_index, block_index])
+        if distribution == 'uniform':
+            return rng.integers(low, high + 1, size=size, dtype=np.int64)
+        if distribution == 'normal':
+            values = rng.normal((low + high) / 2, (high - low) / 6, size=size)
+        else:
+            values = low + rng.exponential((high - low) / 5, size=size)
+        return np.clip(np.rint(values), low, high).astype(np.int64)
+
+    rng = random.Random(f"{seed}:{file_index}:{block_index}")
+    if distribution == 'uniform':
+        return array('q', (rng.randint(low, high) for _ in range(size)))
+    if distribution == 'normal':
+        values = (rng.gauss((low + high) / 2, (high - low) / 6) for _ in range(size))
+    else:
+        values = (low + rng.expovariate(5 / (high - low)) for _ in range(size))
+    return array('q', (min(max(round(v), low), high) for v in values))
+
+
+def _write_block(task):
+    """
+    Funkcja robocza — losuje blok i zapisuje go.
+    Plik binarny: bezpośrednio w docelowe miejsce pliku (stałe 8 bajtów na liczbę).
+    CSV: do pliku częściowego, łączonego potem w kolejności bloków.
+    """
+    path, fmt, seed, file_index, block_index, offset, size, distribution, low, high = task
+    values = _block_values(seed, file_index, block_index, size, distribution, low, high)
+
+    if fmt == 'bin':
+        with open(path, 'r+b') as f:
+            f.seek(offset * 8)
+            f.write(values.tobytes())
+        return None
+
+    part_path = f"{path}.part{block_index}"
+    text = ';'.join(map(str, values.tolist()))
+    with open(part_path, 'w', encoding='ascii') as f:
+        # Separator między blokami - plik nie kończy się średnikiem
+        f.write(text if block_index == 0 else ';' + text)
+    return part_path
+
+
+def generate_dataset(count, distribution='uniform', num_files=1, skew=1.0, fmt='csv',
+                     seed=0, low=1, high=1000, output_dir=OUTPUT_DIR, name=None, workers=None):
+    """
+    Generuje zbiór danych (jeden lub kilka plików).
+
+    Args:
+        count (int): Łączna liczba elementów.
+        distribution (str): 'uniform', 'normal' lub 'exponential'.
+        num_files (int): Liczba plików (nie większa niż count).
+        skew (float): Stosunek rozmiaru największego pliku do najmniejszego (>= 1).
+        fmt (str): 'csv' lub 'bin'.
+        seed (int): Ziarno generatora (>= 0).
+        low (int): Najmniejsza wartość.
+        high (int): Największa wartość.
+        output_dir (str): Katalog docelowy.
+        name (str): Prefiks nazw plików (domyślnie z parametrów).
+        workers (int): Liczba procesów (domyślnie liczba rdzeni).
+
+    Returns:
+        dict: {'pliki': ścieżki, 'liczności': elementy w plikach, 'czas_ms': czas generowania}.
+    """
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Nieznany rozkład: {distribution} (dostępne: {', '.join(DISTRIBUTIONS)})")
+    if fmt not in FORMATS:
+        raise ValueError(f"Nieznany format: {fmt} (dostępne: {', '.join(FORMATS)})")
+    if num_files < 1 or count < num_files or skew < 1 or low >= high or seed < 0:
+        raise ValueError("Wymagane: count >= num_files >= 1, skew >= 1, low < high, seed >= 0.")
+
+    start = time.perf_counter()
+    os.makedirs(output_dir, exist_ok=True)
+    name = name or f"dane_{count}_{distribution}_s{seed}"
+    extension = BINARY_SUFFIX if fmt == 'bin' else '.csv'
+    counts = file_counts(count, num_files, skew)
+    paths = [os.path.join(output_dir, f"{name}_{i + 1}{extension}") for i in range(num_files)]
+
+    tasks = []
+    for file_index, (path, file_count) in enumerate(zip(paths, counts)):
+        if fmt == 'bin':
+            # Plik o docelowym rozmiarze - procesy zapisują swoje bloki w miejscu
+            with open(path, 'wb') as f:
+                f.truncate(file_count * 8)
+        else:
+            open(path, 'wb').close()
+        for block_index, offset in enumerate(range(0, file_count, BLOCK_ELEMENTS)):
+            size = min(BLOCK_ELEMENTS, file_count - offset)
+            tasks.append((path, fmt, seed, file_index, block_index, offset, size,
+                          distribution, low, high))
+
+    workers = min(workers or os.cpu_count() or 1, max(len(tasks), 1))
+    if workers == 1:
+        part_paths = [_write_block(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            part_paths = list(executor.map(_write_block, tasks))
+
+    if fmt == 'csv':
+        # Łączenie części w kolejności bloków (zadania są uporządkowane po plikach i blokach)
+        for path in paths:
+            with open(path, 'wb') as out:
+                for task, part_path in zip(tasks, part_paths):
+                    if task[0] == path:
+                        with open(part_path, 'rb') as part:
+                            shutil.copyfileobj(part, out, 1 << 20)
+                        os.remove(part_path)
+
+    return {
+        'pliki': paths,
+        'liczności': counts,
+        'czas_ms': (time.perf_counter() - start) * 1000,
+    }
+
+
+class DatasetSelector:
+    """
+    Opcja menu "zbiór danych": generuje nowy zbiór lub przywraca domyślny
+    i przełącza na niego kalkulatory (DATA_FILE - pierwszy plik, file_paths - wszystkie).
+    """
+
+    def __init__(self, calculators):
+        """
+        Args:
+            calculators (list): Kalkulatory z atrybutem DATA_FILE i/lub file_paths;
+                pierwszy musi mieć DATA_FILE.
+        """
+        self.calculators = calculators
+        self.defaults = [(getattr(calc, 'DATA_FILE', None), list(getattr(calc, 'file_paths', [])))
+                         for calc in calculators]
+
+    @staticmethod
+    def _set_files(calc, data_file, file_paths):
+        """Ustawia pliki kalkulatora; dane wczytają się przy następnym uruchomieniu."""
+        if hasattr(calc, 'DATA_FILE'):
+            calc.DATA_FILE = data_file
+            calc.numbers = None
+        if hasattr(calc, 'file_paths'):
+            calc.file_paths = list(file_paths)
+
+    def use_files(self, paths):
+        """Przełącza kalkulatory na podane pliki."""
+        for calc in self.calculators:
+            self._set_files(calc, paths[0], paths)
+
+    def restore_defaults(self):
+        """Przywraca domyślne pliki z dane_wejsciowe."""
+        for calc, (data_file, file_paths) in zip(self.calculators, self.defaults):
+            self._set_files(calc, data_file, file_paths)
+
+    @staticmethod
+    def _choose(message, options):
+        """Pobiera wybór z listy opcji (numerowanej od 1)."""
+        for i, option in enumerate(options, start=1):
+            print(f"    {i}) {option}")
+
+        def validate(value):
+            if not 1 <= value <= len(options):
+                raise Exception(f"Wybierz liczbę od 1 do {len(options)}.")
+
+        return options[InputValidator.get_integer(message, validation_func=validate) - 1]
+
+    def run(self):
+        """Interaktywnie generuje zbiór danych i przełącza na niego kalkulatory."""
+        print("\n" + "-" * 60)
+        print("  Zbiór danych — generator syntetycznych danych")
+        print("-" * 60)
+        print(f"  Aktualny plik danych: {os.path.basename(self.calculators[0].DATA_FILE)}")
+
+        action = self._choose("  Wybór: ", ["wygeneruj nowy zbiór", "przywróć domyślne dane (numbers*.csv)"])
+        if action.startswith("przywróć"):
+            self.restore_defaults()
+            print("  Przywrócono domyślne dane.")
+            return
+
+        def positive(value):
+            if value < 1:
+                raise Exception("Wartość musi być dodatnia.")
+
+        def non_negative(value):
+            if value < 0:
+                raise Exception("Wartość nie może być ujemna.")
+
+        def files_for_count(value):
+            positive(value)
+            if value > count:
+                raise Exception(f"Liczba plików nie może przekraczać liczby elementów ({count}).")
+
+        count = InputValidator.get_integer("  Liczba elementów (np. 1000000): ", validation_func=positive)
+        distribution = self._choose("  Rozkład wartości: ", list(DISTRIBUTIONS))
+        num_files = InputValidator.get_integer("  Liczba plików: ", validation_func=files_for_count)
+        skew = 1
+        if num_files > 1:
+            skew = InputValidator.get_integer(
+                "  Ile razy największy plik ma być większy od najmniejszego (1 = równe): ",
+                validation_func=positive)
+        fmt = self._choose("  Format: ", list(FORMATS))
+        seed = InputValidator.get_integer("  Ziarno (seed, >= 0): ", validation_func=non_negative)
+
+        print("  Generuję...")
+        result = generate_dataset(count, distribution, num_files, skew, fmt, seed)
+        for path, file_count in zip(result['pliki'], result['liczności']):
+            size_mb = os.path.getsize(path) / (1024 * 1024)
+            print(f"    {os.path.basename(path)}: {file_count} liczb ({size_mb:.2f} MB)")
+        print(f"  Czas generowania: {result['czas_ms']:.2f} ms")
+
+        self.use_files(result['pliki'])
+        print(f"  [INFO] Kalkulatory używają teraz pliku {os.path.basename(result['pliki'][0])}"
+              f" (opcje wieloplikowe — wszystkich {len(result['pliki'])} plików).")
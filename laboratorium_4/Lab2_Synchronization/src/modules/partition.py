@@ -0,0 +1,78 @@
+"""
+Moduł podziału tablicy liczb na fragmenty.
+Jeden sposób podziału dla wątków i procesów: zakresy indeksów oraz widoki
+memoryview na wspólny bufor int64 (bez kopiowania danych).
+"""
+
+from array import array
+
+
+def chunk_ranges(n, num_chunks):
+    """
+    Dzieli n elementów na w przybliżeniu równe zakresy (ostatni zabiera resztę).
+
+    Args:
+        n (int): Liczba elementów.
+        num_chunks (int): Liczba fragmentów.
+
+    Returns:
+        list[tuple]: Zakresy (start, end).
+    """
+    chunk_size = n // num_chunks
+    ranges = []
+    for i in range(num_chunks):
+        start = i * chunk_size
+        end = start + chunk_size if i < num_chunks - 1 else n
+        ranges.append((start, end))
+    return ranges
+
+
+def chunk_ranges_of_size(n, chunk_size):
+    """
+    Dzieli n elementów na zakresy po chunk_size elementów (ostatni może być krótszy).
+
+    Args:
+        n (int): Liczba elementów.
+        chunk_size (int): Rozmiar fragmentu.
+
+    Returns:
+        list[tuple]: Zakresy (start, end).
+    """
+    return [(start, min(start + chunk_size, n)) for start in range(0, n, chunk_size)]
+
+
+def as_int64_view(numbers):
+    """
+    Zwraca memoryview liczb int64 na bufor tablicy.
+
+    Dla array('q') i tablic NumPy int64 widok nie kopiuje danych; lista jest
+    jednorazowo kopiowana do array('q'). Indeksowanie i iteracja widoku zwracają int.
+
+    Args:
+        numbers: Lista liczb, array('q'), tablica NumPy int64 lub memoryview.
+
+    Returns:
+        memoryview: Jednowymiarowy widok o formacie 'q'.
+    """
+    try:
+        view = memoryview(numbers)
+        if view.itemsize == 8 and view.format in ('q', 'l') and view.c_contiguous:
+            return view if view.format == 'q' else view.cast('B').cast('q')
+    except TypeError:
+        pass
+    return memoryview(array('q', numbers))
+
+
+def chunk_views(numbers, num_chunks):
+    """
+    Dzieli tablicę na fragmenty - widoki na wspólny bufor (bez kopiowania).
+
+    Args:
+        numbers: Tablica liczb (patrz as_int64_view).
+        num_chunks (int): Liczba fragmentów.
+
+    Returns:
+        list[tuple]: Trójki (start, end, widok fragmentu).
+    """
+    view = as_int64_view(numbers)
+    return [(start, end, view[start:end]) for start, end in chunk_ranges(len(view), num_chunks)]
@@ -1,17 +1,24 @@
 """
 Kalkulator sumy z użyciem multiprocessing.Process — wersja z synchronizacją i bez.
-Każdy proces zapisuje wyniki cząstkowe (sumę, średnią) do wspólnej listy (Manager).
+Każdy proces zapisuje wyniki cząstkowe (sumę, średnią) do swojego fragmentu
+kolumnowych buforów w pamięci współdzielonej; licznik jest współdzielony przez Manager.
 Logger zapisuje postępy do wspólnego pliku tekstowego.
 Przetwarzanie dla 4 procesów.
 
 multiprocessing omija GIL — race condition jest bardziej widoczny niż w threading.
+
+Wersja z pamięcią współdzieloną (RawArray/RawValue) nie używa Managera: każdy proces
+czyta swój fragment danych i sumuje lokalnie, a Lock bierze tylko raz — przy scalaniu
+wyniku do wspólnego licznika. Wersja z Managerem zostaje do porównania.
 """
 
 import os
 import time
 import multiprocessing
 
-from src.modules.csv_loader import load_numbers_from_csv
+from src.modules.csv_loader import load_dataset
+from src.modules.partition import chunk_ranges
+from src.modules.result_buffers import ResultBuffers
 
 NUM_PROCESSES = 4
 LOG_INTERVAL = 500
@@ -20,8 +27,7 @@ LOG_INTERVAL = 500
 # ---- Funkcje robocze procesów (muszą być na poziomie modułu) ----
 
 def _process_worker_sync(proc_id, numbers, start, end,
-                         shared_results, results_lock,
-                         shared_counter, counter_lock,
+                         buffers, shared_counter, counter_lock,
                          log_path, file_lock):
     """Funkcja procesu z synchronizacją (Lock)."""
     partial_sum = 0
@@ -30,13 +36,7 @@ def _process_worker_sync(proc_id, numbers, start, end,
         position = i - start + 1
         average = partial_sum / position
 
-        with results_lock:
-            shared_results.append({
-                'proc_id': proc_id,
-                'position': position,
-                'partial_sum': partial_sum,
-                'average': round(average, 2)
-            })
+        buffers.write(proc_id - 1, i, position, partial_sum, round(average, 2))
 
         with counter_lock:
             shared_counter['total_sum'] += numbers[i]
@@ -53,7 +53,7 @@ def _process_worker_sync(proc_id, numbers, start, end,
 
 
 def _process_worker_unsync(proc_id, numbers, start, end,
-                           shared_results, shared_counter,
+                           buffers, shared_counter,
                            log_path):
     """
     Funkcja procesu BEZ synchronizacji.
@@ -67,12 +67,7 @@ def _process_worker_unsync(proc_id, numbers, start, end,
         position = i - start + 1
         average = partial_sum / position
 
-        shared_results.append({
-            'proc_id': proc_id,
-            'position': position,
-            'partial_sum': partial_sum,
-            'average': round(average, 2)
-        })
+        buffers.write(proc_id - 1, i, position, partial_sum, round(average, 2))
 
         # Celowo nie-atomowa operacja read-modify-write
         # Każda operacja na Manager.dict to osobne wywołanie IPC,
@@ -91,11 +86,43 @@ def _process_worker_unsync(proc_id, numbers, start, end,
                 )
 
 
+def _process_worker_shared(proc_id, numbers, start, end,
+                           buffers, total_sum, total_count, merge_lock,
+                           log_path, file_lock):
+    """
+    Funkcja procesu w wersji z pamięcią współdzieloną.
+    Dane (RawArray) i bufory wyników są współdzielone, fragmenty się nie nakładają,
+    więc pętla działa bez blokad i bez IPC; Lock tylko przy scalaniu wyniku.
+    """
+    partial_sum = 0
+    for i, value in enumerate(numbers[start:end], start=start):
+        partial_sum += value
+        position = i - start + 1
+        average = partial_sum / position
+
+        buffers.write(proc_id - 1, i, position, partial_sum, round(average, 2))
+
+        if position % LOG_INTERVAL == 0 or position == (end - start):
+            with file_lock:
+                with open(log_path, 'a', encoding='utf-8') as f:
+                    f.write(
+                        f"Proces {proc_id}: poz={position:>5}, "
+                        f"suma_cząstkowa={partial_sum:>10}, "
+                        f"średnia={average:>10.2f}\n"
+                    )
+
+    with merge_lock:
+        total_sum.value += partial_sum
+        total_count.value += end - start
+
+
 class ProcessSyncCalculator:
     """
     Sumowanie z użyciem multiprocessing.Process (4 procesy).
-    Dwie wersje: z Lock (poprawna) i bez Lock (race condition).
-    Używa Manager() do współdzielenia listy i słownika między procesami.
+    Dwie wersje: z Lock (poprawna) i bez Lock (race condition) oraz poprawna
+    wersja z pamięcią współdzieloną zamiast Managera.
+    Używa Manager() do współdzielenia licznika (słownika) między procesami;
+    wyniki cząstkowe trafiają do kolumnowych buforów w pamięci współdzielonej.
     """
 
     DATA_FILE = os.path.join(
@@ -109,33 +136,40 @@ class ProcessSyncCalculator:
     def _load_data(self):
         """Wczytuje dane z CSV, jeśli jeszcze nie wczytano."""
         if self.numbers is None:
-            self.numbers = load_numbers_from_csv(self.DATA_FILE)
-            print(f"  Wczytano {len(self.numbers)} liczb z pliku CSV.")
+            self.numbers = load_dataset(self.DATA_FILE).tolist()
+            print(f"  Wczytano {len(self.numbers)} liczb z pliku {os.path.basename(self.DATA_FILE)}.")
 
-    def _run(self, use_lock):
-        """Wspólna logika dla obu wersji."""
+    def _run(self, use_lock, shared_memory=False):
+        """Wspólna logika dla wszystkich wersji."""
         self._load_data()
         numbers = self.numbers
         n = len(numbers)
-        chunk_size = n // NUM_PROCESSES
 
-        manager = multiprocessing.Manager()
-        shared_results = manager.list()
-        shared_counter = manager.dict({'total_sum': 0, 'count': 0})
+        ranges = chunk_ranges(n, NUM_PROCESSES)
+        buffers = ResultBuffers(ranges, shared=True)
+        if shared_memory:
+            manager = None
+            shared_numbers = multiprocessing.RawArray('q', numbers)
+            total_sum = multiprocessing.RawValue('q', 0)
+            total_count = multiprocessing.RawValue('q', 0)
+        else:
+            manager = multiprocessing.Manager()
+            shared_counter = manager.dict({'total_sum': 0, 'count': 0})
 
-        mode = "Z_LOCK" if use_lock else "BEZ_LOCK"
+        mode = ("PAMIEC_WSPOLNA" if shared_memory else "Z_LOCK") if use_lock else "BEZ_LOCK"
         log_name = f'log_process_{mode.lower()}.txt'
         log_path = os.path.abspath(os.path.join(self.LOG_DIR, log_name))
 
         print("\n" + "-" * 60)
-        if use_lock:
+        if shared_memory:
+            print(f"  multiprocessing.Process — pamięć współdzielona, Lock przy scalaniu — {NUM_PROCESSES} procesy")
+        elif use_lock:
             print(f"  multiprocessing.Process — Z synchronizacją (Lock) — {NUM_PROCESSES} procesy")
         else:
             print(f"  multiprocessing.Process — BEZ synchronizacji — {NUM_PROCESSES} procesy")
             print("  [UWAGA] Brak Lock — możliwy wyścig procesów (race condition)!")
         print("-" * 60)
 
-        results_lock = multiprocessing.Lock()
         counter_lock = multiprocessing.Lock()
         file_lock = multiprocessing.Lock()
 
@@ -147,23 +181,26 @@ class ProcessSyncCalculator:
         processes = []
         start_time = time.perf_counter()
 
-        for p_id in range(NUM_PROCESSES):
-            s = p_id * chunk_size
-            e = s + chunk_size if p_id < NUM_PROCESSES - 1 else n
-
-            if use_lock:
+        for p_id, (s, e) in enumerate(ranges):
+            if shared_memory:
+                p = multiprocessing.Process(
+                    target=_process_worker_shared,
+                    args=(p_id + 1, shared_numbers, s, e,
+                          buffers, total_sum, total_count, counter_lock,
+                          log_path, file_lock)
+                )
+            elif use_lock:
                 p = multiprocessing.Process(
                     target=_process_worker_sync,
                     args=(p_id + 1, numbers, s, e,
-                          shared_results, results_lock,
-                          shared_counter, counter_lock,
+                          buffers, shared_counter, counter_lock,
                           log_path, file_lock)
                 )
             else:
                 p = multiprocessing.Process(
                     target=_process_worker_unsync,
                     args=(p_id + 1, numbers, s, e,
-                          shared_results, shared_counter,
+                          buffers, shared_counter,
                           log_path)
                 )
             processes.append(p)
@@ -176,33 +213,37 @@ class ProcessSyncCalculator:
         elapsed = (time.perf_counter() - start_time) * 1000
         expected = sum(numbers)
 
+        if shared_memory:
+            actual, actual_count = total_sum.value, total_count.value
+        else:
+            actual, actual_count = shared_counter['total_sum'], shared_counter['count']
+            manager.shutdown()
+
         # Podsumowanie do pliku
         with open(log_path, 'a', encoding='utf-8') as f:
             f.write(f"\n{'='*50}\n")
             f.write(f"PODSUMOWANIE\n{'='*50}\n")
-            f.write(f"  Suma ze shared_counter: {shared_counter['total_sum']}\n")
-            f.write(f"  Licznik:                {shared_counter['count']} (oczekiwano: {n})\n")
+            f.write(f"  Suma ze shared_counter: {actual}\n")
+            f.write(f"  Licznik:                {actual_count} (oczekiwano: {n})\n")
             f.write(f"  Suma oczekiwana:        {expected}\n")
 
-        # Wyniki cząstkowe procesów
-        results_list = list(shared_results)
-        proc_final = {}
-        for entry in results_list:
-            proc_final[entry['proc_id']] = entry
-
+        # Wyniki cząstkowe procesów (ostatni wpis każdego)
         print(f"\n  Wyniki cząstkowe procesów:")
-        for pid in sorted(proc_final.keys()):
-            e = proc_final[pid]
-            print(f"    Proces {pid}: suma = {e['partial_sum']:>10}, "
-                  f"średnia = {e['average']:>10.2f}")
-
-        actual = shared_counter['total_sum']
-        actual_count = shared_counter['count']
-
-        print(f"\n  Wpisów we wspólnej liście: {len(results_list)}")
+        for p_id in range(len(ranges)):
+            row = buffers.last_row(p_id)
+            if row is not None:
+                print(f"    Proces {row.worker_id}: suma = {row.partial_sum:>10}, "
+                      f"średnia = {row.average:>10.2f}")
+
+        print(f"\n  Wpisów w buforach wyników: {len(buffers)} "
+              f"({buffers.nbytes / 1024:.1f} KB)")
         print(f"  Suma (shared_counter):  {actual}")
         print(f"  Licznik elementów:      {actual_count} (oczekiwano: {n})")
         print(f"  Suma oczekiwana:        {expected}")
+        if use_lock:
+            # Przejęcia counter_lock (bez blokady pliku logu)
+            lock_ops = len(ranges) if shared_memory else n
+            print(f"  Przejęć blokady licznika: {lock_ops}")
 
         if actual != expected:
             lost = expected - actual
@@ -217,6 +258,10 @@ class ProcessSyncCalculator:
         """Wersja Z synchronizacją."""
         self._run(use_lock=True)
 
+    def run_shared_memory(self):
+        """Wersja z pamięcią współdzieloną (bez Managera), Lock tylko przy scalaniu."""
+        self._run(use_lock=True, shared_memory=True)
+
     def run_unsynchronized(self):
         """Wersja BEZ synchronizacji."""
         self._run(use_lock=False)
@@ -0,0 +1,94 @@
+"""
+Kolumnowe bufory wyników cząstkowych (pozycja, suma cząstkowa, średnia).
+Zamiast wspólnej listy słowników (kilkaset bajtów na wpis, dopisywanie pod Lock)
+każda kolumna to prealokowana tablica typu prostego — 24 bajty na wpis.
+Każdy wątek/proces zapisuje tylko swój fragment [start, end), więc zapis nie wymaga
+blokady. Wiersze do raportu tworzone są leniwie, dopiero przy odczycie.
+"""
+
+import multiprocessing
+from array import array
+
+# Bajty na wpis: pozycja (int64) + suma cząstkowa (int64) + średnia (double)
+ROW_BYTES = 8 + 8 + 8
+
+
+class ResultRow:
+    """Leniwy widok jednego wpisu — wartości czytane z kolumn przy dostępie."""
+
+    __slots__ = ('buffers', 'index', 'worker_id')
+
+    def __init__(self, buffers, index, worker_id):
+        self.buffers = buffers
+        self.index = index
+        self.worker_id = worker_id
+
+    @property
+    def position(self):
+        return self.buffers.positions[self.index]
+
+    @property
+    def partial_sum(self):
+        return self.buffers.partial_sums[self.index]
+
+    @property
+    def average(self):
+        return self.buffers.averages[self.index]
+
+
+class ResultBuffers:
+    """
+    Bufory wyników dla workerów przetwarzających fragmenty ranges.
+    Wersja shared=True alokuje kolumny w pamięci współdzielonej
+    (multiprocessing.RawArray), więc mogą je zapisywać procesy potomne.
+    """
+
+    def __init__(self, ranges, shared=False):
+        """
+        Args:
+            ranges (list[tuple]): Fragmenty (start, end) kolejnych workerów.
+            shared (bool): Czy alokować w pamięci współdzielonej (dla procesów).
+        """
+        self.ranges = list(ranges)
+        n = self.ranges[-1][1] if self.ranges else 0
+        self.positions = self._allocate('q', n, shared)
+        self.partial_sums = self._allocate('q', n, shared)
+        self.averages = self._allocate('d', n, shared)
+        # Liczba zapisanych wpisów każdego workera (każdy zapisuje tylko swój licznik)
+        self.filled = self._allocate('q', len(self.ranges), shared)
+
+    @staticmethod
+    def _allocate(typecode, size, shared):
+        """Tworzy wyzerowaną tablicę o podanym typie i rozmiarze."""
+        if shared:
+            return multiprocessing.RawArray(typecode, size)
+        return array(typecode, bytes(size * array(typecode).itemsize))
+
+    def write(self, worker_index, index, position, partial_sum, average):
+        """Zapisuje wpis pod indeksem index (z fragmentu workera worker_index)."""
+        self.positions[index] = position
+        self.partial_sums[index] = partial_sum
+        self.averages[index] = average
+        self.filled[worker_index] = position
+
+    def __len__(self):
+        """Łączna liczba zapisanych wpisów."""
+        return sum(self.filled)
+
+    @property
+    def nbytes(self):
+        """Rozmiar kolumn w bajtach."""
+        return len(self.positions) * ROW_BYTES
+
+    def rows(self, worker_index):
+        """Leniwe widoki zapisanych wpisów workera."""
+        start = self.ranges[worker_index][0]
+        for index in range(start, start + self.filled[worker_index]):
+            yield ResultRow(self, index, worker_index + 1)
+
+    def last_row(self, worker_index):
+        """Ostatni zapisany wpis workera lub None."""
+        count = self.filled[worker_index]
+        if count == 0:
+            return None
+        return ResultRow(self, self.ranges[worker_index][0] + count - 1, worker_index + 1)
@@ -1,6 +1,7 @@
 """
 Kalkulator sumy z użyciem threading.Thread — wersja z synchronizacją i bez.
-Każdy wątek zapisuje wyniki cząstkowe (sumę, średnią) do wspólnej listy.
+Każdy wątek zapisuje wyniki cząstkowe (sumę, średnią) do swojego fragmentu
+kolumnowych buforów wyników (bez blokady — fragmenty się nie nakładają).
 Logger zapisuje postępy do wspólnego pliku tekstowego.
 Przetwarzanie dla 4 wątków.
 """
@@ -9,16 +10,21 @@ import os
 import threading
 import time
 
-from src.modules.csv_loader import load_numbers_from_csv
+from src.modules.csv_loader import load_dataset
+from src.modules.partition import as_int64_view, chunk_ranges
+from src.modules.result_buffers import ResultBuffers
 
 NUM_THREADS = 4
 LOG_INTERVAL = 500
+# Co ile elementów wątek scala lokalne akumulatory ze wspólnym licznikiem (wersja z paczkami)
+BATCH_SIZE = 1000
 
 
 class ThreadSyncCalculator:
     """
     Sumowanie z użyciem threading.Thread (4 wątki).
     Dwie wersje: z Lock (poprawna) i bez Lock (race condition).
+    Wersja z Lock ma wariant z lokalnymi akumulatorami scalanymi paczkami.
     """
 
     DATA_FILE = os.path.join(
@@ -30,10 +36,10 @@ class ThreadSyncCalculator:
         self.numbers = None
 
     def _load_data(self):
-        """Wczytuje dane z CSV, jeśli jeszcze nie wczytano."""
+        """Wczytuje dane z CSV (jako widok int64), jeśli jeszcze nie wczytano."""
         if self.numbers is None:
-            self.numbers = load_numbers_from_csv(self.DATA_FILE)
-            print(f"  Wczytano {len(self.numbers)} liczb z pliku CSV.")
+            self.numbers = as_int64_view(load_dataset(self.DATA_FILE))
+            print(f"  Wczytano {len(self.numbers)} liczb z pliku {os.path.basename(self.DATA_FILE)}.")
 
     # -----------------------------------------------------------------
     #  Funkcje robocze wątków
@@ -41,8 +47,7 @@ class ThreadSyncCalculator:
 
     @staticmethod
     def _worker_sync(thread_id, numbers, start, end,
-                     shared_results, results_lock,
-                     shared_counter, counter_lock,
+                     buffers, shared_counter, counter_lock,
                      log_file, file_lock):
         """Funkcja wątku Z synchronizacją (Lock)."""
         partial_sum = 0
@@ -51,13 +56,7 @@ class ThreadSyncCalculator:
             position = i - start + 1
             average = partial_sum / position
 
-            with results_lock:
-                shared_results.append({
-                    'thread_id': thread_id,
-                    'position': position,
-                    'partial_sum': partial_sum,
-                    'average': round(average, 2)
-                })
+            buffers.write(thread_id - 1, i, position, partial_sum, round(average, 2))
 
             with counter_lock:
                 shared_counter['total_sum'] += numbers[i]
@@ -71,9 +70,47 @@ class ThreadSyncCalculator:
                         f"średnia={average:>10.2f}\n"
                     )
 
+    @staticmethod
+    def _worker_batched(thread_id, numbers, start, end,
+                        buffers, shared_counter, counter_lock,
+                        log_file, file_lock):
+        """
+        Funkcja wątku Z synchronizacją, z lokalnymi akumulatorami.
+        Przyrosty licznika zbierane są lokalnie i scalane pod Lock co BATCH_SIZE
+        elementów oraz na końcu — 1 przejęcie blokady na paczkę zamiast 1 na element.
+        Stan końcowy jest taki sam jak w _worker_sync.
+        """
+        partial_sum = 0
+        batch_sum = 0
+        batch_count = 0
+        for i in range(start, end):
+            value = numbers[i]
+            partial_sum += value
+            batch_sum += value
+            batch_count += 1
+            position = i - start + 1
+            average = partial_sum / position
+
+            buffers.write(thread_id - 1, i, position, partial_sum, round(average, 2))
+
+            if batch_count == BATCH_SIZE or position == (end - start):
+                with counter_lock:
+                    shared_counter['total_sum'] += batch_sum
+                    shared_counter['count'] += batch_count
+                batch_sum = 0
+                batch_count = 0
+
+            if position % LOG_INTERVAL == 0 or position == (end - start):
+                with file_lock:
+                    log_file.write(
+                        f"Wątek {thread_id}: poz={position:>5}, "
+                        f"suma_cząstkowa={partial_sum:>10}, "
+                        f"średnia={average:>10.2f}\n"
+                    )
+
     @staticmethod
     def _worker_unsync(thread_id, numbers, start, end,
-                       shared_results, shared_counter,
+                       buffers, shared_counter,
                        log_file):
         """
         Funkcja wątku BEZ synchronizacji.
@@ -86,12 +123,7 @@ class ThreadSyncCalculator:
             position = i - start + 1
             average = partial_sum / position
 
-            shared_results.append({
-                'thread_id': thread_id,
-                'position': position,
-                'partial_sum': partial_sum,
-                'average': round(average, 2)
-            })
+            buffers.write(thread_id - 1, i, position, partial_sum, round(average, 2))
 
             # Celowo nie-atomowa operacja read-modify-write
             current_sum = shared_counter['total_sum']
@@ -111,22 +143,24 @@ class ThreadSyncCalculator:
     #  Uruchomienie
     # -----------------------------------------------------------------
 
-    def _run(self, use_lock):
-        """Wspólna logika dla obu wersji."""
+    def _run(self, use_lock, batched=False):
+        """Wspólna logika dla wszystkich wersji."""
         self._load_data()
         numbers = self.numbers
         n = len(numbers)
-        chunk_size = n // NUM_THREADS
 
-        shared_results = []
+        ranges = chunk_ranges(n, NUM_THREADS)
+        buffers = ResultBuffers(ranges)
         shared_counter = {'total_sum': 0, 'count': 0}
 
-        mode = "Z_LOCK" if use_lock else "BEZ_LOCK"
+        mode = ("Z_LOCK_PACZKI" if batched else "Z_LOCK") if use_lock else "BEZ_LOCK"
         log_name = f'log_thread_{mode.lower()}.txt'
         log_path = os.path.join(self.LOG_DIR, log_name)
 
         print("\n" + "-" * 60)
-        if use_lock:
+        if batched:
+            print(f"  threading.Thread — Z synchronizacją (Lock), scalanie co {BATCH_SIZE} el. — {NUM_THREADS} wątki")
+        elif use_lock:
             print(f"  threading.Thread — Z synchronizacją (Lock) — {NUM_THREADS} wątki")
         else:
             print(f"  threading.Thread — BEZ synchronizacji — {NUM_THREADS} wątki")
@@ -134,7 +168,6 @@ class ThreadSyncCalculator:
             print("  Proszę czekać... (sleep(0) wymusza przełączanie kontekstu)")
         print("-" * 60)
 
-        results_lock = threading.Lock()
         counter_lock = threading.Lock()
         file_lock = threading.Lock()
         threads = []
@@ -145,23 +178,19 @@ class ThreadSyncCalculator:
             log_file.write(f"=== LOG: threading.Thread — {mode} ===\n")
             log_file.write(f"Wątków: {NUM_THREADS}, elementów: {n}\n\n")
 
-            for t_id in range(NUM_THREADS):
-                s = t_id * chunk_size
-                e = s + chunk_size if t_id < NUM_THREADS - 1 else n
-
+            for t_id, (s, e) in enumerate(ranges):
                 if use_lock:
                     t = threading.Thread(
-                        target=self._worker_sync,
+                        target=self._worker_batched if batched else self._worker_sync,
                         args=(t_id + 1, numbers, s, e,
-                              shared_results, results_lock,
-                              shared_counter, counter_lock,
+                              buffers, shared_counter, counter_lock,
                               log_file, file_lock)
                     )
                 else:
                     t = threading.Thread(
                         target=self._worker_unsync,
                         args=(t_id + 1, numbers, s, e,
-                              shared_results, shared_counter,
+                              buffers, shared_counter,
                               log_file)
                     )
                 threads.append(t)
@@ -182,23 +211,28 @@ class ThreadSyncCalculator:
             log_file.write(f"  Suma oczekiwana:        {expected}\n")
 
         # Wyniki cząstkowe wątków (ostatni wpis każdego)
-        thread_final = {}
-        for entry in shared_results:
-            thread_final[entry['thread_id']] = entry
-
         print(f"\n  Wyniki cząstkowe wątków:")
-        for tid in sorted(thread_final.keys()):
-            e = thread_final[tid]
-            print(f"    Wątek {tid}: suma = {e['partial_sum']:>10}, "
-                  f"średnia = {e['average']:>10.2f}")
+        for t_id in range(len(ranges)):
+            row = buffers.last_row(t_id)
+            if row is not None:
+                print(f"    Wątek {row.worker_id}: suma = {row.partial_sum:>10}, "
+                      f"średnia = {row.average:>10.2f}")
 
         actual = shared_counter['total_sum']
         actual_count = shared_counter['count']
 
-        print(f"\n  Wpisów we wspólnej liście: {len(shared_results)}")
+        print(f"\n  Wpisów w buforach wyników: {len(buffers)} "
+              f"({buffers.nbytes / 1024:.1f} KB)")
         print(f"  Suma (shared_counter):  {actual}")
         print(f"  Licznik elementów:      {actual_count} (oczekiwano: {n})")
         print(f"  Suma oczekiwana:        {expected}")
+        if use_lock:
+            # Przejęcia counter_lock (bez blokady pliku logu)
+            if batched:
+                lock_ops = sum(-(-(e - s) // BATCH_SIZE) for s, e in ranges)
+            else:
+                lock_ops = n
+            print(f"  Przejęć blokady licznika: {lock_ops}")
 
         if actual != expected:
             lost = expected - actual
@@ -213,6 +247,10 @@ class ThreadSyncCalculator:
         """Wersja Z synchronizacją."""
         self._run(use_lock=True)
 
+    def run_batched(self):
+        """Wersja Z synchronizacją, z lokalnymi akumulatorami scalanymi paczkami."""
+        self._run(use_lock=True, batched=True)
+
     def run_unsynchronized(self):
         """Wersja BEZ synchronizacji."""
         self._run(use_lock=False)
@@ -0,0 +1,40 @@
+import pytest
+from src.modules.process_sync_calculator import ProcessSyncCalculator
+
+
+class TestProcessSyncRun:
+
+    @pytest.fixture
+    def calculator(self, tmp_path, monkeypatch):
+        # Logi trafiają do katalogu tymczasowego zamiast katalogu projektu
+        monkeypatch.setattr(ProcessSyncCalculator, 'LOG_DIR', str(tmp_path))
+        return ProcessSyncCalculator()
+
+    def test_shared_memory_sum_and_count(self, calculator, tmp_path, capsys):
+        calculator._run(use_lock=True, shared_memory=True)
+
+        out = capsys.readouterr().out
+        # Suma liczb z numbers1.csv, 10 000 elementów
+        assert 'Suma (shared_counter):  4989990' in out
+        assert 'Licznik elementów:      10000 (oczekiwano: 10000)' in out
+        assert 'Zgodność: TAK' in out
+        # Lock tylko przy scalaniu - 1 przejęcie na proces
+        assert 'Przejęć blokady licznika: 4' in out
+
+        log = (tmp_path / 'log_process_pamiec_wspolna.txt').read_text(encoding='utf-8')
+        assert 'Suma ze shared_counter: 4989990' in log
+        assert 'Licznik:                10000 (oczekiwano: 10000)' in log
+        # Każdy proces dopisuje do logu ostatnią pozycję swojego fragmentu
+        for p_id in range(1, 5):
+            assert f'Proces {p_id}: poz= 2500' in log
+
+    @pytest.mark.parametrize('shared_memory', [False, True])
+    def test_small_input(self, calculator, capsys, shared_memory):
+        # Mniej elementów niż procesów - wszystko trafia do ostatniego fragmentu
+        calculator.numbers = [5, -2, 7]
+        calculator._run(use_lock=True, shared_memory=shared_memory)
+
+        out = capsys.readouterr().out
+        assert 'Suma (shared_counter):  10' in out
+        assert 'Licznik elementów:      3 (oczekiwano: 3)' in out
+        assert 'Proces 4: suma =         10' in out
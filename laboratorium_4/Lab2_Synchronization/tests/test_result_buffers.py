@@ -0,0 +1,101 @@
+import io
+import multiprocessing
+import threading
+
+import pytest
+from src.modules.partition import chunk_ranges
+from src.modules.result_buffers import ROW_BYTES, ResultBuffers
+from src.modules.thread_sync_calculator import BATCH_SIZE, ThreadSyncCalculator
+
+
+def fill_slice(buffers, worker_index):
+    # Funkcja procesu - zapisuje cały fragment workera (sumy kolejnych pozycji)
+    start, end = buffers.ranges[worker_index]
+    partial_sum = 0
+    for i in range(start, end):
+        partial_sum += i
+        position = i - start + 1
+        buffers.write(worker_index, i, position, partial_sum, round(partial_sum / position, 2))
+
+
+class TestResultBuffers:
+
+    @pytest.fixture
+    def ranges(self):
+        return chunk_ranges(10, 3)
+
+    def test_empty_buffers(self, ranges):
+        buffers = ResultBuffers(ranges)
+        assert len(buffers) == 0
+        assert buffers.nbytes == 10 * ROW_BYTES
+        assert [buffers.last_row(w) for w in range(len(ranges))] == [None, None, None]
+        assert list(buffers.rows(0)) == []
+
+    def test_rows_are_views_of_columns(self, ranges):
+        buffers = ResultBuffers(ranges)
+        start = ranges[1][0]
+        buffers.write(1, start, 1, 7, 7.0)
+        buffers.write(1, start + 1, 2, 10, 5.0)
+
+        rows = list(buffers.rows(1))
+        assert len(buffers) == 2
+        assert [(r.worker_id, r.position, r.partial_sum, r.average) for r in rows] == [(2, 1, 7, 7.0), (2, 2, 10, 5.0)]
+        # Widok czyta kolumny przy dostępie - późniejszy zapis jest widoczny
+        buffers.write(1, start + 1, 2, 11, 5.5)
+        assert (rows[1].partial_sum, rows[1].average) == (11, 5.5)
+
+    @pytest.mark.parametrize('shared', [False, True])
+    def test_workers_fill_own_slices(self, ranges, shared):
+        buffers = ResultBuffers(ranges, shared=shared)
+        threads = [threading.Thread(target=fill_slice, args=(buffers, w)) for w in range(len(ranges))]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(buffers) == 10
+        last = [buffers.last_row(w) for w in range(len(ranges))]
+        # Fragmenty [0, 3), [3, 6), [6, 10): sumy 0+1+2, 3+4+5, 6+7+8+9
+        assert [(r.position, r.partial_sum, r.average) for r in last] == [(3, 3, 1.0), (3, 12, 4.0), (4, 30, 7.5)]
+
+    def test_shared_buffers_written_by_processes(self, ranges):
+        buffers = ResultBuffers(ranges, shared=True)
+        processes = [multiprocessing.Process(target=fill_slice, args=(buffers, w)) for w in range(len(ranges))]
+        for p in processes:
+            p.start()
+        for p in processes:
+            p.join()
+
+        assert len(buffers) == 10
+        last = [buffers.last_row(w) for w in range(len(ranges))]
+        # Fragmenty [0, 3), [3, 6), [6, 10): sumy 0+1+2, 3+4+5, 6+7+8+9
+        assert [(r.position, r.partial_sum, r.average) for r in last] == [(3, 3, 1.0), (3, 12, 4.0), (4, 30, 7.5)]
+
+
+class TestThreadSyncWorkers:
+
+    def run_workers(self, worker, numbers, num_threads=4):
+        ranges = chunk_ranges(len(numbers), num_threads)
+        buffers = ResultBuffers(ranges)
+        counter = {'total_sum': 0, 'count': 0}
+        counter_lock, file_lock = threading.Lock(), threading.Lock()
+        log = io.StringIO()
+        threads = [threading.Thread(target=worker, args=(t + 1, numbers, s, e, buffers, counter,
+                                                          counter_lock, log, file_lock))
+                   for t, (s, e) in enumerate(ranges)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return buffers, counter
+
+    @pytest.mark.parametrize('n', [0, 1, 7, BATCH_SIZE, 3 * BATCH_SIZE + 5])
+    def test_batched_matches_per_element_lock(self, n):
+        numbers = [(i * 37) % 1000 for i in range(n)]
+        sync_buffers, sync_counter = self.run_workers(ThreadSyncCalculator._worker_sync, numbers)
+        batched_buffers, batched_counter = self.run_workers(ThreadSyncCalculator._worker_batched, numbers)
+
+        assert sync_counter == batched_counter == {'total_sum': sum(numbers), 'count': n}
+        assert len(sync_buffers) == len(batched_buffers) == n
+        assert list(sync_buffers.partial_sums) == list(batched_buffers.partial_sums)
+        assert list(sync_buffers.averages) == list(batched_buffers.averages)
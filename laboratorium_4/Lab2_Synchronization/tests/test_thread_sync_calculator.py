@@ -0,0 +1,43 @@
+import pytest
+from src.modules.thread_sync_calculator import ThreadSyncCalculator
+
+
+class TestThreadSyncRun:
+
+    @pytest.fixture
+    def calculator(self, tmp_path, monkeypatch):
+        # Logi trafiają do katalogu tymczasowego zamiast katalogu projektu
+        monkeypatch.setattr(ThreadSyncCalculator, 'LOG_DIR', str(tmp_path))
+        return ThreadSyncCalculator()
+
+    @pytest.mark.parametrize('batched', [False, True])
+    def test_synchronized_sum_and_count(self, calculator, tmp_path, capsys, batched):
+        calculator._run(use_lock=True, batched=batched)
+
+        out = capsys.readouterr().out
+        # Suma liczb z numbers1.csv, 10 000 elementów
+        assert 'Suma (shared_counter):  4989990' in out
+        assert 'Licznik elementów:      10000 (oczekiwano: 10000)' in out
+        assert 'Zgodność: TAK' in out
+
+        log_name = 'log_thread_z_lock_paczki.txt' if batched else 'log_thread_z_lock.txt'
+        log = (tmp_path / log_name).read_text(encoding='utf-8')
+        assert 'Suma ze shared_counter: 4989990' in log
+        assert 'Licznik:                10000 (oczekiwano: 10000)' in log
+
+    def test_batched_lock_acquisitions(self, calculator, capsys):
+        calculator._run(use_lock=True, batched=True)
+
+        # 4 fragmenty po 2500 el., paczki po 1000 - 3 scalenia na wątek
+        assert 'Przejęć blokady licznika: 12' in capsys.readouterr().out
+
+    def test_small_input(self, calculator, capsys):
+        # Mniej elementów niż wątków - wszystko trafia do ostatniego fragmentu,
+        # puste fragmenty niczego nie scalają
+        calculator.numbers = [5, -2, 7]
+        calculator._run(use_lock=True, batched=True)
+
+        out = capsys.readouterr().out
+        assert 'Suma (shared_counter):  10' in out
+        assert 'Licznik elementów:      3 (oczekiwano: 3)' in out
+        assert 'Przejęć blokady licznika: 1' in out
@@ -4,11 +4,17 @@ Odpowiednik C# Task Parallel Library w Pythonie:
   1) Parallel.For — sumowanie tablicy (ProcessPoolExecutor)
   2) Parallel.ForEach — przetwarzanie wielu plików CSV równolegle
   3) Pełny benchmark metod z zadań 1-3 + zapis logu
+  4) Parallel.For w trybie auto — dobór sekwencyjnie/równolegle, workerów i fragmentu
+  5) Porównanie metod startu procesów (fork/spawn/forkserver) i wybór najtańszej
+  6) Duży plik CSV — agregacja zakresami bajtów w wielu procesach
+  7) Zbiór danych — generator syntetycznych danych do testów skalowania
 """
 
 from src.modules.parallel_for_calculator import ParallelForCalculator
 from src.modules.parallel_foreach_calculator import ParallelForEachCalculator
 from src.modules.benchmark_runner import BenchmarkRunner
+from src.modules.dataset_generator import DatasetSelector
+from src.modules.start_method_benchmark import StartMethodBenchmark
 from src.utils.menu import Menu
 
 
@@ -19,6 +25,8 @@ def main():
     pfor_calc = ParallelForCalculator()
     pforeach_calc = ParallelForEachCalculator()
     benchmark = BenchmarkRunner()
+    start_benchmark = StartMethodBenchmark(pfor_calc)
+    dataset = DatasetSelector([pfor_calc, pforeach_calc, benchmark])
 
     menu.add_option(
         '1',
@@ -28,7 +36,7 @@ def main():
     )
     menu.add_option(
         '2',
-        'Parallel.ForEach — przetwarzanie 4 plików CSV równolegle',
+        'Parallel.ForEach — przetwarzanie plików równolegle (domyślnie 4 CSV)',
         lambda: pforeach_calc.run(),
         display_order=2
     )
@@ -38,6 +46,30 @@ def main():
         lambda: benchmark.run(),
         display_order=3
     )
+    menu.add_option(
+        '4',
+        'Parallel.For — tryb auto (pomiar narzutów, dobór workerów i fragmentu)',
+        lambda: pfor_calc.run_auto(),
+        display_order=4
+    )
+    menu.add_option(
+        '5',
+        'Metody startu procesów: fork / spawn / forkserver (pomiar i wybór)',
+        lambda: start_benchmark.run(),
+        display_order=5
+    )
+    menu.add_option(
+        '6',
+        'Duży plik CSV — suma/min/max zakresami bajtów (bez wczytywania całości)',
+        lambda: pforeach_calc.run_large_file(),
+        display_order=6
+    )
+    menu.add_option(
+        '7',
+        'Zbiór danych: wygeneruj syntetyczne dane (10^6 – 10^9 liczb) lub przywróć domyślne',
+        lambda: dataset.run(),
+        display_order=7
+    )
     menu.add_option(
         '0',
         'Wyjście',
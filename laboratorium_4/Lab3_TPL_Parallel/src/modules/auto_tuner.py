@@ -0,0 +1,155 @@
+"""
+Automatyczny dobór sposobu wykonania (tryb "auto").
+Na małej próbce mierzy koszt uruchomienia puli procesów, koszt przesłania jednego
+zadania (IPC) i koszt obliczenia jednego elementu, a następnie wybiera wykonanie
+sekwencyjne albo równoległe z liczbą procesów i rozmiarem fragmentu o najmniejszym
+szacowanym czasie.
+"""
+
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from src.modules.shared_numbers import SharedNumbers
+
+# Liczba pustych zadań do pomiaru kosztu IPC
+PROBE_TASKS = 20
+# Co najmniej tyle fragmentów na proces (wyrównanie obciążenia)
+CHUNKS_PER_WORKER = 4
+# Docelowy udział kosztu IPC w czasie obliczenia fragmentu
+IPC_SHARE = 0.05
+
+
+def _probe_task(_):
+    """Puste zadanie — mierzy sam koszt przesłania zadania i wyniku."""
+    return None
+
+
+class AutoTuner:
+    """
+    Dobiera liczbę procesów i rozmiar fragmentu na podstawie pomiarów:
+        czas_równoległy(k) = start_puli * k + liczba_fragmentów * koszt_zadania + czas_sekwencyjny / k
+    i porównuje go z czasem sekwencyjnym.
+    """
+
+    def __init__(self, sequential_func, worker_func, backend='pool',
+                 max_workers=None, sample_size=200, mp_context=None):
+        """
+        Args:
+            sequential_func: Funkcja sekwencyjna (liczby) -> wynik, używana też do pomiaru próbki.
+            worker_func: Funkcja robocza (deskryptor pamięci współdzielonej) -> wynik częściowy.
+            backend (str): 'pool' (multiprocessing.Pool) lub 'executor' (ProcessPoolExecutor).
+            max_workers (int): Największa rozważana liczba procesów (domyślnie liczba rdzeni).
+            sample_size (int): Liczba elementów próbki do pomiaru kosztu elementu.
+            mp_context: Kontekst multiprocessing (metoda startu); domyślnie kontekst platformy.
+        """
+        if backend not in ('pool', 'executor'):
+            raise ValueError(f"Nieznany backend: {backend}")
+        self.sequential_func = sequential_func
+        self.worker_func = worker_func
+        self.backend = backend
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.sample_size = sample_size
+        self.mp_context = mp_context or multiprocessing.get_context()
+        self.plan = None
+
+    def _create_pool(self, workers):
+        """Tworzy pulę procesów wybranego typu."""
+        if self.backend == 'pool':
+            return self.mp_context.Pool(processes=workers)
+        return ProcessPoolExecutor(max_workers=workers, mp_context=self.mp_context)
+
+    def _map(self, pool, func, tasks):
+        """Rozsyła zadania do puli (Pool: w kolejności ukończenia)."""
+        if self.backend == 'pool':
+            return pool.imap_unordered(func, tasks)
+        return pool.map(func, tasks)
+
+    def measure_element_cost(self, numbers):
+        """Mierzy średni czas obliczenia jednego elementu [ms] na próbce danych."""
+        sample = numbers[:self.sample_size]
+        start = time.perf_counter()
+        self.sequential_func(sample)
+        return (time.perf_counter() - start) * 1000 / max(len(sample), 1)
+
+    def measure_overheads(self):
+        """
+        Mierzy narzuty puli jednoprocesowej.
+
+        Returns:
+            tuple: (koszt uruchomienia i zamknięcia procesu [ms], koszt jednego zadania [ms]).
+        """
+        start = time.perf_counter()
+        with self._create_pool(1) as pool:
+            list(self._map(pool, _probe_task, [None]))
+            tasks_start = time.perf_counter()
+            list(self._map(pool, _probe_task, [None] * PROBE_TASKS))
+            task_ms = (time.perf_counter() - tasks_start) * 1000 / PROBE_TASKS
+        total_ms = (time.perf_counter() - start) * 1000
+        return max(total_ms - PROBE_TASKS * task_ms, 0.0), task_ms
+
+    @staticmethod
+    def _chunk_size(n, workers, element_ms, task_ms):
+        """
+        Rozmiar fragmentu: na tyle duży, by IPC było ~IPC_SHARE pracy fragmentu,
+        ale nie większy niż równy podział między procesy.
+        """
+        by_overhead = int(task_ms / (IPC_SHARE * element_ms)) if element_ms > 0 else n
+        by_balance = -(-n // (workers * CHUNKS_PER_WORKER))
+        return max(1, min(-(-n // workers), max(by_balance, by_overhead)))
+
+    def tune(self, numbers):
+        """
+        Mierzy koszty i wybiera plan wykonania.
+
+        Returns:
+            dict: Plan (liczba procesów, rozmiar fragmentu, pomiary i szacunki czasów).
+        """
+        n = len(numbers)
+        element_ms = self.measure_element_cost(numbers)
+        spawn_ms, task_ms = self.measure_overheads()
+        serial_ms = element_ms * n
+
+        best_workers, best_chunk, best_ms = 1, n, serial_ms
+        for workers in range(2, self.max_workers + 1):
+            chunk = self._chunk_size(n, workers, element_ms, task_ms)
+            tasks = -(-n // chunk)
+            estimate_ms = spawn_ms * workers + tasks * task_ms + serial_ms / workers
+            if estimate_ms < best_ms:
+                best_workers, best_chunk, best_ms = workers, chunk, estimate_ms
+
+        self.plan = {
+            'workery': best_workers,
+            'fragment': best_chunk,
+            'koszt_elementu_ms': element_ms,
+            'start_procesu_ms': spawn_ms,
+            'koszt_zadania_ms': task_ms,
+            'szacunek_sekw_ms': serial_ms,
+            'szacunek_ms': best_ms,
+        }
+        return self.plan
+
+    def execute(self, numbers):
+        """Wykonuje obliczenie według planu (strojenie, jeśli jeszcze go nie ma)."""
+        plan = self.plan or self.tune(numbers)
+        if plan['workery'] == 1:
+            return self.sequential_func(numbers)
+
+        with SharedNumbers(numbers) as shared:
+            with self._create_pool(plan['workery']) as pool:
+                descriptors = shared.descriptors_of_size(plan['fragment'])
+                return sum(self._map(pool, self.worker_func, descriptors))
+
+    def print_plan(self):
+        """Wypisuje pomiary i wybrany plan."""
+        plan = self.plan
+        print(f"  Koszt elementu:         {plan['koszt_elementu_ms'] * 1000:.3f} µs")
+        print(f"  Start procesu:          {plan['start_procesu_ms']:.2f} ms")
+        print(f"  Koszt zadania (IPC):    {plan['koszt_zadania_ms']:.3f} ms")
+        print(f"  Szacunek sekwencyjnie:  {plan['szacunek_sekw_ms']:.2f} ms")
+        if plan['workery'] == 1:
+            print("  Decyzja: sekwencyjnie — narzut procesów przewyższa zysk")
+        else:
+            print(f"  Decyzja: równolegle, {plan['workery']} proc., fragment {plan['fragment']} el."
+                  f" (szacunek {plan['szacunek_ms']:.2f} ms)")
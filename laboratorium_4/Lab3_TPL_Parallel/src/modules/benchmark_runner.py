@@ -11,7 +11,15 @@ import time
 from concurrent.futures import ProcessPoolExecutor
 from multiprocessing import Pool
 
-from src.modules.csv_loader import load_numbers_from_csv
+from src.modules.csv_loader import load_dataset
+from src.modules.csv_ranges import aggregate_range
+from src.modules.partition import as_int64_view, chunk_views
+from src.modules.shared_numbers import SharedNumbers, shared_chunk
+
+try:
+    import numpy as np
+except ImportError:  # NumPy jest opcjonalny - bez niego wątki z jądrem NumPy są pomijane
+    np = None
 
 DATA_DIR = os.path.join(
     os.path.dirname(__file__), '..', '..', '..', 'dane_wejsciowe'
@@ -22,21 +30,20 @@ CSV_FILES = ['numbers1.csv', 'numbers2.csv', 'numbers3.csv', 'numbers4.csv']
 
 # ---- Funkcje robocze (poziom modułu, wymagane przez multiprocessing) ----
 
-def _sum_chunk(chunk):
-    """Sumuje fragment tablicy."""
+def _sum_chunk(descriptor):
+    """Sumuje fragment tablicy z pamięci współdzielonej (nazwa, przesunięcie, długość)."""
     total = 0
-    for num in chunk:
-        total += num
+    with shared_chunk(descriptor) as chunk:
+        for num in chunk:
+            total += num
     return total
 
 
 def _process_csv_file(filepath):
-    """Wczytuje plik CSV i zwraca sumę."""
+    """Oblicza sumę liczb z pliku CSV (czytanego blokami, bez wczytywania całości)."""
     abs_path = os.path.abspath(filepath)
-    with open(abs_path, 'r') as f:
-        content = f.read().strip()
-    numbers = [int(x) for x in content.split(';') if x.strip()]
-    return {'file': os.path.basename(filepath), 'count': len(numbers), 'sum': sum(numbers)}
+    aggregate = aggregate_range((abs_path, 0, os.path.getsize(abs_path)))
+    return {'file': os.path.basename(filepath), 'count': aggregate['count'], 'sum': aggregate['sum']}
 
 
 class BenchmarkRunner:
@@ -44,25 +51,16 @@ class BenchmarkRunner:
     Uruchamia pełny benchmark metod z zadań 1-3 i zapisuje log.
     """
 
+    DATA_FILE = os.path.join(DATA_DIR, 'numbers1.csv')
+
     def __init__(self):
         self.numbers = None
+        self.file_paths = [os.path.join(DATA_DIR, f) for f in CSV_FILES]
 
     def _load_data(self):
-        """Wczytuje numbers1.csv."""
+        """Wczytuje dane do sumowania (domyślnie numbers1.csv, jako widok int64)."""
         if self.numbers is None:
-            path = os.path.join(DATA_DIR, 'numbers1.csv')
-            self.numbers = load_numbers_from_csv(path)
-
-    @staticmethod
-    def _split(numbers, n):
-        """Dzieli tablicę na n fragmentów."""
-        size = len(numbers) // n
-        chunks = []
-        for i in range(n):
-            s = i * size
-            e = s + size if i < n - 1 else len(numbers)
-            chunks.append(numbers[s:e])
-        return chunks
+            self.numbers = as_int64_view(load_dataset(self.DATA_FILE))
 
     # ---- Metody sumowania ----
 
@@ -74,22 +72,24 @@ class BenchmarkRunner:
         return total
 
     @staticmethod
-    def _partial_sum(numbers, start, end, results, idx):
+    def _partial_sum(chunk, results, idx):
         total = 0
-        for i in range(start, end):
-            total += numbers[i]
+        for num in chunk:
+            total += num
         results[idx] = total
 
-    def _thread_sum(self, numbers, num_threads):
-        """Sumowanie z threading.Thread."""
-        n = len(numbers)
-        chunk_size = n // num_threads
+    @staticmethod
+    def _numpy_partial_sum(chunk, results, idx):
+        """Suma fragmentu jądrem NumPy - redukcja w C ze zwolnionym GIL."""
+        results[idx] = int(np.frombuffer(chunk, dtype=np.int64).sum())
+
+    def _thread_sum(self, numbers, num_threads, kernel=None):
+        """Sumowanie z threading.Thread (każdy wątek dostaje widok swojego fragmentu)."""
         threads = []
         results = [0] * num_threads
-        for i in range(num_threads):
-            s = i * chunk_size
-            e = s + chunk_size if i < num_threads - 1 else n
-            t = threading.Thread(target=self._partial_sum, args=(numbers, s, e, results, i))
+        kernel = kernel or self._partial_sum
+        for i, (_, _, chunk) in enumerate(chunk_views(numbers, num_threads)):
+            t = threading.Thread(target=kernel, args=(chunk, results, i))
             threads.append(t)
         for t in threads:
             t.start()
@@ -97,18 +97,16 @@ class BenchmarkRunner:
             t.join()
         return sum(results)
 
-    def _pool_sum(self, numbers, num_procs):
+    def _pool_sum(self, shared, num_procs):
         """Sumowanie z multiprocessing.Pool."""
-        chunks = self._split(numbers, num_procs)
         with Pool(processes=num_procs) as pool:
-            partial = pool.map(_sum_chunk, chunks)
+            partial = pool.map(_sum_chunk, shared.descriptors(num_procs))
         return sum(partial)
 
-    def _executor_sum(self, numbers, num_workers):
+    def _executor_sum(self, shared, num_workers):
         """Sumowanie z ProcessPoolExecutor (Parallel.For)."""
-        chunks = self._split(numbers, num_workers)
         with ProcessPoolExecutor(max_workers=num_workers) as ex:
-            partial = list(ex.map(_sum_chunk, chunks))
+            partial = list(ex.map(_sum_chunk, shared.descriptors(num_workers)))
         return sum(partial)
 
     # ---- Benchmark ----
@@ -117,7 +115,8 @@ class BenchmarkRunner:
         """Uruchamia pełny benchmark i zapisuje log."""
         self._load_data()
         numbers = self.numbers
-        file_paths = [os.path.join(DATA_DIR, f) for f in CSV_FILES]
+        file_paths = self.file_paths
+        data_name = os.path.basename(self.DATA_FILE)
         log_path = os.path.join(LOG_DIR, 'benchmark_log.txt')
 
         print("\n" + "=" * 60)
@@ -134,30 +133,38 @@ class BenchmarkRunner:
             print(f"  {name:<45} suma: {result:>10}, czas: {elapsed:>10.4f} ms")
             return elapsed
 
-        print("\n  --- Sumowanie numbers1.csv (10 000 elementów) ---\n")
+        print(f"\n  --- Sumowanie {data_name} ({len(numbers)} elementów) ---\n")
 
         # Zadanie 1
         bench("Sekwencyjna", lambda: self._seq_sum(numbers))
         bench("threading.Thread (2 wątki)", lambda: self._thread_sum(numbers, 2))
         bench("threading.Thread (4 wątki)", lambda: self._thread_sum(numbers, 4))
         bench("threading.Thread (8 wątków)", lambda: self._thread_sum(numbers, 8))
-        bench("multiprocessing.Pool (2 procesy)", lambda: self._pool_sum(numbers, 2))
-        bench("multiprocessing.Pool (4 procesy)", lambda: self._pool_sum(numbers, 4))
-        bench("multiprocessing.Pool (8 procesów)", lambda: self._pool_sum(numbers, 8))
-
-        # Zadanie 3 — Parallel.For
-        bench("Parallel.For / Executor (4 workery)", lambda: self._executor_sum(numbers, 4))
-        bench("Parallel.For / Executor (8 workerów)", lambda: self._executor_sum(numbers, 8))
+        if np is not None:
+            bench("threading.Thread + NumPy, bez GIL (2 wątki)",
+                  lambda: self._thread_sum(numbers, 2, self._numpy_partial_sum))
+            bench("threading.Thread + NumPy, bez GIL (8 wątków)",
+                  lambda: self._thread_sum(numbers, 8, self._numpy_partial_sum))
+
+        # Procesy czytają dane z pamięci współdzielonej (kopiowanej raz)
+        with SharedNumbers(numbers) as shared:
+            bench("multiprocessing.Pool (2 procesy)", lambda: self._pool_sum(shared, 2))
+            bench("multiprocessing.Pool (4 procesy)", lambda: self._pool_sum(shared, 4))
+            bench("multiprocessing.Pool (8 procesów)", lambda: self._pool_sum(shared, 8))
+
+            # Zadanie 3 — Parallel.For
+            bench("Parallel.For / Executor (4 workery)", lambda: self._executor_sum(shared, 4))
+            bench("Parallel.For / Executor (8 workerów)", lambda: self._executor_sum(shared, 8))
 
         # Zadanie 3 — Parallel.ForEach
-        print(f"\n  --- Parallel.ForEach — przetwarzanie 4 plików CSV ---\n")
+        print(f"\n  --- Parallel.ForEach — przetwarzanie {len(file_paths)} plików ---\n")
 
         start = time.perf_counter()
         seq_file_results = [_process_csv_file(fp) for fp in file_paths]
         seq_files_time = (time.perf_counter() - start) * 1000
 
         start = time.perf_counter()
-        with ProcessPoolExecutor(max_workers=4) as ex:
+        with ProcessPoolExecutor(max_workers=len(file_paths)) as ex:
             par_file_results = list(ex.map(_process_csv_file, file_paths))
         par_files_time = (time.perf_counter() - start) * 1000
 
@@ -165,7 +172,8 @@ class BenchmarkRunner:
         for r in seq_file_results:
             print(f"    {r['file']}: {r['count']} liczb, suma = {r['sum']}")
 
-        print(f"\n  {'Parallel.ForEach (4 pliki równolegle)':<45} czas: {par_files_time:>10.4f} ms")
+        foreach_label = f"Parallel.ForEach ({len(file_paths)} pliki równolegle)"
+        print(f"\n  {foreach_label:<45} czas: {par_files_time:>10.4f} ms")
         for r in par_file_results:
             print(f"    {r['file']}: {r['count']} liczb, suma = {r['sum']}")
 
@@ -175,13 +183,13 @@ class BenchmarkRunner:
             log.write("  BENCHMARK — PODSUMOWANIE METOD Z ZADAŃ 1, 2 I 3\n")
             log.write("=" * 60 + "\n\n")
 
-            log.write("--- Sumowanie numbers1.csv ---\n\n")
+            log.write(f"--- Sumowanie {data_name} ---\n\n")
             log.write(f"  {'Metoda':<45} {'Suma':>10}   {'Czas [ms]':>12}\n")
             log.write(f"  {'-'*45} {'-'*10}   {'-'*12}\n")
             for r in results:
                 log.write(f"  {r['nazwa']:<45} {r['suma']:>10}   {r['czas_ms']:>12.4f}\n")
 
-            log.write(f"\n--- Parallel.ForEach — 4 pliki CSV ---\n\n")
+            log.write(f"\n--- Parallel.ForEach — {len(file_paths)} pliki ---\n\n")
             log.write(f"  Sekwencyjnie: {seq_files_time:.4f} ms\n")
             for r in seq_file_results:
                 log.write(f"    {r['file']}: {r['count']} liczb, suma = {r['sum']}\n")
@@ -0,0 +1,202 @@
+"""
+Przetwarzanie dużych plików CSV zakresami bajtów (bez wczytywania całego pliku).
+Plik dzielony jest na zakresy wyrównane do separatora ';', każdy zakres czytany jest
+blokami przez osobny proces, który parsuje liczby i od razu je agreguje
+(liczność, suma, min, max). Scalane są tylko agregaty.
+Pliki binarne zbiorów (.bin, surowe int64) dzielone są na zakresy co 8 bajtów.
+"""
+
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from src.modules.csv_loader import BINARY_SUFFIX, INT64_MAX, fromstring_int64
+
+try:
+    import numpy as np
+except ImportError:  # NumPy jest opcjonalny - bez niego bloki parsowane są przez int()
+    np = None
+
+SEPARATOR = b';'
+# Rozmiar bloku czytanego naraz przez proces roboczy
+BLOCK_SIZE = 1 << 20
+
+
+def _empty_aggregate():
+    """Agregat pustego zbioru liczb."""
+    return {'count': 0, 'sum': 0, 'min': None, 'max': None}
+
+
+def _parse_block(data):
+    """
+    Zamienia blok bajtów 'a;b;c' (pełne liczby) na tablicę int64.
+    Wolniejsza ścieżka (bez NumPy, puste pola, wartości graniczne) parsuje przez int()
+    do array('q') - liczba spoza zakresu int64 zgłasza OverflowError.
+    """
+    values = fromstring_int64(data)
+    if values is not None:
+        return values
+    return array('q', (int(x) for x in data.split(SEPARATOR) if x.strip()))
+
+
+def _parse_binary_block(data):
+    """Zamienia blok bajtów (pełne liczby int64) na tablicę liczb."""
+    if np is not None:
+        return np.frombuffer(data, dtype=np.int64)
+    values = array('q')
+    values.frombytes(data)
+    return values
+
+
+def _add_values(aggregate, values):
+    """Dolicza liczby z bloku do agregatu."""
+    if len(values) == 0:
+        return
+    if np is not None and isinstance(values, np.ndarray):
+        low, high = int(values.min()), int(values.max())
+        # Suma int64 w NumPy przepełnia się po cichu - dokładna tylko, gdy n * max|x| < 2^63
+        if max(-low, high) * len(values) <= INT64_MAX:
+            block_sum = int(values.sum())
+        else:
+            block_sum = sum(values.tolist())
+    else:
+        block_sum, low, high = sum(values), min(values), max(values)
+    aggregate['count'] += len(values)
+    aggregate['sum'] += block_sum
+    aggregate['min'] = low if aggregate['min'] is None else min(aggregate['min'], low)
+    aggregate['max'] = high if aggregate['max'] is None else max(aggregate['max'], high)
+
+
+def merge_aggregates(aggregates):
+    """
+    Scala agregaty częściowe.
+
+    Args:
+        aggregates: Agregaty {'count', 'sum', 'min', 'max'}.
+
+    Returns:
+        dict: Agregat całości.
+    """
+    result = _empty_aggregate()
+    for part in aggregates:
+        if part['count'] == 0:
+            continue
+        result['count'] += part['count']
+        result['sum'] += part['sum']
+        result['min'] = part['min'] if result['min'] is None else min(result['min'], part['min'])
+        result['max'] = part['max'] if result['max'] is None else max(result['max'], part['max'])
+    return result
+
+
+def _align_to_separator(f, offset, file_size):
+    """Przesuwa pozycję do pierwszego bajtu po najbliższym separatorze (od offset w górę)."""
+    if offset <= 0:
+        return 0
+    f.seek(offset - 1)
+    while True:
+        block = f.read(64 * 1024)
+        if not block:
+            return file_size
+        index = block.find(SEPARATOR)
+        if index >= 0:
+            return f.tell() - len(block) + index + 1
+
+
+def split_byte_ranges(filepath, num_ranges):
+    """
+    Dzieli plik na zakresy bajtów zaczynające się tuż po separatorze (w pliku
+    binarnym - na granicy liczby), więc żadna liczba nie jest rozcięta między dwa zakresy.
+
+    Args:
+        filepath (str): Ścieżka do pliku CSV.
+        num_ranges (int): Docelowa liczba zakresów (puste zakresy są pomijane).
+
+    Returns:
+        list[tuple]: Zakresy (start, end) w bajtach.
+    """
+    file_size = os.path.getsize(filepath)
+    if filepath.endswith(BINARY_SUFFIX):
+        count = file_size // 8
+        bounds = [count * i // num_ranges * 8 for i in range(num_ranges)] + [count * 8]
+        return [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+    with open(filepath, 'rb') as f:
+        bounds = [_align_to_separator(f, file_size * i // num_ranges, file_size)
+                  for i in range(num_ranges)]
+    bounds.append(file_size)
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+
+def aggregate_range(args):
+    """
+    Funkcja robocza — czyta zakres bajtów blokami, parsuje (CSV) lub odczytuje
+    (plik binarny) i agreguje liczby.
+    Musi być na poziomie modułu (wymagane przez ProcessPoolExecutor).
+
+    Args:
+        args (tuple): (ścieżka pliku, początek, koniec) zakresu w bajtach.
+
+    Returns:
+        dict: Agregat {'count', 'sum', 'min', 'max'} zakresu.
+    """
+    filepath, start, end = args
+    aggregate = _empty_aggregate()
+    if filepath.endswith(BINARY_SUFFIX):
+        with open(filepath, 'rb') as f:
+            f.seek(start)
+            remaining = end - start
+            while remaining > 0:
+                # BLOCK_SIZE jest wielokrotnością 8 - bloki zawierają pełne liczby
+                block = f.read(min(BLOCK_SIZE, remaining))
+                if not block:
+                    break
+                remaining -= len(block)
+                _add_values(aggregate, _parse_binary_block(block))
+        return aggregate
+
+    carry = b''
+    with open(filepath, 'rb') as f:
+        f.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            block = f.read(min(BLOCK_SIZE, remaining))
+            if not block:
+                break
+            remaining -= len(block)
+            # Niepełna liczba na końcu bloku przechodzi do następnego
+            complete, _, carry = (carry + block).rpartition(SEPARATOR)
+            if complete.strip():
+                _add_values(aggregate, _parse_block(complete))
+    if carry.strip():
+        _add_values(aggregate, _parse_block(carry))
+    return aggregate
+
+
+def aggregate_csv(filepath, num_workers=4):
+    """
+    Agreguje liczby z pliku CSV (lub binarnego .bin) zakresami bajtów w num_workers procesach.
+    Pamięć każdego procesu ogranicza rozmiar bloku, nie rozmiar pliku.
+
+    Args:
+        filepath (str): Ścieżka do pliku CSV.
+        num_workers (int): Liczba procesów (i zakresów); 1 oznacza wykonanie w tym procesie.
+
+    Returns:
+        dict: Agregat {'file', 'count', 'sum', 'min', 'max', 'mean', 'ranges'}.
+    """
+    abs_path = os.path.abspath(filepath)
+    if not os.path.exists(abs_path):
+        raise FileNotFoundError(f"Nie znaleziono pliku: {abs_path}")
+
+    tasks = [(abs_path, start, end) for start, end in split_byte_ranges(abs_path, num_workers)]
+    if num_workers == 1 or len(tasks) <= 1:
+        partials = [aggregate_range(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=len(tasks)) as executor:
+            partials = list(executor.map(aggregate_range, tasks))
+
+    result = merge_aggregates(partials)
+    result['file'] = os.path.basename(abs_path)
+    result['mean'] = result['sum'] / result['count'] if result['count'] else None
+    result['ranges'] = len(tasks)
+    return result
@@ -3,22 +3,46 @@ Odpowiednik Parallel.For() z TPL (C#).
 W Pythonie realizowany przez concurrent.futures.ProcessPoolExecutor.
 
 Dzieli tablicę na fragmenty i sumuje je równolegle w oddzielnych procesach.
-Porównanie: sekwencyjne vs Parallel.For (4 i 8 workerów).
+Porównanie: sekwencyjne vs Parallel.For (4 i 8 workerów) oraz tryb auto.
 """
 
 import os
+import pickle
 import time
 from concurrent.futures import ProcessPoolExecutor
 
-from src.modules.csv_loader import load_numbers_from_csv
+from src.modules.auto_tuner import AutoTuner
+from src.modules.csv_loader import load_dataset
+from src.modules.partition import as_int64_view
+from src.modules.phase_timer import PhaseTimer
+from src.modules.shared_numbers import SharedNumbers, shared_chunk
+from src.modules.start_methods import get_context
 
 
-def _sum_chunk(chunk):
-    """Funkcja robocza — sumuje fragment tablicy."""
+def _ready(_):
+    """Puste zadanie — proces roboczy importuje ten moduł i potwierdza gotowość."""
+    return None
+
+
+def _sum_chunk_timed(descriptor):
+    """
+    Funkcja robocza — sumuje fragment tablicy z pamięci współdzielonej.
+
+    Returns:
+        tuple: (suma fragmentu, czas samego sumowania w procesie roboczym [ms]).
+    """
     total = 0
-    for num in chunk:
-        total += num
-    return total
+    with shared_chunk(descriptor) as chunk:
+        start = time.perf_counter()
+        for num in chunk:
+            total += num
+        compute_ms = (time.perf_counter() - start) * 1000
+    return total, compute_ms
+
+
+def _sum_chunk(descriptor):
+    """Funkcja robocza — zwraca samą sumę fragmentu."""
+    return _sum_chunk_timed(descriptor)[0]
 
 
 class ParallelForCalculator:
@@ -31,14 +55,20 @@ class ParallelForCalculator:
         os.path.dirname(__file__), '..', '..', '..', 'dane_wejsciowe', 'numbers1.csv'
     )
 
-    def __init__(self):
+    def __init__(self, start_method=None):
+        """
+        Args:
+            start_method (str | None): Metoda startu workerów ('fork', 'spawn', 'forkserver');
+                None oznacza domyślną metodę platformy.
+        """
         self.numbers = None
+        self.start_method = start_method
 
     def _load_data(self):
-        """Wczytuje dane z CSV, jeśli jeszcze nie wczytano."""
+        """Wczytuje dane z CSV (jako widok int64), jeśli jeszcze nie wczytano."""
         if self.numbers is None:
-            self.numbers = load_numbers_from_csv(self.DATA_FILE)
-            print(f"  Wczytano {len(self.numbers)} liczb z pliku CSV.")
+            self.numbers = as_int64_view(load_dataset(self.DATA_FILE))
+            print(f"  Wczytano {len(self.numbers)} liczb z pliku {os.path.basename(self.DATA_FILE)}.")
 
     @staticmethod
     def _sequential_sum(numbers):
@@ -48,24 +78,49 @@ class ParallelForCalculator:
             total += num
         return total
 
-    @staticmethod
-    def _split_into_chunks(numbers, num_chunks):
-        """Dzieli listę na fragmenty."""
-        n = len(numbers)
-        chunk_size = n // num_chunks
-        chunks = []
-        for i in range(num_chunks):
-            start = i * chunk_size
-            end = start + chunk_size if i < num_chunks - 1 else n
-            chunks.append(numbers[start:end])
-        return chunks
-
-    def _parallel_for_sum(self, numbers, num_workers):
-        """Sumowanie z użyciem ProcessPoolExecutor (odpowiednik Parallel.For)."""
-        chunks = self._split_into_chunks(numbers, num_workers)
-        with ProcessPoolExecutor(max_workers=num_workers) as executor:
-            partial_sums = list(executor.map(_sum_chunk, chunks))
-        return sum(partial_sums)
+    def _parallel_for_sum(self, shared, num_workers):
+        """
+        Sumowanie z użyciem ProcessPoolExecutor (odpowiednik Parallel.For),
+        z osobnym pomiarem każdej fazy wykonania.
+
+        Returns:
+            tuple: (suma, PhaseTimer z czasami faz, rozmiar zadań po serializacji [B]).
+        """
+        timer = PhaseTimer()
+        descriptors = shared.descriptors(num_workers)
+
+        # ProcessPoolExecutor uruchamia procesy leniwie (spawn/forkserver - po jednym na zadanie),
+        # więc puste zadanie dla każdego workera uruchamia całą pulę i import modułu przed map
+        with timer.phase('start puli (wszystkie procesy)'):
+            executor = ProcessPoolExecutor(max_workers=num_workers,
+                                           mp_context=get_context(self.start_method))
+            list(executor.map(_ready, range(num_workers)))
+        try:
+            # executor.map serializuje zadania sam, poza zasięgiem pomiaru - osobne pickle.dumps
+            # w procesie głównym to tylko szacunek tego kosztu
+            with timer.phase('serializacja zadań (pickle, szacunek)'):
+                payload_bytes = len(pickle.dumps(descriptors))
+            pickle_ms = timer.phases['serializacja zadań (pickle, szacunek)']
+
+            start = time.perf_counter()
+            results = list(executor.map(_sum_chunk_timed, descriptors))
+            map_ms = (time.perf_counter() - start) * 1000
+
+            # Workery liczą równolegle - o czasie decyduje najdłuższy fragment
+            compute_ms = max(elapsed for _, elapsed in results)
+            timer.add('obliczenia w workerach (najdłuższy)', compute_ms)
+            # Przesłanie nie jest mierzone bezpośrednio - to reszta czasu map
+            # po odjęciu szacunku serializacji i najdłuższych obliczeń
+            timer.add('przesłanie zadań i wyników (reszta)', max(map_ms - pickle_ms - compute_ms, 0.0))
+
+            with timer.phase('redukcja wyników'):
+                total = sum(partial for partial, _ in results)
+
+            with timer.phase('zamknięcie puli'):
+                executor.shutdown(wait=True)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        return total, timer, payload_bytes
 
     def run(self):
         """Uruchamia porównanie: sekwencyjne vs Parallel.For (4 i 8 workerów)."""
@@ -81,22 +136,56 @@ class ParallelForCalculator:
         seq_sum = self._sequential_sum(numbers)
         seq_time = (time.perf_counter() - start) * 1000
 
-        # 4 workery
-        start = time.perf_counter()
-        p4_sum = self._parallel_for_sum(numbers, 4)
-        p4_time = (time.perf_counter() - start) * 1000
+        # Dane trafiają raz do pamięci współdzielonej, workery dostają tylko deskryptory
+        with SharedNumbers(numbers) as shared:
+            # 4 workery
+            start = time.perf_counter()
+            p4_sum, p4_phases, p4_bytes = self._parallel_for_sum(shared, 4)
+            p4_time = (time.perf_counter() - start) * 1000
 
-        # 8 workerów
-        start = time.perf_counter()
-        p8_sum = self._parallel_for_sum(numbers, 8)
-        p8_time = (time.perf_counter() - start) * 1000
+            # 8 workerów
+            start = time.perf_counter()
+            p8_sum, p8_phases, p8_bytes = self._parallel_for_sum(shared, 8)
+            p8_time = (time.perf_counter() - start) * 1000
 
         print(f"  Metoda sekwencyjna              – suma: {seq_sum}, czas wykonania: {seq_time:.4f} ms")
         print(f"  Parallel.For (4 workery)        – suma: {p4_sum}, czas wykonania: {p4_time:.4f} ms")
         print(f"  Parallel.For (8 workerów)       – suma: {p8_sum}, czas wykonania: {p8_time:.4f} ms")
 
+        print()
+        p4_phases.print_report(f"Fazy (4 workery, zadania: {p4_bytes} B)")
+        p8_phases.print_report(f"Fazy (8 workerów, zadania: {p8_bytes} B)")
+
         return {
             'sekwencyjna': {'suma': seq_sum, 'czas_ms': seq_time},
-            'parallel_for_4': {'suma': p4_sum, 'czas_ms': p4_time},
-            'parallel_for_8': {'suma': p8_sum, 'czas_ms': p8_time},
+            'parallel_for_4': {'suma': p4_sum, 'czas_ms': p4_time, 'fazy_ms': p4_phases.phases},
+            'parallel_for_8': {'suma': p8_sum, 'czas_ms': p8_time, 'fazy_ms': p8_phases.phases},
+        }
+
+    def run_auto(self):
+        """Tryb auto: pomiar narzutów i wybór sekwencyjnie/Parallel.For, liczby workerów i fragmentu."""
+        self._load_data()
+        numbers = self.numbers
+
+        print("\n" + "-" * 60)
+        print("  Parallel.For (auto) — dobór sposobu wykonania na podstawie pomiarów")
+        print("-" * 60)
+
+        tuner = AutoTuner(self._sequential_sum, _sum_chunk, backend='executor',
+                          mp_context=get_context(self.start_method))
+        start = time.perf_counter()
+        plan = tuner.tune(numbers)
+        tune_time = (time.perf_counter() - start) * 1000
+        tuner.print_plan()
+
+        start = time.perf_counter()
+        auto_sum = tuner.execute(numbers)
+        auto_time = (time.perf_counter() - start) * 1000
+
+        print(f"\n  Parallel.For (auto)             – suma: {auto_sum}, czas wykonania: {auto_time:.4f} ms")
+        print(f"  Strojenie (pomiary, raz):       {tune_time:.4f} ms")
+
+        return {
+            'auto': {'suma': auto_sum, 'czas_ms': auto_time, 'workery': plan['workery'],
+                     'fragment': plan['fragment'], 'strojenie_ms': tune_time},
         }
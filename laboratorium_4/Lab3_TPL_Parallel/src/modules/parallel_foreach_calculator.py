@@ -4,13 +4,14 @@ W Pythonie realizowany przez concurrent.futures.ProcessPoolExecutor.
 
 Przetwarza wiele plików CSV równolegle — każdy plik w oddzielnym procesie.
 Pliki: numbers1.csv, numbers2.csv, numbers3.csv, numbers4.csv.
+Duży plik można też przetworzyć zakresami bajtów — każdy proces agreguje swój zakres.
 """
 
 import os
 import time
 from concurrent.futures import ProcessPoolExecutor
 
-from src.modules.csv_loader import load_numbers_from_csv
+from src.modules.csv_ranges import aggregate_csv, aggregate_range
 
 DATA_DIR = os.path.join(
     os.path.dirname(__file__), '..', '..', '..', 'dane_wejsciowe'
@@ -26,29 +27,28 @@ CSV_FILES = [
 
 def _process_single_file(filepath):
     """
-    Funkcja robocza — wczytuje plik CSV i oblicza sumę.
+    Funkcja robocza — oblicza sumę liczb z pliku CSV.
+    Plik czytany jest blokami (aggregate_range), więc nie trafia w całości do pamięci.
     Musi być na poziomie modułu (wymagane przez ProcessPoolExecutor).
     """
     abs_path = os.path.abspath(filepath)
-    with open(abs_path, 'r') as f:
-        content = f.read().strip()
-    numbers = [int(x) for x in content.split(';') if x.strip()]
-    total = 0
-    for num in numbers:
-        total += num
+    aggregate = aggregate_range((abs_path, 0, os.path.getsize(abs_path)))
     return {
         'file': os.path.basename(filepath),
-        'count': len(numbers),
-        'sum': total,
+        'count': aggregate['count'],
+        'sum': aggregate['sum'],
     }
 
 
 class ParallelForEachCalculator:
     """
     Przetwarzanie wielu plików CSV z użyciem Parallel.ForEach (ProcessPoolExecutor).
-    Porównanie: sekwencyjne vs równoległe przetwarzanie 4 plików.
+    Porównanie: sekwencyjne vs równoległe przetwarzanie 4 plików
+    oraz przetwarzanie jednego dużego pliku zakresami bajtów.
     """
 
+    RANGE_WORKERS = 4
+
     def __init__(self):
         self.file_paths = [os.path.join(DATA_DIR, f) for f in CSV_FILES]
 
@@ -66,10 +66,10 @@ class ParallelForEachCalculator:
         return results
 
     def run(self):
-        """Uruchamia porównanie: sekwencyjne vs Parallel.ForEach na 4 plikach CSV."""
+        """Uruchamia porównanie: sekwencyjne vs Parallel.ForEach na plikach zbioru (domyślnie 4 CSV)."""
         print("\n" + "-" * 60)
         print("  Parallel.ForEach (ProcessPoolExecutor) — przetwarzanie plików")
-        print(f"  Pliki: {', '.join(CSV_FILES)}")
+        print(f"  Pliki: {', '.join(os.path.basename(fp) for fp in self.file_paths)}")
         print("-" * 60)
 
         # Sekwencyjnie
@@ -102,3 +102,44 @@ class ParallelForEachCalculator:
             'sekwencyjna': {'wyniki': seq_results, 'czas_ms': seq_time},
             'parallel_foreach': {'wyniki': par_results, 'czas_ms': par_time},
         }
+
+    def run_large_file(self, filepath=None):
+        """
+        Agreguje jeden (duży) plik CSV zakresami bajtów: 1 proces vs RANGE_WORKERS procesów.
+        Żaden proces nie wczytuje całego pliku — pamięć ogranicza rozmiar bloku.
+        """
+        if filepath is None:
+            answer = input(f"  Ścieżka do pliku CSV (Enter = {os.path.basename(self.file_paths[0])}): ").strip()
+            filepath = answer or self.file_paths[0]
+        if not os.path.exists(filepath):
+            print(f"  Błąd: nie znaleziono pliku: {os.path.abspath(filepath)}")
+            return None
+
+        size_mb = os.path.getsize(filepath) / (1024 * 1024)
+        print("\n" + "-" * 60)
+        print("  Duży plik CSV — agregacja zakresami bajtów")
+        print(f"  Plik: {os.path.basename(filepath)} ({size_mb:.2f} MB)")
+        print("-" * 60)
+
+        start = time.perf_counter()
+        seq = aggregate_csv(filepath, num_workers=1)
+        seq_time = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        par = aggregate_csv(filepath, num_workers=self.RANGE_WORKERS)
+        par_time = (time.perf_counter() - start) * 1000
+
+        print(f"  Jeden proces                    – suma: {seq['sum']}, czas wykonania: {seq_time:.4f} ms")
+        print(f"  Zakresy bajtów ({par['ranges']} proc.)        – suma: {par['sum']}, czas wykonania: {par_time:.4f} ms")
+        print(f"\n  Liczność: {par['count']}, min: {par['min']}, max: {par['max']}, "
+              f"średnia: {par['mean'] if par['mean'] is None else round(par['mean'], 4)}")
+        consistent = all(seq[key] == par[key] for key in ('count', 'sum', 'min', 'max'))
+        print(f"  Zgodność: {'TAK' if consistent else 'NIE'}")
+
+        print("\n  [INFO] Zakresy zaczynają się tuż po separatorze ';' — żadna liczba nie jest")
+        print("         rozcięta. Procesy zwracają tylko agregaty (liczność, suma, min, max).")
+
+        return {
+            'jeden_proces': {'wynik': seq, 'czas_ms': seq_time},
+            'zakresy': {'wynik': par, 'czas_ms': par_time},
+        }
@@ -0,0 +1,40 @@
+"""
+Pomiar czasu poszczególnych faz wykonania wieloprocesowego.
+Zamiast jednej różnicy perf_counter dla całej konfiguracji zapisuje osobno
+start puli, serializację zadań, obliczenia, komunikację, redukcję i zamknięcie puli.
+"""
+
+import time
+from contextlib import contextmanager
+
+
+class PhaseTimer:
+    """Zbiera czasy faz [ms] w kolejności ich wystąpienia."""
+
+    def __init__(self):
+        self.phases = {}
+
+    @contextmanager
+    def phase(self, name):
+        """Mierzy czas bloku kodu i dolicza go do fazy o podanej nazwie."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, (time.perf_counter() - start) * 1000)
+
+    def add(self, name, elapsed_ms):
+        """Dolicza zmierzony gdzie indziej czas (np. w procesie roboczym) do fazy."""
+        self.phases[name] = self.phases.get(name, 0.0) + elapsed_ms
+
+    def total(self):
+        """Suma czasów wszystkich faz [ms]."""
+        return sum(self.phases.values())
+
+    def print_report(self, title):
+        """Wypisuje czasy faz wraz z udziałem w całości."""
+        total = self.total()
+        print(f"  {title}:")
+        for name, elapsed_ms in self.phases.items():
+            share = elapsed_ms / total * 100 if total > 0 else 0.0
+            print(f"    {name:<38} {elapsed_ms:>10.4f} ms ({share:5.1f}%)")
@@ -0,0 +1,98 @@
+"""
+Moduł pamięci współdzielonej dla tablicy liczb.
+Dane kopiowane są raz do multiprocessing.shared_memory, a procesy robocze dostają
+tylko deskryptory (nazwa, przesunięcie, długość) zamiast serializowanych list liczb.
+"""
+
+from array import array
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+
+from src.modules.partition import as_int64_view, chunk_ranges, chunk_ranges_of_size
+
+ITEM_SIZE = array('q').itemsize
+
+
+@contextmanager
+def shared_chunk(descriptor):
+    """
+    Udostępnia fragment tablicy opisany deskryptorem jako memoryview liczb int64.
+
+    Args:
+        descriptor (tuple): (nazwa bloku, przesunięcie, długość) - w elementach.
+
+    Yields:
+        memoryview: Widok fragmentu (bez kopiowania danych).
+    """
+    name, offset, length = descriptor
+    # Procesy puli dziedziczą resource_tracker procesu głównego - dołączenie nie usuwa bloku
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        chunk = shm.buf[offset * ITEM_SIZE:(offset + length) * ITEM_SIZE].cast('q')
+        try:
+            yield chunk
+        finally:
+            chunk.release()
+    finally:
+        shm.close()
+
+
+class SharedNumbers:
+    """
+    Tablica liczb int64 umieszczona w multiprocessing.shared_memory.
+    Używana jako menedżer kontekstu - po wyjściu blok jest zamykany i usuwany.
+    """
+
+    def __init__(self, numbers):
+        """
+        Kopiuje liczby do nowego bloku pamięci współdzielonej.
+
+        Args:
+            numbers: Lista liczb, array('q'), tablica NumPy int64 lub memoryview.
+        """
+        data = as_int64_view(numbers)
+        self.length = len(data)
+        # Blok o rozmiarze 0 jest niedozwolony
+        self.shm = shared_memory.SharedMemory(create=True, size=max(self.length, 1) * ITEM_SIZE)
+        self.shm.buf[:self.length * ITEM_SIZE] = data.cast('B')
+        self.name = self.shm.name
+
+    def descriptors(self, num_chunks):
+        """
+        Dzieli tablicę na w przybliżeniu równe fragmenty (ostatni zabiera resztę).
+
+        Args:
+            num_chunks (int): Liczba fragmentów.
+
+        Returns:
+            list[tuple]: Deskryptory (nazwa, przesunięcie, długość).
+        """
+        return [(self.name, start, end - start)
+                for start, end in chunk_ranges(self.length, num_chunks)]
+
+    def descriptors_of_size(self, chunk_size):
+        """
+        Dzieli tablicę na fragmenty po chunk_size elementów (do dynamicznego przydziału).
+
+        Args:
+            chunk_size (int): Rozmiar fragmentu.
+
+        Returns:
+            list[tuple]: Deskryptory (nazwa, przesunięcie, długość).
+        """
+        return [(self.name, start, end - start)
+                for start, end in chunk_ranges_of_size(self.length, chunk_size)]
+
+    def close(self):
+        """Zamyka i usuwa blok pamięci współdzielonej."""
+        if self.shm is not None:
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
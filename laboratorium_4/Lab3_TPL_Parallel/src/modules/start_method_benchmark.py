@@ -0,0 +1,91 @@
+"""
+Porównanie metod startu procesów (fork, spawn, forkserver) dla Parallel.For.
+Dla każdej metody mierzy narzut samej puli oraz czas sumowania przez
+ProcessPoolExecutor (8 workerów), a następnie wybiera najtańszą bezpieczną metodę.
+"""
+
+import time
+
+from src.modules.shared_numbers import SharedNumbers
+from src.modules.start_methods import available_start_methods, is_fork_safe, measure_startup
+
+NUM_WORKERS = 8
+
+
+class StartMethodBenchmark:
+    """
+    Uruchamia Parallel.For pod każdą dostępną metodą startu.
+    Po pomiarze ustawia kalkulatorowi najtańszą bezpieczną metodę.
+    """
+
+    def __init__(self, pfor_calc):
+        """
+        Args:
+            pfor_calc (ParallelForCalculator): Kalkulator Parallel.For.
+        """
+        self.pfor_calc = pfor_calc
+
+    def _measure(self, method, shared):
+        """Wykonuje pomiary dla jednej metody startu."""
+        self.pfor_calc.start_method = method
+
+        startup_ms, close_ms = measure_startup(method, NUM_WORKERS)
+
+        start = time.perf_counter()
+        total, phases, _ = self.pfor_calc._parallel_for_sum(shared, NUM_WORKERS)
+        sum_ms = (time.perf_counter() - start) * 1000
+
+        return {
+            'start_puli_ms': startup_ms,
+            'zamknięcie_ms': close_ms,
+            'suma': total,
+            'suma_ms': sum_ms,
+            'fazy_ms': phases.phases,
+        }
+
+    def run(self):
+        """Porównuje metody startu i zwraca wybraną (najtańszą bezpieczną) metodę."""
+        self.pfor_calc._load_data()
+        numbers = self.pfor_calc.numbers
+        previous = self.pfor_calc.start_method
+
+        print("\n" + "-" * 60)
+        print(f"  Metody startu procesów — fork / spawn / forkserver ({NUM_WORKERS} workerów)")
+        print("-" * 60)
+        print("  Forkserver ładuje wstępnie moduły src.modules.* (i NumPy); dane leżą")
+        print("  w pamięci współdzielonej, więc procesy nie parsują ponownie CSV.")
+
+        # Fork przy działających innych wątkach grozi zakleszczeniem - nie jest nawet mierzony
+        fork_safe = is_fork_safe()
+        methods = [m for m in available_start_methods() if m != 'fork' or fork_safe]
+        if not fork_safe:
+            print("  [UWAGA] fork pominięty — w procesie działają inne wątki (ryzyko zakleszczenia).")
+
+        results = {}
+        with SharedNumbers(numbers) as shared:
+            for method in methods:
+                results[method] = self._measure(method, shared)
+        if not results:
+            self.pfor_calc.start_method = previous
+            return previous
+
+        print()
+        print(f"  {'Metoda':<11} {'start puli':>12} {'zamknięcie':>12} {'Parallel.For':>13}")
+        for method, r in results.items():
+            print(f"  {method:<11} {r['start_puli_ms']:>9.2f} ms {r['zamknięcie_ms']:>9.2f} ms"
+                  f" {r['suma_ms']:>10.2f} ms")
+
+        fastest_start = min(results, key=lambda m: results[m]['start_puli_ms'])
+        for method, r in results.items():
+            if method != fastest_start:
+                print(f"  Start puli {method} vs {fastest_start}: "
+                      f"+{r['start_puli_ms'] - results[fastest_start]['start_puli_ms']:.2f} ms")
+
+        best = min(results, key=lambda m: results[m]['start_puli_ms'] + results[m]['zamknięcie_ms']
+                   + results[m]['suma_ms'])
+        self.pfor_calc.start_method = best
+
+        print(f"\n  Wybrana metoda startu: {best} (najmniejszy narzut puli"
+              f"{'' if fork_safe else ', fork pominięty — w procesie działają inne wątki'})")
+        print(f"  [INFO] Kolejne uruchomienia Parallel.For w tym menu używają metody '{best}'.")
+        return best
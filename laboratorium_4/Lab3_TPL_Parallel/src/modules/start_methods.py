@@ -0,0 +1,82 @@
+"""
+Metody uruchamiania procesów roboczych: fork, spawn i forkserver.
+Kontekst multiprocessing wybranej metody podawany jest pulom procesów
+(Pool, ProcessPoolExecutor) zamiast domyślnej metody platformy.
+"""
+
+import multiprocessing
+import sys
+import threading
+import time
+
+START_METHODS = ('fork', 'spawn', 'forkserver')
+
+
+def _ready(_):
+    """Puste zadanie - potwierdza, że proces roboczy działa."""
+    return None
+
+
+def available_start_methods():
+    """Zwraca metody startu dostępne na tej platformie (w kolejności START_METHODS)."""
+    supported = multiprocessing.get_all_start_methods()
+    return [method for method in START_METHODS if method in supported]
+
+
+def forkserver_preload():
+    """
+    Moduły importowane raz w procesie forkserver: wczytane już moduły src.modules.*
+    i NumPy - procesy robocze dostają je gotowe zamiast importować od nowa.
+    """
+    modules = sorted(name for name in sys.modules if name.startswith('src.modules.'))
+    if 'numpy' in sys.modules:
+        modules.append('numpy')
+    return modules
+
+
+def get_context(start_method=None):
+    """
+    Zwraca kontekst multiprocessing dla podanej metody startu.
+
+    Args:
+        start_method (str | None): 'fork', 'spawn', 'forkserver' lub None (domyślna platformy).
+
+    Returns:
+        multiprocessing.context.BaseContext: Kontekst do tworzenia pul i procesów.
+    """
+    context = multiprocessing.get_context(start_method)
+    if context.get_start_method() == 'forkserver':
+        # Działa tylko przed pierwszym uruchomieniem serwera - potem lista jest ignorowana
+        context.set_forkserver_preload(forkserver_preload())
+    return context
+
+
+def is_fork_safe():
+    """
+    Czy fork jest bezpieczny: proces z wieloma wątkami może skopiować zablokowane
+    muteksy (np. w loggingu lub bibliotekach C) i zakleszczyć proces potomny.
+    """
+    return threading.active_count() == 1
+
+
+def measure_startup(start_method, num_processes):
+    """
+    Mierzy narzut puli dla metody startu.
+
+    Returns:
+        tuple: (start puli aż do odpowiedzi każdego procesu [ms], zamknięcie puli [ms]).
+    """
+    context = get_context(start_method)
+    start = time.perf_counter()
+    pool = context.Pool(processes=num_processes)
+    try:
+        pool.map(_ready, range(num_processes), chunksize=1)
+        startup_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        pool.close()
+        pool.join()
+        close_ms = (time.perf_counter() - start) * 1000
+    finally:
+        pool.terminate()
+    return startup_ms, close_ms
@@ -0,0 +1,94 @@
+import os
+import shutil
+
+import pytest
+from src.modules import csv_loader
+from src.modules.csv_loader import CACHE_SUFFIX, load_numbers_array, load_numbers_cached
+
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'dane_wejsciowe')
+
+
+class TestCsvLoader:
+
+    @pytest.fixture
+    def csv_copy(self, tmp_path):
+        # Kopia pliku - plik podręczny .i64 powstaje w katalogu tymczasowym
+        path = tmp_path / 'numbers1.csv'
+        shutil.copy(os.path.join(DATA_DIR, 'numbers1.csv'), path)
+        return str(path)
+
+    @pytest.mark.parametrize('name', ['numbers1.csv', 'numbers2.csv', 'numbers3.csv', 'numbers4.csv'])
+    def test_matches_split_and_int(self, name):
+        path = os.path.join(DATA_DIR, name)
+        with open(path, encoding='utf-8') as f:
+            expected = [int(x) for x in f.read().split(';') if x.strip()]
+
+        assert list(load_numbers_array(path)) == expected
+
+    def test_cache_created_and_reused(self, csv_copy, monkeypatch):
+        expected = list(load_numbers_array(csv_copy))
+
+        assert list(load_numbers_cached(csv_copy)) == expected
+        assert os.path.exists(csv_copy + CACHE_SUFFIX)
+
+        # Aktualny plik podręczny - CSV nie jest ponownie parsowany
+        monkeypatch.setattr(csv_loader, 'load_numbers_array', None)
+        assert list(load_numbers_cached(csv_copy)) == expected
+        assert list(load_numbers_cached(csv_copy, mmap_mode=False)) == expected
+
+    def test_cache_invalidated_by_changed_csv(self, csv_copy):
+        load_numbers_cached(csv_copy)
+        stat = os.stat(csv_copy)
+
+        # Ta sama data modyfikacji - unieważnia sam rozmiar
+        with open(csv_copy, 'w', encoding='utf-8') as f:
+            f.write('1;2;3')
+        os.utime(csv_copy, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert list(load_numbers_cached(csv_copy)) == [1, 2, 3]
+
+        # Ten sam rozmiar - unieważnia data modyfikacji
+        with open(csv_copy, 'w', encoding='utf-8') as f:
+            f.write('7;8;9')
+        os.utime(csv_copy, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        assert list(load_numbers_cached(csv_copy)) == [7, 8, 9]
+
+    def test_truncated_cache_is_rebuilt(self, csv_copy):
+        expected = list(load_numbers_cached(csv_copy))
+        cache_path = csv_copy + CACHE_SUFFIX
+        with open(cache_path, 'r+b') as f:
+            f.truncate(os.path.getsize(cache_path) - 8)
+
+        assert list(load_numbers_cached(csv_copy)) == expected
+
+    @pytest.mark.parametrize('content, expected', [
+        ('', []),
+        ('5', [5]),
+        ('1;2;3;', [1, 2, 3]),
+        ('1;;2', [1, 2]),
+        ('  10;-20;30\n', [10, -20, 30]),
+    ])
+    def test_edge_cases(self, tmp_path, content, expected):
+        path = tmp_path / 'dane.csv'
+        path.write_text(content, encoding='utf-8')
+
+        assert list(load_numbers_cached(str(path))) == expected
+
+    def test_int64_bounds(self, tmp_path):
+        path = tmp_path / 'dane.csv'
+        path.write_text(f'{2 ** 63 - 1};-1;{-2 ** 63}', encoding='utf-8')
+
+        assert list(load_numbers_array(str(path))) == [2 ** 63 - 1, -1, -2 ** 63]
+
+    @pytest.mark.parametrize('content', [f'1;{2 ** 63};2', f'1;{-2 ** 63 - 1};2', f'{10 ** 30}'])
+    def test_out_of_int64_range(self, tmp_path, content):
+        # numpy.fromstring nasyca takie liczby - wynik musi być błędem, nie wartością graniczną
+        path = tmp_path / 'dane.csv'
+        path.write_text(content, encoding='utf-8')
+
+        with pytest.raises(OverflowError):
+            load_numbers_array(str(path))
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            load_numbers_cached(str(tmp_path / 'brak.csv'))
@@ -0,0 +1,118 @@
+import os
+from array import array
+
+import pytest
+from src.modules import csv_loader, csv_ranges
+from src.modules.csv_ranges import aggregate_csv, aggregate_range, merge_aggregates, split_byte_ranges
+
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'dane_wejsciowe')
+
+
+class TestCsvRanges:
+
+    @pytest.mark.parametrize('name', ['numbers1.csv', 'numbers2.csv', 'numbers3.csv', 'numbers4.csv'])
+    @pytest.mark.parametrize('num_workers', [1, 4])
+    def test_shipped_files(self, name, num_workers):
+        path = os.path.join(DATA_DIR, name)
+        with open(path, encoding='utf-8') as f:
+            numbers = [int(x) for x in f.read().split(';') if x.strip()]
+
+        result = aggregate_csv(path, num_workers)
+        assert (result['count'], result['sum']) == (len(numbers), sum(numbers))
+        assert (result['min'], result['max']) == (min(numbers), max(numbers))
+        assert result['mean'] == sum(numbers) / len(numbers)
+
+    @pytest.mark.parametrize('num_ranges', [1, 2, 3, 7, 50])
+    def test_ranges_aligned_to_separator(self, num_ranges):
+        path = os.path.join(DATA_DIR, 'numbers2.csv')
+        with open(path, 'rb') as f:
+            data = f.read()
+        ranges = split_byte_ranges(path, num_ranges)
+
+        # Zakresy są ciągłe, pokrywają cały plik i zaczynają się tuż po ';'
+        assert ranges[0][0] == 0
+        assert ranges[-1][1] == len(data)
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            assert end == start
+            assert data[start - 1:start] == b';'
+
+    @pytest.mark.parametrize('block_size', [1, 2, 3, 5, 64])
+    @pytest.mark.parametrize('num_ranges', [1, 3])
+    def test_block_smaller_than_number(self, tmp_path, monkeypatch, block_size, num_ranges):
+        # Liczby rozcięte granicą bloku muszą zostać sklejone (przeniesienie reszty)
+        monkeypatch.setattr(csv_ranges, 'BLOCK_SIZE', block_size)
+        path = tmp_path / 'dane.csv'
+        path.write_text('123456;-7;0;98765432;42;1000000001;-250', encoding='utf-8')
+
+        merged = merge_aggregates(aggregate_range((str(path), start, end))
+                                  for start, end in split_byte_ranges(str(path), num_ranges))
+        assert merged == {'count': 7, 'sum': 1098888674, 'min': -250, 'max': 1000000001}
+
+    @pytest.mark.parametrize('content, expected', [
+        ('', {'count': 0, 'sum': 0, 'min': None, 'max': None}),
+        ('17', {'count': 1, 'sum': 17, 'min': 17, 'max': 17}),
+        ('1;2;3;', {'count': 3, 'sum': 6, 'min': 1, 'max': 3}),
+        ('1;2;3;\n', {'count': 3, 'sum': 6, 'min': 1, 'max': 3}),
+        (';;5;;6;', {'count': 2, 'sum': 11, 'min': 5, 'max': 6}),
+    ])
+    @pytest.mark.parametrize('num_ranges', [1, 4])
+    def test_edge_cases(self, tmp_path, monkeypatch, content, expected, num_ranges):
+        monkeypatch.setattr(csv_ranges, 'BLOCK_SIZE', 2)
+        path = tmp_path / 'dane.csv'
+        path.write_text(content, encoding='utf-8')
+
+        merged = merge_aggregates(aggregate_range((str(path), start, end))
+                                  for start, end in split_byte_ranges(str(path), num_ranges))
+        assert merged == expected
+
+    def test_empty_file_mean(self, tmp_path):
+        path = tmp_path / 'pusty.csv'
+        path.write_text('', encoding='utf-8')
+
+        result = aggregate_csv(str(path), num_workers=1)
+        assert result['count'] == 0
+        assert result['mean'] is None
+
+    def test_without_numpy(self, monkeypatch):
+        # Ścieżka bez NumPy (int() dla każdego pola) daje ten sam agregat
+        path = os.path.join(DATA_DIR, 'numbers3.csv')
+        expected = aggregate_csv(path, num_workers=1)
+        monkeypatch.setattr(csv_ranges, 'np', None)
+        monkeypatch.setattr(csv_loader, 'np', None)
+        monkeypatch.setattr(csv_ranges, 'BLOCK_SIZE', 4096)
+
+        assert aggregate_csv(path, num_workers=1) == expected
+
+    @pytest.mark.parametrize('num_ranges', [1, 3, 8])
+    def test_binary_file(self, tmp_path, monkeypatch, num_ranges):
+        monkeypatch.setattr(csv_ranges, 'BLOCK_SIZE', 16)
+        numbers = [5, -3, 2 ** 40, 0, 77, -2 ** 35, 11, 9, 1]
+        path = tmp_path / 'dane.bin'
+        path.write_bytes(array('q', numbers).tobytes())
+        ranges = split_byte_ranges(str(path), num_ranges)
+
+        # Zakresy pliku binarnego zaczynają się na granicy liczby (co 8 bajtów)
+        assert all(start % 8 == 0 and end % 8 == 0 for start, end in ranges)
+        merged = merge_aggregates(aggregate_range((str(path), start, end)) for start, end in ranges)
+        assert merged == {'count': 9, 'sum': sum(numbers), 'min': -2 ** 35, 'max': 2 ** 40}
+
+    @pytest.mark.parametrize('content', [f'1;{2 ** 63};2', f'1;{-2 ** 63 - 1};2'])
+    def test_out_of_int64_range(self, tmp_path, content):
+        path = tmp_path / 'dane.csv'
+        path.write_text(content, encoding='utf-8')
+
+        with pytest.raises(OverflowError):
+            aggregate_csv(str(path), num_workers=1)
+
+    def test_binary_sum_beyond_int64(self, tmp_path):
+        # Suma 3 * 2^62 nie mieści się w int64 - agregat ma ją dokładnie
+        numbers = [2 ** 62, 2 ** 62, 2 ** 62, -1]
+        path = tmp_path / 'dane.bin'
+        path.write_bytes(array('q', numbers).tobytes())
+
+        assert aggregate_csv(str(path), num_workers=1)['sum'] == 3 * 2 ** 62 - 1
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            aggregate_csv(str(tmp_path / 'brak.csv'))
@@ -0,0 +1,86 @@
+from pathlib import Path
+
+import pytest
+from src.modules import dataset_generator
+from src.modules.csv_loader import load_dataset
+from src.modules.dataset_generator import (
+    BLOCK_ELEMENTS, DISTRIBUTIONS, file_counts, generate_dataset
+)
+
+
+class TestDatasetGenerator:
+
+    @pytest.mark.parametrize('count, num_files, skew', [
+        (10, 1, 1), (1000, 4, 1), (1000, 4, 8), (7, 5, 3), (10, 5, 1000), (5, 5, 10)
+    ])
+    def test_file_counts(self, count, num_files, skew):
+        counts = file_counts(count, num_files, skew)
+        assert len(counts) == num_files
+        assert sum(counts) == count
+        # Żaden plik nie jest pusty, także przy dużym rozrzucie
+        assert min(counts) >= 1
+        # Rozmiary maleją od pierwszego pliku do ostatniego
+        assert counts == sorted(counts, reverse=True)
+
+    def test_file_counts_skew_ratio(self):
+        counts = file_counts(10 ** 6, 3, 10)
+        assert counts[0] / counts[-1] == pytest.approx(10, rel=1e-3)
+
+    @pytest.mark.parametrize('fmt', ['csv', 'bin'])
+    def test_same_seed_same_files(self, tmp_path, monkeypatch, fmt):
+        monkeypatch.setattr(dataset_generator, 'BLOCK_ELEMENTS', 1000)
+        first = generate_dataset(3500, num_files=2, skew=2, fmt=fmt, seed=7,
+                                 output_dir=str(tmp_path / 'a'), workers=1)
+        second = generate_dataset(3500, num_files=2, skew=2, fmt=fmt, seed=7,
+                                  output_dir=str(tmp_path / 'b'), workers=1)
+        other = generate_dataset(3500, num_files=2, skew=2, fmt=fmt, seed=8,
+                                 output_dir=str(tmp_path / 'c'), workers=1)
+
+        first_bytes = [Path(path).read_bytes() for path in first['pliki']]
+        assert first_bytes == [Path(path).read_bytes() for path in second['pliki']]
+        assert first_bytes != [Path(path).read_bytes() for path in other['pliki']]
+        assert [len(load_dataset(path)) for path in first['pliki']] == first['liczności']
+
+    def test_result_independent_of_worker_count(self, tmp_path):
+        # Kilka bloków (domyślny rozmiar) - każdy ma własne ziarno, więc podział
+        # między procesy nie zmienia danych
+        count = BLOCK_ELEMENTS + 500
+        single = generate_dataset(count, fmt='bin', seed=3, output_dir=str(tmp_path / 'a'), workers=1)
+        parallel = generate_dataset(count, fmt='bin', seed=3, output_dir=str(tmp_path / 'b'), workers=2)
+        assert Path(single['pliki'][0]).read_bytes() == Path(parallel['pliki'][0]).read_bytes()
+
+    def test_csv_matches_bin(self, tmp_path, monkeypatch):
+        # Części CSV łączone są w kolejności bloków, bez zgubionych i podwójnych separatorów
+        monkeypatch.setattr(dataset_generator, 'BLOCK_ELEMENTS', 100)
+        csv = generate_dataset(1050, fmt='csv', seed=1, output_dir=str(tmp_path), workers=1, name='d')
+        binary = generate_dataset(1050, fmt='bin', seed=1, output_dir=str(tmp_path), workers=1, name='d')
+        with open(csv['pliki'][0], encoding='ascii') as f:
+            content = f.read()
+
+        assert not content.startswith(';') and not content.endswith(';') and ';;' not in content
+        assert list(load_dataset(csv['pliki'][0])) == list(load_dataset(binary['pliki'][0]))
+        assert list(tmp_path.glob('*.part*')) == []
+
+    @pytest.mark.parametrize('distribution', DISTRIBUTIONS)
+    def test_values_in_range(self, tmp_path, distribution):
+        result = generate_dataset(5000, distribution=distribution, fmt='bin', low=10, high=20,
+                                  output_dir=str(tmp_path), workers=1)
+        values = list(load_dataset(result['pliki'][0]))
+        assert len(values) == 5000
+        assert min(values) >= 10 and max(values) <= 20
+
+    @pytest.mark.parametrize('kwargs', [
+        {'count': 0},
+        {'count': 10, 'num_files': 0},
+        {'count': 10, 'skew': 0.5},
+        {'count': 10, 'low': 5, 'high': 5},
+        {'count': 10, 'distribution': 'poisson'},
+        {'count': 10, 'fmt': 'json'},
+        {'count': 3, 'num_files': 4},
+        {'count': 10, 'seed': -1},
+    ])
+    def test_invalid_arguments(self, tmp_path, kwargs):
+        with pytest.raises(ValueError):
+            generate_dataset(output_dir=str(tmp_path), **kwargs)
+        # Walidacja przed utworzeniem jakiegokolwiek pliku
+        assert list(tmp_path.iterdir()) == []